@@ -0,0 +1,278 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+SpotOn Çekirdek Mikro Kıyaslamaları
+
+src/core içindeki karşılaştırma temel işlemlerini Dev/tests örnek
+dosyaları ve istenen boyutlarda üretilen sentetik dosyalar üzerinde ölçer.
+- Her ölçüm için işlem/sn, MB/sn ve en yüksek bellek kullanımı raporlanır
+- Sonuçlar JSON olarak kaydedilir
+- Kayıtlı bir temel çizgi (baseline) ile karşılaştırılıp gerilemeler işaretlenir
+
+Kullanım:
+    python Dev/benchmarks/bench_core.py --sizes 0.1,1,8 --output sonuc.json
+    python Dev/benchmarks/bench_core.py --baseline Dev/benchmarks/baseline.json
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import datetime
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+# Proje kök dizini
+PROJECT_ROOT = Path(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+MAIN_DIR = PROJECT_ROOT / "Main"
+TESTS_DIR = PROJECT_ROOT / "Dev" / "tests"
+DEFAULT_BASELINE = Path(os.path.dirname(os.path.abspath(__file__))) / "baseline.json"
+
+sys.path.insert(0, str(MAIN_DIR))
+
+from src.core.comparator import FileComparator, SWFileParser, SolidWorksAnalyzer, GeneralComparator  # noqa: E402
+from src.core.utils import compare_binary_content, calculate_entropy, calculate_file_signature  # noqa: E402
+
+# Örnek dosya çiftleri (klasör, dosya1, dosya2)
+FIXTURE_PAIRS = [
+    ("sldtst", "File1.SLDPRT", "File1_MinorChange.SLDPRT"),
+    ("cadtst", "File1.STEP", "File1_MajorChange.STEP"),
+    ("doctst", "File1.docx", "File1_MinorChange.docx"),
+    ("imgtst", "File1.png", "File2.png"),
+]
+
+# Varsayılan sentetik dosya boyutları (MB)
+DEFAULT_SIZES = "0.1,1,8"
+
+# Gerileme sayılması için işlem/sn düşüş oranı
+DEFAULT_THRESHOLD = 0.10
+
+MB = 1024 * 1024
+
+
+def write_synthetic_pair(folder, size_mb, seed=0):
+    """
+    Belirli boyutta, CAD dosyalarına benzer (düşük ve yüksek entropili
+    bölgeler içeren) bir dosya ve araya bayt eklenmiş bir kopyasını yazar.
+
+    Returns:
+        (dosya1, dosya2) yolları
+    """
+    size = max(int(size_mb * MB), 1)
+    rng = np.random.default_rng(seed)
+    # Yarısı rastgele, yarısı tekrar eden metin benzeri blok
+    noise = rng.integers(0, 256, size // 2, dtype=np.uint8).tobytes()
+    text = (b"FEATURE Sketch1 Extrude1 Fillet2 PLANE(0,0,1) " * (size // 64 + 1))[:size - len(noise)]
+    data = bytearray()
+    block = 4096
+    for offset in range(0, max(len(noise), len(text)), block):
+        data += noise[offset:offset + block] + text[offset:offset + block]
+    data = bytes(data[:size])
+
+    # İkinci dosya: ortasına küçük bir ekleme yapılmış kopya
+    middle = len(data) // 2
+    changed = data[:middle] + b"INSERTED-BYTES" * 8 + data[middle:]
+
+    file1 = os.path.join(folder, f"synthetic_{size_mb}MB_a.bin")
+    file2 = os.path.join(folder, f"synthetic_{size_mb}MB_b.bin")
+    with open(file1, "wb") as f:
+        f.write(data)
+    with open(file2, "wb") as f:
+        f.write(changed)
+    return file1, file2
+
+
+def build_cases(file1, file2):
+    """
+    Bir dosya çifti için ölçülecek (ad, fonksiyon, işlenen bayt) listesi.
+    """
+    comparator = FileComparator()
+    parser = SWFileParser()
+    sw_analyzer = SolidWorksAnalyzer()
+    general = GeneralComparator()
+    size1 = os.path.getsize(file1)
+    size2 = os.path.getsize(file2)
+    pair_bytes = size1 + size2
+
+    # Profil kullanan karşılaştırıcılar için profiller bir kez çıkarılır
+    profile1 = comparator.build_profile(file1)
+    profile2 = comparator.build_profile(file2)
+    sw_profile1 = comparator.build_profile(file1)
+    sw_profile2 = comparator.build_profile(file2)
+    sw_profile1.file_type = sw_profile2.file_type = 'solidworks'
+
+    return [
+        ("compare_binary_content", lambda: compare_binary_content(file1, file2), pair_bytes),
+        ("calculate_entropy", lambda: calculate_entropy(file1), size1),
+        ("calculate_file_signature", lambda: calculate_file_signature(file1), min(size1, 1024)),
+        ("SWFileParser.parse_features", lambda: parser.parse_features(file1), size1),
+        ("SolidWorksAnalyzer.compare", lambda: sw_analyzer.compare(file1, file2), pair_bytes),
+        ("SolidWorksAnalyzer.compare[profiles]", lambda: sw_analyzer.compare(sw_profile1, sw_profile2), pair_bytes),
+        ("GeneralComparator.compare", lambda: general.compare(file1, file2), pair_bytes),
+        ("GeneralComparator.compare[profiles]", lambda: general.compare(profile1, profile2), pair_bytes),
+        ("FileComparator.compare_files", lambda: comparator.compare_files(file1, file2), pair_bytes),
+        ("FileComparator.compare_files[profiles]", lambda: comparator.compare_files(profile1, profile2), pair_bytes),
+    ]
+
+
+def measure(func, repeat, min_time):
+    """
+    Fonksiyonun tek çağrı süresini ölçer.
+
+    Her tekrarda fonksiyon en az min_time saniye boyunca çağrılır; tekrarların
+    en iyisi alınır. En yüksek bellek, ısınma çağrısında tracemalloc ile ölçülür
+    (tracemalloc çağrıyı yavaşlattığı için süre ölçümüne katılmaz).
+
+    Returns:
+        (çağrı başına saniye, toplam çağrı sayısı, en yüksek bellek (bayt))
+    """
+    # Isınma çağrısı (sayfa önbelleği, tembel yüklemeler) bellek ölçümü olarak kullanılır
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    best = None
+    calls = 0
+    for _ in range(repeat):
+        count = 0
+        started = time.perf_counter()
+        while True:
+            func()
+            count += 1
+            elapsed = time.perf_counter() - started
+            if elapsed >= min_time:
+                break
+        calls += count
+        per_call = elapsed / count
+        best = per_call if best is None else min(best, per_call)
+    return best, calls, peak
+
+
+def run_benchmarks(inputs, repeat, min_time, only=None):
+    results = []
+    for label, file1, file2 in inputs:
+        for name, func, nbytes in build_cases(file1, file2):
+            if only and not any(pattern in name for pattern in only):
+                continue
+            per_call, calls, peak = measure(func, repeat, min_time)
+            record = {
+                "name": name,
+                "input": label,
+                "bytes": nbytes,
+                "calls": calls,
+                "seconds_per_op": per_call,
+                "ops_per_sec": 1 / per_call if per_call > 0 else 0,
+                "mb_per_sec": nbytes / per_call / MB if per_call > 0 else 0,
+                "peak_memory_kb": peak / 1024
+            }
+            results.append(record)
+            print(f"{name:42s} {label:28s} {record['ops_per_sec']:12.2f} op/s "
+                  f"{record['mb_per_sec']:10.2f} MB/s {record['peak_memory_kb']:10.1f} KB", flush=True)
+    return results
+
+
+def compare_with_baseline(results, baseline, threshold):
+    """
+    Sonuçları temel çizgiyle karşılaştırır.
+
+    Returns:
+        Gerileyen ölçümlerin listesi
+    """
+    reference = {(r["name"], r["input"]): r for r in baseline.get("results", [])}
+    regressions = []
+    print("\nTemel çizgiyle karşılaştırma:")
+    for record in results:
+        base = reference.get((record["name"], record["input"]))
+        if not base or not base.get("ops_per_sec"):
+            continue
+        ratio = record["ops_per_sec"] / base["ops_per_sec"]
+        record["baseline_ratio"] = ratio
+        marker = ""
+        if ratio < 1 - threshold:
+            marker = "  << GERİLEME"
+            regressions.append(record)
+        print(f"{record['name']:42s} {record['input']:28s} x{ratio:6.2f}{marker}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SpotOn çekirdek mikro kıyaslamaları")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES,
+                        help="Sentetik dosya boyutları (MB, virgülle ayrılmış); boş ise üretilmez")
+    parser.add_argument("--no-fixtures", action="store_true", help="Dev/tests örnek dosyalarını kullanma")
+    parser.add_argument("--repeat", type=int, default=3, help="Tekrar sayısı (en iyisi alınır)")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Tekrar başına en az ölçüm süresi (saniye)")
+    parser.add_argument("--only", default="", help="Yalnızca adında bu parçaları içeren ölçümler (virgülle)")
+    parser.add_argument("--output", default=None, help="Sonuçların yazılacağı JSON dosyası")
+    parser.add_argument("--baseline", default=None, help="Karşılaştırılacak temel çizgi JSON dosyası")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help=f"Sonuçları temel çizgi olarak kaydet ({DEFAULT_BASELINE.name})")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Gerileme eşiği (işlem/sn düşüş oranı, örn. 0.1)")
+    args = parser.parse_args()
+
+    temp_dir = tempfile.mkdtemp(prefix="spoton_bench_")
+    try:
+        inputs = []
+        if not args.no_fixtures:
+            for folder, name1, name2 in FIXTURE_PAIRS:
+                file1 = TESTS_DIR / folder / name1
+                file2 = TESTS_DIR / folder / name2
+                if file1.exists() and file2.exists():
+                    inputs.append((f"{folder}/{name1}", str(file1), str(file2)))
+        for size in [s for s in args.sizes.split(",") if s.strip()]:
+            file1, file2 = write_synthetic_pair(temp_dir, float(size))
+            inputs.append((f"synthetic-{float(size)}MB", file1, file2))
+
+        only = [s.strip() for s in args.only.split(",") if s.strip()]
+        results = run_benchmarks(inputs, args.repeat, args.min_time, only)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    report = {
+        "meta": {
+            "date": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "repeat": args.repeat,
+            "min_time": args.min_time
+        },
+        "results": results
+    }
+
+    regressions = []
+    if args.baseline:
+        try:
+            with open(args.baseline, "r", encoding="utf-8") as f:
+                regressions = compare_with_baseline(results, json.load(f), args.threshold)
+        except Exception as e:
+            print(f"Temel çizgi okunamadı: {e}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"\nSonuçlar kaydedildi: {args.output}")
+    if args.save_baseline:
+        with open(DEFAULT_BASELINE, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"Temel çizgi kaydedildi: {DEFAULT_BASELINE}")
+
+    if regressions:
+        print(f"\n{len(regressions)} ölçümde gerileme var.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
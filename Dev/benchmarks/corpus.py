@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+SpotOn Sentetik Derlem Üreticisi
+
+Dev/tests altındaki sldtst, cadtst, doctst ve imgtst örnek dosyalarından
+100 ile 100.000 arası dosyadan oluşan klasörler üretir.
+- Her "aile" bir örnek dosyanın rastgele bir penceresinden türetilir
+- Aile üyeleri kontrollü değişikliklerdir: bayt ekleme, kırpma,
+  yalnızca başlık değişikliği ve birebir kopya
+- Hangi dosyanın hangi aileden ve hangi değişiklikle üretildiği klasörün
+  yanındaki <klasör>.manifest.json dosyasına yazılır (taramaya karışmaz)
+
+Kullanım:
+    python Dev/benchmarks/corpus.py C:/tmp/corpus_1000 --count 1000
+"""
+
+import os
+import sys
+import json
+import random
+import argparse
+from pathlib import Path
+
+# Proje kök dizini
+PROJECT_ROOT = Path(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+TESTS_DIR = PROJECT_ROOT / "Dev" / "tests"
+
+# Kaynak örnek klasörleri
+FIXTURE_DIRS = ["sldtst", "cadtst", "doctst", "imgtst"]
+
+# Varyant türleri ve seçilme ağırlıkları
+VARIANTS = {
+    "copy": 1,
+    "insert": 3,
+    "truncate": 2,
+    "header": 2,
+}
+
+# Bir ailedeki en fazla varyant sayısı (temel dosya hariç)
+MAX_VARIANTS = 4
+
+# Üretilen temel dosyaların en büyük boyutu (bayt); disk kullanımını sınırlar
+DEFAULT_MAX_SIZE = 256 * 1024
+
+# Yalnızca başlık değişikliğinde dokunulan bölge
+HEADER_SIZE = 1024
+
+
+def load_fixtures(fixture_dirs=FIXTURE_DIRS):
+    """
+    Örnek dosyaları (kaynak, uzantı, içerik) olarak yükler; boş dosyalar ve
+    el ile hazırlanmış HTML raporları atlanır.
+    """
+    fixtures = []
+    for folder in fixture_dirs:
+        path = TESTS_DIR / folder
+        if not path.is_dir():
+            continue
+        for item in sorted(path.iterdir()):
+            if not item.is_file() or item.suffix.lower() == ".html":
+                continue
+            data = item.read_bytes()
+            if data:
+                fixtures.append((f"{folder}/{item.name}", item.suffix, data))
+    return fixtures
+
+
+def make_base(rng, data, max_size):
+    """Örnek dosyanın rastgele bir penceresini ailenin temel dosyası yapar."""
+    length = min(len(data), rng.randint(max(max_size // 4, 1), max_size))
+    start = rng.randint(0, len(data) - length)
+    return data[start:start + length]
+
+
+def apply_variant(rng, data, variant):
+    """Temel dosyaya kontrollü bir değişiklik uygular."""
+    if variant == "copy":
+        return data
+    if variant == "insert":
+        offset = rng.randint(0, len(data))
+        inserted = rng.randbytes(rng.randint(1, 512))
+        return data[:offset] + inserted + data[offset:]
+    if variant == "truncate":
+        keep = max(1, int(len(data) * rng.uniform(0.5, 0.99)))
+        return data[:keep]
+    if variant == "header":
+        changed = bytearray(data)
+        for _ in range(rng.randint(1, 16)):
+            position = rng.randint(0, min(HEADER_SIZE, len(changed)) - 1)
+            changed[position] = rng.getrandbits(8)
+        return bytes(changed)
+    raise ValueError(f"Bilinmeyen varyant: {variant}")
+
+
+def manifest_path(output_dir):
+    return os.path.normpath(output_dir) + ".manifest.json"
+
+
+def generate_corpus(output_dir, count, seed=0, max_size=DEFAULT_MAX_SIZE, fixture_dirs=FIXTURE_DIRS):
+    """
+    output_dir klasörüne count adet dosya üretir.
+
+    Args:
+        output_dir: Hedef klasör (yoksa oluşturulur)
+        count: Üretilecek dosya sayısı
+        seed: Rastgelelik tohumu (aynı tohum aynı derlemi üretir)
+        max_size: Temel dosyaların en büyük boyutu
+        fixture_dirs: Kaynak örnek klasörleri
+
+    Returns:
+        Manifest listesi (her dosya için ad, aile, varyant, kaynak, boyut)
+    """
+    fixtures = load_fixtures(fixture_dirs)
+    if not fixtures:
+        raise FileNotFoundError(f"Örnek dosya bulunamadı: {TESTS_DIR}")
+
+    rng = random.Random(seed)
+    os.makedirs(output_dir, exist_ok=True)
+    variant_names = list(VARIANTS)
+    variant_weights = [VARIANTS[name] for name in variant_names]
+
+    manifest = []
+    family = 0
+    while len(manifest) < count:
+        source, extension, data = fixtures[family % len(fixtures)]
+        base = make_base(rng, data, max_size)
+        members = [("base", base)]
+        for _ in range(rng.randint(0, MAX_VARIANTS)):
+            variant = rng.choices(variant_names, variant_weights)[0]
+            members.append((variant, apply_variant(rng, base, variant)))
+
+        for index, (variant, content) in enumerate(members):
+            if len(manifest) >= count:
+                break
+            name = f"{family:06d}_{index}_{variant}{extension}"
+            with open(os.path.join(output_dir, name), "wb") as f:
+                f.write(content)
+            manifest.append({
+                "file": name,
+                "family": family,
+                "variant": variant,
+                "source": source,
+                "size": len(content)
+            })
+        family += 1
+
+    with open(manifest_path(output_dir), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1)
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SpotOn sentetik derlem üreticisi")
+    parser.add_argument("output", help="Hedef klasör")
+    parser.add_argument("--count", type=int, default=1000, help="Dosya sayısı (100-100000)")
+    parser.add_argument("--seed", type=int, default=0, help="Rastgelelik tohumu")
+    parser.add_argument("--max-size", type=int, default=DEFAULT_MAX_SIZE,
+                        help="Temel dosyaların en büyük boyutu (bayt)")
+    args = parser.parse_args()
+
+    manifest = generate_corpus(args.output, args.count, args.seed, args.max_size)
+    total = sum(item["size"] for item in manifest)
+    print(f"{len(manifest)} dosya üretildi ({total / (1024 * 1024):.1f} MB): {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
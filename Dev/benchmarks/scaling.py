@@ -0,0 +1,177 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+SpotOn Ölçeklenme Kıyaslaması
+
+corpus.py ile artan sayıda dosyadan oluşan sentetik klasörler üretir ve
+her biri üzerinde ComparisonThread boru hattının tamamını arayüz olmadan
+çalıştırır.
+- Duvar saati süresi, çift/sn, okunan bayt ve en yüksek RSS raporlanır
+- Her ölçüm ayrı bir süreçte çalışır; böylece RSS değerleri birbirini etkilemez
+- Sonuçlar JSON olarak kaydedilebilir
+
+Kullanım:
+    python Dev/benchmarks/scaling.py --counts 100,1000,10000 --workers 8 --output scaling.json
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import subprocess
+from pathlib import Path
+
+# Proje kök dizini
+PROJECT_ROOT = Path(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+MAIN_DIR = PROJECT_ROOT / "Main"
+
+sys.path.insert(0, str(MAIN_DIR))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from corpus import generate_corpus, DEFAULT_MAX_SIZE  # noqa: E402
+
+# Varsayılan dosya sayıları
+DEFAULT_COUNTS = "100,300,1000"
+
+MB = 1024 * 1024
+
+
+def peak_rss_kb():
+    """
+    Bu sürecin ve bitmiş alt süreçlerin (işçiler) en yüksek RSS değeri (KB).
+
+    resource modülü olmayan sistemlerde (Windows) None döner.
+    """
+    try:
+        import resource
+    except ImportError:
+        return None, None
+    scale = 1024 if sys.platform == "darwin" else 1  # macOS bayt döndürür
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / scale
+    return own, children
+
+
+def run_once(folder, workers, min_similarity, use_cache):
+    """
+    Klasör üzerinde ComparisonThread.run() çalıştırır ve ölçümleri döndürür.
+
+    Thread başlatılmaz; run() bu süreçte doğrudan çağrılır, sinyaller
+    doğrudan bağlantıyla işlenir.
+    """
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from src.ui.ui import ComparisonThread
+    from src.core.comparator import FileComparator
+    from src.core import fileio
+
+    thread = ComparisonThread(folder, "all", min_similarity, FileComparator(),
+                              use_cache=use_cache, workers=workers)
+    counts = {"results": 0, "batches": 0, "progress": 0}
+    errors = []
+
+    def on_batch(batch):
+        counts["results"] += len(batch)
+        counts["batches"] += 1
+
+    def on_progress(info):
+        counts["progress"] += 1
+
+    thread.results_batch.connect(on_batch)
+    thread.progress.connect(on_progress)
+    thread.error.connect(errors.append)
+
+    fileio.reset_io_stats()
+    started = time.perf_counter()
+    thread.run()
+    wall = time.perf_counter() - started
+
+    bytes_read = fileio.io_stats()["bytes_read"]
+    engine = thread.scanner.engine
+    if engine is not None:
+        bytes_read += engine.worker_io_stats.get("bytes_read", 0)
+    own_rss, worker_rss = peak_rss_kb()
+    pairs = thread.total_comparisons
+    return {
+        "files": len(thread.scanner.list_files(folder)),
+        "pairs": pairs,
+        "results": counts["results"],
+        "ui_batches": counts["batches"],
+        "progress_events": counts["progress"],
+        "wall_seconds": wall,
+        "pairs_per_sec": pairs / wall if wall > 0 else 0,
+        "bytes_read": bytes_read,
+        "mb_per_sec": bytes_read / wall / MB if wall > 0 else 0,
+        "peak_rss_kb": own_rss,
+        "peak_worker_rss_kb": worker_rss,
+        "errors": errors
+    }
+
+
+def run_in_subprocess(folder, workers, min_similarity, use_cache):
+    command = [sys.executable, os.path.abspath(__file__), "--run", folder,
+               "--min-similarity", str(min_similarity)]
+    if workers:
+        command += ["--workers", str(workers)]
+    if use_cache:
+        command.append("--cache")
+    output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+    # Son satır ölçüm sonucudur
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SpotOn ölçeklenme kıyaslaması")
+    parser.add_argument("--counts", default=DEFAULT_COUNTS, help="Dosya sayıları (virgülle ayrılmış)")
+    parser.add_argument("--workers", type=int, default=None, help="İşçi sayısı (varsayılan: işlemci sayısı)")
+    parser.add_argument("--min-similarity", type=float, default=0, help="Minimum benzerlik eşiği")
+    parser.add_argument("--max-size", type=int, default=DEFAULT_MAX_SIZE, help="Temel dosya boyutu üst sınırı (bayt)")
+    parser.add_argument("--seed", type=int, default=0, help="Derlem rastgelelik tohumu")
+    parser.add_argument("--cache", action="store_true", help="Profil önbelleğini kullan")
+    parser.add_argument("--work-dir", default=None,
+                        help="Derlemlerin üretileceği klasör (varsayılan: geçici, sonra silinir)")
+    parser.add_argument("--output", default=None, help="Sonuçların yazılacağı JSON dosyası")
+    parser.add_argument("--run", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    # Alt süreç modu: tek klasörü ölç ve sonucu JSON satırı olarak yaz
+    if args.run:
+        print(json.dumps(run_once(args.run, args.workers, args.min_similarity, args.cache)))
+        return 0
+
+    work_dir = args.work_dir or tempfile.mkdtemp(prefix="spoton_scaling_")
+    results = []
+    try:
+        print(f"{'dosya':>8} {'çift':>12} {'süre (sn)':>10} {'çift/sn':>10} {'okunan MB':>10} "
+              f"{'MB/sn':>8} {'RSS MB':>8} {'işçi RSS':>9}")
+        for count in [int(c) for c in args.counts.split(",") if c.strip()]:
+            folder = os.path.join(work_dir, f"corpus_{count}")
+            if not os.path.isdir(folder):
+                generate_corpus(folder, count, args.seed, args.max_size)
+            record = run_in_subprocess(folder, args.workers, args.min_similarity, args.cache)
+            results.append(record)
+            own = record["peak_rss_kb"]
+            workers = record["peak_worker_rss_kb"]
+            print(f"{record['files']:>8} {record['pairs']:>12} {record['wall_seconds']:>10.2f} "
+                  f"{record['pairs_per_sec']:>10.0f} {record['bytes_read'] / MB:>10.1f} "
+                  f"{record['mb_per_sec']:>8.1f} "
+                  f"{(own / 1024 if own is not None else float('nan')):>8.1f} "
+                  f"{(workers / 1024 if workers is not None else float('nan')):>9.1f}", flush=True)
+            for error in record["errors"]:
+                print(f"  Hata: {error}")
+    finally:
+        if not args.work_dir:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"workers": args.workers, "min_similarity": args.min_similarity,
+                       "results": results}, f, indent=2)
+        print(f"\nSonuçlar kaydedildi: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,7 @@
 # Main/main.py - Beta 2.1.0
 import sys
 import os
+import multiprocessing
 from PyQt5.QtWidgets import QApplication
 from src.ui.ui import ModernFileComparator, __version__  # Import version
 
@@ -24,6 +25,8 @@ def setup_logging():
         return 'file_comparator.log'  # Fallback to current directory
 
 if __name__ == "__main__":
+    # Paralel karşılaştırma işçileri (spawn / donmuş exe) için gerekli
+    multiprocessing.freeze_support()
     try:
         import logging
         log_file = setup_logging()
@@ -0,0 +1,2 @@
+# Main/spoton/__init__.py
+# Komut satırı giriş noktası: python -m spoton scan <klasör>
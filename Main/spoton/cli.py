@@ -0,0 +1,359 @@
+# Main/spoton/cli.py
+import os
+import sys
+import json
+import time
+import argparse
+import datetime
+import multiprocessing
+
+# Yalnızca çekirdek modüller yüklenir; PyQt ve matplotlib gerekmez
+from src.core.comparator import FileComparator
+from src.core.scanner import FolderScanner
+from src.core.progress import format_duration
+from src.core.discovery import DEFAULT_EXCLUDES, load_ignore_file
+from src.core.library import LibraryIndex
+from src.core.monitor import FileMonitor, DEFAULT_SETTLE_SECONDS, DEFAULT_POLL_INTERVAL
+
+FILE_TYPES = ['solidworks', 'cad', 'document', 'image', 'all']
+
+
+def parse_types(value):
+    types = [t.strip().lower() for t in value.split(',') if t.strip()]
+    unknown = [t for t in types if t not in FILE_TYPES]
+    if unknown:
+        raise argparse.ArgumentTypeError(
+            f"Bilinmeyen dosya tipi: {', '.join(unknown)} (geçerli: {', '.join(FILE_TYPES)})"
+        )
+    return types or ['all']
+
+
+SIZE_UNITS = {'': 1, 'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3}
+
+
+def parse_size(value):
+    """'500', '64K', '2M', '1G' biçimindeki boyutu bayta çevirir."""
+    text = value.strip().upper().rstrip('B')
+    unit = text[-1:] if text[-1:] in SIZE_UNITS else ''
+    try:
+        return int(float(text[:len(text) - len(unit)]) * SIZE_UNITS[unit])
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Geçersiz boyut: {value}")
+
+
+def parse_date(value):
+    """ISO tarih/saati ('2024-05-01', '2024-05-01T14:30') epoch saniyeye çevirir."""
+    try:
+        return datetime.datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Geçersiz tarih: {value}")
+
+
+def add_discovery_arguments(parser):
+    """Dosya keşfi (özyineleme, dışlama, boyut/tarih filtreleri) seçeneklerini ekler."""
+    parser.add_argument('--no-recursive', action='store_true', help="Alt klasörlere inme")
+    parser.add_argument('--exclude', action='append', default=[], metavar='PATTERN',
+                        help="gitignore biçimli dışlama kuralı (tekrarlanabilir)")
+    parser.add_argument('--exclude-from', action='append', default=[], metavar='FILE',
+                        help="Dışlama kurallarını dosyadan oku (.gitignore biçimi)")
+    parser.add_argument('--no-default-excludes', action='store_true',
+                        help="Kilit (~$) ve yedek dosyası/klasörü kurallarını uygulama")
+    parser.add_argument('--min-size', type=parse_size, default=None, help="En küçük dosya boyutu (örn. 10K)")
+    parser.add_argument('--max-size', type=parse_size, default=None, help="En büyük dosya boyutu (örn. 200M)")
+    parser.add_argument('--modified-after', type=parse_date, default=None,
+                        help="Yalnızca bu tarihten sonra değişen dosyalar (ISO tarih)")
+    parser.add_argument('--modified-before', type=parse_date, default=None,
+                        help="Yalnızca bu tarihten önce değişen dosyalar (ISO tarih)")
+
+
+def discovery_options(args):
+    """Keşif seçeneklerini FolderScanner anahtar sözcük argümanlarına dönüştürür."""
+    excludes = [] if args.no_default_excludes else list(DEFAULT_EXCLUDES)
+    for path in args.exclude_from:
+        excludes.extend(load_ignore_file(path))
+    excludes.extend(args.exclude)
+    return {
+        'recursive': not args.no_recursive,
+        'excludes': excludes,
+        'min_size': args.min_size,
+        'max_size': args.max_size,
+        'modified_after': args.modified_after,
+        'modified_before': args.modified_before
+    }
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='spoton', description="SpotOn - başsız dosya karşılaştırma")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    scan = commands.add_parser('scan', help="Klasördeki dosyaları karşılaştırır, sonuçları JSON Lines yazar")
+    scan.add_argument('folder', help="Taranacak klasör")
+    scan.add_argument('--against', default=None, metavar='FOLDER',
+                      help="Yalnızca bu klasörle klasörler arası çiftleri karşılaştır (örn. kütüphane)")
+    scan.add_argument('--min-similarity', type=float, default=0,
+                      help="Çıktıya yazılacak minimum toplam benzerlik (0-100)")
+    scan.add_argument('--types', type=parse_types, default=['all'],
+                      help="Virgülle ayrılmış dosya tipleri: " + ', '.join(FILE_TYPES))
+    scan.add_argument('--workers', type=int, default=None,
+                      help="Paralel işçi sayısı (varsayılan: işlemci sayısı)")
+    scan.add_argument('--output', default='-',
+                      help="JSON Lines çıktı dosyası (varsayılan: standart çıktı)")
+    scan.add_argument('--no-cache', action='store_true', help="Profil önbelleğini kullanma")
+    scan.add_argument('--cache', default=None, help="Profil önbelleği dosyası")
+    scan.add_argument('--incremental', action='store_true',
+                      help="Önceki taramadan bu yana eklenen/değişen dosyaların çiftlerini karşılaştır, "
+                           "diğer sonuçları önceki taramadan al ve bir 'delta' kaydı yaz")
+    scan.add_argument('--snapshot', default=None, metavar='FILE',
+                      help="Artımlı tarama görüntüsü dosyası (varsayılan: önbellek klasöründe)")
+    scan.add_argument('--timings', action='store_true',
+                      help="Aşama sürelerini ölç ve dosya tipine göre özetle")
+    add_discovery_arguments(scan)
+    scan.add_argument('--trace', default=None, metavar='FILE',
+                      help="Chrome Trace Event JSON dosyası (Perfetto ile açılır)")
+    scan.add_argument('--profile-dir', default=None, metavar='DIR',
+                      help="Ana süreç ve her işçi için cProfile (.prof) dosyalarının klasörü")
+
+    index = commands.add_parser('index', help="Kütüphane klasörünün sorgu indeksini oluşturur/günceller")
+    index.add_argument('library', help="Kütüphane klasörü")
+    index.add_argument('--index', default=None, help="İndeks dosyası (varsayılan: önbellek klasöründe)")
+    index.add_argument('--types', type=parse_types, default=['all'],
+                       help="Virgülle ayrılmış dosya tipleri: " + ', '.join(FILE_TYPES))
+    index.add_argument('--cache', default=None, help="Profil önbelleği dosyası")
+    add_discovery_arguments(index)
+
+    query = commands.add_parser('query', help="Bir dosyaya en benzer k kütüphane dosyasını bulur")
+    query.add_argument('file', help="Sorgu dosyası")
+    query.add_argument('library', help="İndekslenmiş kütüphane klasörü")
+    query.add_argument('-k', '--top', type=int, default=10, help="Sonuç sayısı (varsayılan: 10)")
+    query.add_argument('--min-similarity', type=float, default=0,
+                       help="Sonuçlara alınacak minimum toplam benzerlik (0-100)")
+    query.add_argument('--index', default=None, help="İndeks dosyası (varsayılan: önbellek klasöründe)")
+    query.add_argument('--cache', default=None, help="Profil önbelleği dosyası")
+    query.add_argument('--update', action='store_true', help="Sorgudan önce indeksi güncelle")
+    query.add_argument('--output', default='-',
+                       help="JSON Lines çıktı dosyası (varsayılan: standart çıktı)")
+
+    monitor = commands.add_parser('monitor', help="Klasörlere gelen dosyaları izler ve kütüphaneyle karşılaştırır")
+    monitor.add_argument('library', help="Kütüphane klasörü (indeks gerekirse oluşturulur)")
+    monitor.add_argument('--watch', action='append', default=[], metavar='FOLDER',
+                         help="İzlenecek klasör (tekrarlanabilir; varsayılan: kütüphanenin kendisi)")
+    monitor.add_argument('-k', '--top', type=int, default=5, help="Dosya başına eşleşme sayısı (varsayılan: 5)")
+    monitor.add_argument('--min-similarity', type=float, default=80,
+                         help="Bildirilecek minimum toplam benzerlik (varsayılan: 80)")
+    monitor.add_argument('--types', type=parse_types, default=['all'],
+                         help="Virgülle ayrılmış dosya tipleri: " + ', '.join(FILE_TYPES))
+    monitor.add_argument('--settle', type=float, default=DEFAULT_SETTLE_SECONDS,
+                         help="Yazmanın bitmiş sayılması için beklenecek saniye")
+    monitor.add_argument('--polling', action='store_true', help="inotify yerine klasörleri yoklayarak izle")
+    monitor.add_argument('--poll-interval', type=float, default=DEFAULT_POLL_INTERVAL,
+                         help="Yoklama aralığı (saniye)")
+    monitor.add_argument('--index', default=None, help="İndeks dosyası (varsayılan: önbellek klasöründe)")
+    monitor.add_argument('--cache', default=None, help="Profil önbelleği dosyası")
+    monitor.add_argument('--output', default='-',
+                         help="JSON Lines çıktı dosyası (varsayılan: standart çıktı)")
+    add_discovery_arguments(monitor)
+    return parser
+
+
+def result_record(result):
+    """compare_files sonucunu JSON Lines kaydına dönüştürür."""
+    details = result.get('details', {})
+    return {
+        'type': 'result',
+        'file1': result['file1'],
+        'file2': result['file2'],
+        'total': round(result.get('total', 0), 3),
+        'category': result.get('category'),
+        'file_type': result.get('file_type'),
+        'metadata': details.get('metadata', 0),
+        'hash': details.get('hash', 0),
+        'content': details.get('content', 0),
+        'structure': details.get('structure', 0),
+        'details': details
+    }
+
+
+def write_record(stream, record):
+    stream.write(json.dumps(record, ensure_ascii=False, default=str) + '\n')
+
+
+def run_scan(args):
+    for folder in (args.folder, args.against):
+        if folder is not None and not os.path.isdir(folder):
+            print(f"Geçersiz klasör: {folder}", file=sys.stderr)
+            return 2
+    if args.incremental and args.against:
+        print("--incremental ve --against birlikte kullanılamaz", file=sys.stderr)
+        return 2
+
+    scanner = FolderScanner(
+        FileComparator(), args.types, args.min_similarity,
+        workers=args.workers, use_cache=not args.no_cache, cache_path=args.cache,
+        collect_timings=args.timings, trace_path=args.trace, profile_dir=args.profile_dir,
+        incremental=args.incremental, snapshot_path=args.snapshot,
+        **discovery_options(args)
+    )
+    show_progress = sys.stderr.isatty()
+    stream = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+    started = time.time()
+    found = 0
+    try:
+        events = (scanner.scan_cross(args.folder, args.against) if args.against
+                  else scanner.scan(args.folder))
+        for event, data in events:
+            if event == 'results':
+                for result in data:
+                    write_record(stream, result_record(result))
+                found += len(data)
+                stream.flush()
+            elif event == 'delta':
+                write_record(stream, dict(type='delta', **data))
+                print(f"Değişiklikler: {len(data['added'])} eklenen, {len(data['modified'])} değişen, "
+                      f"{len(data['removed'])} silinen dosya; {len(data['new_matches'])} yeni, "
+                      f"{len(data['lost_matches'])} kaybolan, {len(data['changed_matches'])} skoru değişen eşleşme",
+                      file=sys.stderr)
+            elif event == 'timings':
+                write_record(stream, {'type': 'timings', 'by_type': data.to_dict()})
+                print(data.format_table(), file=sys.stderr)
+            elif event == 'progress' and show_progress:
+                print(f"\r{data['phase']}: {data['processed']}/{data['total']} ({data['percent']:.1f}%) "
+                      f"{data['items_per_sec']:.0f}/s {data['mb_per_sec']:.1f} MB/s "
+                      f"ETA {format_duration(data['eta'])}   ", end='', file=sys.stderr, flush=True)
+        if show_progress:
+            print(file=sys.stderr)
+        write_record(stream, {
+            'type': 'summary',
+            'folder': os.path.abspath(args.folder),
+            'against': os.path.abspath(args.against) if args.against else None,
+            'pairs': scanner.total_comparisons,
+            'results': found,
+            'elapsed': round(time.time() - started, 3)
+        })
+    except KeyboardInterrupt:
+        scanner.stop()
+        return 130
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+        if scanner.write_trace() is not None:
+            print(f"İz dosyası yazıldı: {args.trace}", file=sys.stderr)
+    return 0
+
+
+def run_index(args):
+    if not os.path.isdir(args.library):
+        print(f"Geçersiz klasör: {args.library}", file=sys.stderr)
+        return 2
+    scanner = FolderScanner(FileComparator(), args.types, cache_path=args.cache, **discovery_options(args))
+    index = LibraryIndex(args.library, scanner, args.index)
+    show_progress = sys.stderr.isatty()
+    started = time.time()
+
+    def progress(done, total):
+        if show_progress and (done == total or done % 50 == 0):
+            print(f"\rİndeksleniyor: {done}/{total}   ", end='', file=sys.stderr, flush=True)
+
+    try:
+        stats = index.update(progress)
+    except KeyboardInterrupt:
+        return 130
+    finally:
+        index.close()
+    if show_progress:
+        print(file=sys.stderr)
+    write_record(sys.stdout, dict(type='index', library=index.library, index=index.index_path,
+                                  elapsed=round(time.time() - started, 3), **stats))
+    return 0
+
+
+def run_query(args):
+    if not os.path.isfile(args.file):
+        print(f"Geçersiz dosya: {args.file}", file=sys.stderr)
+        return 2
+    if not os.path.isdir(args.library):
+        print(f"Geçersiz klasör: {args.library}", file=sys.stderr)
+        return 2
+    scanner = FolderScanner(FileComparator(), cache_path=args.cache)
+    index = LibraryIndex(args.library, scanner, args.index)
+    stream = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+    started = time.time()
+    try:
+        if args.update:
+            index.update()
+        if not index.file_count():
+            print(f"Kütüphane indeksi boş; önce 'spoton index {args.library}' çalıştırın.", file=sys.stderr)
+            return 2
+        results = index.query(args.file, args.top, args.min_similarity)
+        for rank, result in enumerate(results, 1):
+            record = result_record(result)
+            record.update(type='match', rank=rank, overlap=round(result.get('overlap', 0), 3))
+            write_record(stream, record)
+        write_record(stream, {
+            'type': 'summary',
+            'file': os.path.abspath(args.file),
+            'library': index.library,
+            'results': len(results),
+            'elapsed': round(time.time() - started, 3)
+        })
+    except OSError as e:
+        print(f"Sorgu hatası: {e}", file=sys.stderr)
+        return 1
+    finally:
+        index.close()
+        if stream is not sys.stdout:
+            stream.close()
+    return 0
+
+
+def run_monitor(args):
+    for folder in [args.library] + args.watch:
+        if not os.path.isdir(folder):
+            print(f"Geçersiz klasör: {folder}", file=sys.stderr)
+            return 2
+    scanner = FolderScanner(FileComparator(), args.types, cache_path=args.cache, **discovery_options(args))
+    index = LibraryIndex(args.library, scanner, args.index)
+    monitor = FileMonitor(index, args.watch, args.min_similarity, args.top, args.settle,
+                          args.poll_interval, use_inotify=not args.polling)
+    stream = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+    try:
+        for event, data in monitor.run():
+            if event == 'status':
+                print("Kütüphane indeksi güncelleniyor...", file=sys.stderr)
+            elif event == 'indexed':
+                write_record(stream, dict(type='index', library=index.library, index=index.index_path, **data))
+            elif event == 'watching':
+                print(f"İzleniyor ({data['backend']}): {', '.join(data['roots'])}", file=sys.stderr)
+            elif event == 'matches':
+                # Eşleşmeler dosya yazılır yazılmaz bildirilir
+                for rank, result in enumerate(data['results'], 1):
+                    record = result_record(result)
+                    record.update(type='match', rank=rank, overlap=round(result.get('overlap', 0), 3),
+                                  detected=datetime.datetime.now().isoformat(timespec='seconds'))
+                    write_record(stream, record)
+                    print(f"Eşleşme: {result['file1']} ~ {result['file2']} (%{result['total']:.1f})",
+                          file=sys.stderr)
+                stream.flush()
+            elif event == 'removed':
+                write_record(stream, {'type': 'removed', 'file': data})
+                stream.flush()
+    except KeyboardInterrupt:
+        monitor.stop()
+    finally:
+        index.close()
+        if stream is not sys.stdout:
+            stream.close()
+    return 0
+
+
+def main(argv=None):
+    multiprocessing.freeze_support()
+    args = build_parser().parse_args(argv)
+    if args.command == 'scan':
+        return run_scan(args)
+    if args.command == 'index':
+        return run_index(args)
+    if args.command == 'query':
+        return run_query(args)
+    if args.command == 'monitor':
+        return run_monitor(args)
+    return 1
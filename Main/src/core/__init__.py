@@ -1,4 +1,3 @@
 # Main/src/core/__init__.py
 from .comparator import FileComparator
 from .utils import get_file_info, format_size
-from ..resources.colors import *
\ No newline at end of file
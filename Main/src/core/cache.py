@@ -0,0 +1,140 @@
+# Main/src/core/cache.py
+import os
+import time
+import pickle
+import sqlite3
+import logging
+from .profile import FileProfile, PROFILE_VERSION
+
+# Önbellek, log klasörünün yanında Dev/cache altında tutulur
+DEFAULT_CACHE_PATH = os.path.join(
+    os.path.dirname(__file__), '..', '..', '..', 'Dev', 'cache', 'profile_cache.sqlite3'
+)
+
+# Bu kadar kayıt birikince otomatik commit yapılır
+COMMIT_INTERVAL = 500
+
+
+class ProfileCache:
+    """
+    Dosya profillerini taramalar arasında saklayan SQLite deposu.
+
+    Kayıtlar (boyut, mtime_ns, inode) ile doğrulanır; taşınan veya yeniden
+    adlandırılan dosyalar aynı birimdeki inode ya da içerik hash'i üzerinden
+    bulunur (inode numaraları yalnızca bir birim içinde benzersizdir).
+    """
+
+    def __init__(self, db_path=None):
+        self.db_path = os.path.abspath(db_path or DEFAULT_CACHE_PATH)
+        self._conn = None
+        self._pending = 0
+
+    def connect(self):
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(profiles)")}
+            if columns and 'device' not in columns:
+                # Aygıt numarası olmayan eski şema: önbellek yeniden oluşturulur
+                self._conn.executescript("DROP INDEX IF EXISTS idx_profiles_stat; DROP TABLE profiles;")
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS profiles (
+                    path TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    inode INTEGER NOT NULL,
+                    device INTEGER NOT NULL,
+                    md5 TEXT NOT NULL,
+                    version INTEGER NOT NULL,
+                    payload BLOB NOT NULL,
+                    updated REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_profiles_stat ON profiles(size, mtime_ns, inode, device);
+                CREATE INDEX IF NOT EXISTS idx_profiles_md5 ON profiles(md5, size);
+            """)
+        return self._conn
+
+    def _load(self, row, path, stat):
+        profile = FileProfile.from_dict(pickle.loads(row[0]))
+        profile.path = path
+        profile.size = stat.st_size
+        profile.mtime = stat.st_mtime
+        profile.mtime_ns = stat.st_mtime_ns
+        profile.inode = stat.st_ino
+        profile.device = stat.st_dev
+        return profile
+
+    def lookup(self, path, stat):
+        """
+        Yol ve dosya bilgisiyle geçerli bir profil arar.
+
+        Args:
+            path: Dosya yolu
+            stat: os.stat sonucu
+
+        Returns:
+            FileProfile veya None
+        """
+        try:
+            conn = self.connect()
+            key = (stat.st_size, stat.st_mtime_ns, stat.st_ino, stat.st_dev, PROFILE_VERSION)
+            row = conn.execute(
+                "SELECT payload FROM profiles WHERE path=? AND size=? AND mtime_ns=? AND inode=? AND device=? "
+                "AND version=?",
+                (os.path.abspath(path),) + key
+            ).fetchone()
+            if row is None:
+                # Taşınmış/yeniden adlandırılmış dosya: aynı birimde aynı inode ve zaman damgası
+                row = conn.execute(
+                    "SELECT payload FROM profiles WHERE size=? AND mtime_ns=? AND inode=? AND device=? "
+                    "AND version=? LIMIT 1",
+                    key
+                ).fetchone()
+            return self._load(row, path, stat) if row else None
+        except Exception as e:
+            logging.error(f"Profil önbelleği okuma hatası: {e}")
+            return None
+
+    def lookup_by_hash(self, md5, size):
+        """İçerik hash'i aynı olan herhangi bir dosyanın profilini döndürür."""
+        try:
+            row = self.connect().execute(
+                "SELECT payload FROM profiles WHERE md5=? AND size=? AND version=? LIMIT 1",
+                (md5, size, PROFILE_VERSION)
+            ).fetchone()
+            return FileProfile.from_dict(pickle.loads(row[0])) if row else None
+        except Exception as e:
+            logging.error(f"Profil önbelleği hash sorgu hatası: {e}")
+            return None
+
+    def store(self, profile):
+        if profile.error:
+            return
+        try:
+            self.connect().execute(
+                "INSERT OR REPLACE INTO profiles VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (os.path.abspath(profile.path), profile.size, profile.mtime_ns, profile.inode,
+                 getattr(profile, 'device', 0), profile.md5,
+                 profile.version, pickle.dumps(profile.to_dict(), pickle.HIGHEST_PROTOCOL), time.time())
+            )
+            self._pending += 1
+            if self._pending >= COMMIT_INTERVAL:
+                self.flush()
+        except Exception as e:
+            logging.error(f"Profil önbelleği yazma hatası: {e}")
+
+    def flush(self):
+        if self._conn is not None and self._pending:
+            try:
+                self._conn.commit()
+            except Exception as e:
+                logging.error(f"Profil önbelleği commit hatası: {e}")
+            self._pending = 0
+
+    def close(self):
+        if self._conn is not None:
+            self.flush()
+            self._conn.close()
+            self._conn = None
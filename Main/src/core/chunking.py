@@ -0,0 +1,139 @@
+# Main/src/core/chunking.py
+import hashlib
+import numpy as np
+
+# FastCDC tarzı içerik tanımlı parçalama parametreleri (bayt)
+MIN_CHUNK_SIZE = 1024
+AVG_CHUNK_SIZE = 4096
+MAX_CHUNK_SIZE = 32768
+
+# Gear hash'i son 32 baytlık pencereye bağlıdır
+WINDOW_SIZE = 32
+
+# Normalleştirilmiş parçalama: ortalamadan önce zor, sonra kolay maske.
+# En üst bitler pencerenin tamamından etkilendiği için maskeler üst bitlerde.
+_AVG_BITS = AVG_CHUNK_SIZE.bit_length() - 1
+MASK_SMALL = np.uint32(((1 << (_AVG_BITS + 2)) - 1) << (32 - (_AVG_BITS + 2)))
+MASK_LARGE = np.uint32(((1 << (_AVG_BITS - 2)) - 1) << (32 - (_AVG_BITS - 2)))
+
+
+def _build_gear_table():
+    # Sabit ve platformdan bağımsız olması için tablo MD5'ten türetilir
+    return np.array([
+        int.from_bytes(hashlib.md5(bytes([i])).digest()[:4], 'little') for i in range(256)
+    ], dtype=np.uint32)
+
+
+GEAR_TABLE = _build_gear_table()
+
+
+def gear_hashes(data):
+    """
+    Her bayt konumu için son 32 baytın gear hash'ini hesaplar.
+
+    h[i] = sum(GEAR[data[i-k]] << k, k = 0..31) (mod 2^32); log2(32) adımlı
+    ikiye katlama ile vektörel hesaplanır.
+    """
+    h = GEAR_TABLE[np.frombuffer(data, dtype=np.uint8)]
+    shift = 1
+    while shift < WINDOW_SIZE:
+        shifted = np.zeros_like(h)
+        shifted[shift:] = h[:-shift] << np.uint32(shift)
+        h = h + shifted
+        shift *= 2
+    return h
+
+
+class ContentChunker:
+    """
+    Akış halinde gelen veriyi içerik tanımlı parçalara bölen sınıf.
+
+    Parça sınırları yalnızca içeriğe bağlı olduğundan araya eklenen veya
+    silinen baytlar sadece çevresindeki parçaları etkiler.
+    """
+
+    def __init__(self, min_size=MIN_CHUNK_SIZE, avg_size=AVG_CHUNK_SIZE, max_size=MAX_CHUNK_SIZE):
+        self.min_size = min_size
+        self.avg_size = avg_size
+        self.max_size = max_size
+        self.hashes = []
+        self.sizes = []
+        self._pending = b''
+        self._tail = b''
+
+    def update(self, data):
+        self._pending += bytes(data)
+        if len(self._pending) >= self.max_size:
+            self._cut(final=False)
+
+    def finish(self):
+        """Kalan veriyi parçalar ve (hash listesi, boyut listesi) döndürür."""
+        self._cut(final=True)
+        return self.hashes, self.sizes
+
+    def _cut(self, final):
+        data = self._pending
+        # Pencere önceki parçanın son baytlarıyla devam eder
+        h = gear_hashes(self._tail + data)[len(self._tail):]
+        small = np.flatnonzero((h & MASK_SMALL) == 0) + 1
+        large = np.flatnonzero((h & MASK_LARGE) == 0) + 1
+
+        start = 0
+        length = len(data)
+        while start < length:
+            if not final and length - start < self.max_size:
+                break
+            if length - start <= self.min_size:
+                end = length
+            else:
+                end = min(start + self.max_size, length)
+                k = np.searchsorted(small, start + self.min_size)
+                if k < len(small) and small[k] < start + self.avg_size:
+                    end = int(small[k])
+                else:
+                    k = np.searchsorted(large, start + self.avg_size)
+                    if k < len(large) and large[k] < end:
+                        end = int(large[k])
+            chunk = data[start:end]
+            self.hashes.append(int.from_bytes(hashlib.blake2b(chunk, digest_size=8).digest(), 'little'))
+            self.sizes.append(end - start)
+            start = end
+
+        self._tail = (self._tail + data[:start])[-(WINDOW_SIZE - 1):]
+        self._pending = data[start:]
+
+
+def chunk_data(data, **kwargs):
+    """Bellekteki veriyi tek seferde parçalar; (hash listesi, boyut listesi) döndürür."""
+    chunker = ContentChunker(**kwargs)
+    chunker.update(data)
+    return chunker.finish()
+
+
+def chunk_similarity(hashes1, sizes1, hashes2, sizes2):
+    """
+    Parça hash'leri üzerinden boyut ağırlıklı Jaccard benzerliği.
+
+    Args:
+        hashes1, sizes1: Birinci dosyanın parça hash'leri ve boyutları
+        hashes2, sizes2: İkinci dosyanın parça hash'leri ve boyutları
+
+    Returns:
+        Benzerlik yüzdesi (0-100)
+    """
+    if not hashes1 or not hashes2:
+        return 0
+    weights1 = {}
+    for h, size in zip(hashes1, sizes1):
+        weights1[h] = weights1.get(h, 0) + size
+    weights2 = {}
+    for h, size in zip(hashes2, sizes2):
+        weights2[h] = weights2.get(h, 0) + size
+
+    intersection = 0
+    for h, w1 in weights1.items():
+        w2 = weights2.get(h)
+        if w2:
+            intersection += min(w1, w2)
+    union = sum(sizes1) + sum(sizes2) - intersection
+    return intersection / union * 100 if union > 0 else 0
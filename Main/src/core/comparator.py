@@ -1,13 +1,20 @@
 # Main/src/core/comparator.py
 import os
+import re
+import math
 import time
+import zlib
+import struct
 import hashlib
 import difflib
 import logging
-from datetime import datetime
-from collections import Counter
 import numpy as np
-import pandas as pd
+from .profile import FileProfile, build_profile, ensure_profile
+from .fileio import open_mapped, read_range, get_max_buffer_size
+from .chunking import ContentChunker, chunk_similarity
+from .sectioncache import SectionCache, DEFAULT_SECTION_CACHE_BYTES
+from .preview import preview_hash, hamming_distance, dib_to_bmp, HASH_BITS
+from .timing import make_timer
 
 # Logging yapılandırmasını güncelle
 logging.basicConfig(
@@ -16,45 +23,460 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
+# SolidWorks 2015+ kapsayıcısında her bölüm bu işaretle başlar; ardından
+# zaman damgası, CRC32, sıkıştırılmış boyut, açık boyut ve ad uzunluğu gelir,
+# sonra ad (baytların yarım baytları yer değiştirmiş) ve bölüm verisi
+SW_SECTION_MARKER = b'\x14\x00\x06\x00\x08\x00'
+SW_SECTION_HEADER = struct.Struct('<6sIIIII')
+SW_MAX_NAME_LENGTH = 1024
+
+# Bir bölümün sonu ile sonraki bölüm işareti arasındaki en fazla boşluk;
+# sonrasında işaret bulunmayan kayıtlar (yarım/kopya başlıklar) bölüm sayılmaz
+SW_SECTION_GAP = 64
+
+# Bölüm verisinin geçerli bir deflate akışı olduğunu doğrulamak için açılan baş kısım
+SW_DEFLATE_PROBE = 256
+
+# Bölümler en fazla G/Ç tampon sınırı (fileio.get_max_buffer_size) kadar
+# parçalarla açılır; sıkıştırılmış veri açıcıya bu boyutta dilimlerle verilir
+SW_INFLATE_INPUT = 1024 * 1024
+
+# Parça sınırında kalan ad belirteçleri için önceki parçanın bu kadar sonu
+# sonraki parçayla birlikte taranır (daha uzun adlar kesilebilir)
+SW_TOKEN_OVERLAP = 4096
+
+# Önbellekte bir parça hash'i ve boyutunun yaklaşık bellek maliyeti
+CHUNK_ENTRY_BYTES = 64
+
+# Özellik, çizim ve gövde adları UTF-16LE saklanır: harfle başlayan, en az
+# dört karakterlik; harf, rakam, '_', '.', '-' ve Latin-1 / Latin
+# Genişletilmiş-A karakterlerinden oluşan diziler. Noktalama içeren dahili
+# geometri kimlikleri (moDerivedSurfIdRep_c,33,<...>) parçalara ayrılır.
+SW_NAME_PATTERN = re.compile(rb'[A-Za-z]\x00(?:[A-Za-z0-9_.\-\xa1-\xff]\x00|[\x00-\x7f]\x01){3,}')
+
+# Çizim öğesi işaretleri
+SW_SKETCH_PATTERN = re.compile(rb'SKET|LINE|CIRC|RECT')
+
+# swXmlContents/KeyWords bölümündeki özellik ağacı XML'inde çizimler ve
+# ölçüleri: <Sketch Name="..."><Dimension Name="D1">80</Dimension>...</Sketch>
+SW_XML_SKETCH_PATTERN = re.compile(rb'<Sketch [^>]*?Name="([^"]*)"[^>]*?(?:/>|>(.*?)</Sketch>)', re.S)
+SW_XML_DIMENSION_PATTERN = re.compile(rb'<Dimension Name="([^"]*)">([^<]*)</Dimension>')
+
+# Önbellekte bir ad belirteci ve ofsetinin yaklaşık bellek maliyeti
+TOKEN_ENTRY_BYTES = 96
+
+# Ad belirteçlerinin belge sıklığıyla ağırlıklandırılması için gereken en az
+# SolidWorks dosyası; daha küçük derlemlerde (tek çift) tüm adlar eşit sayılır
+MIN_TOKEN_CORPUS = 3
+
+# Gömülü önizleme: 4 baytlık uzunluk + paketlenmiş DIB; yeni sürümlerde ayrıca PNG
+SW_PREVIEW_SECTION = 'Preview'
+SW_PREVIEW_PNG_SECTION = 'PreviewPNG'
+
+# Önizleme hash'leri arasında bundan fazla bit farkı olan çiftler "açıkça
+# farklı görünüyor" sayılır (rastgele iki görüntüde beklenen fark 32 bittir)
+PREVIEW_DIFFERENT_DISTANCE = 24
+
+# SolidWorks sonuçlarında "Farklı Dosyalar" bandının üst sınırı (classify_result)
+SW_DIFFERENT_SCORE = 40
+
+# SolidWorks son skorunun ağırlıkları: bileşenlerin ağırlıklı ortalaması,
+# ham bölüm/pencere farkları ve boyut benzerliği. Önizleme ön elemesinin
+# üst sınırı da bunlarla hesaplanır (bkz. SolidWorksAnalyzer.combine_scores).
+SW_SCORE_WEIGHTS = {'components': 0.8, 'raw': 0.15, 'size': 0.05}
+
+# Bölüm adlarını çözmek için yarım bayt değiştirme tablosu
+SW_NAME_TABLE = bytes(((b << 4) | (b >> 4)) & 0xFF for b in range(256))
+
+# Mantıksal pencereler: (aday bölüm adları, pencere başlangıcı, boyut).
+# Negatif başlangıç bölüm sonuna göredir. Pencereler parçayı tanımlayan
+# içerikten alınır: özellik ağacı XML'i (özellik/çizim adları, tipleri,
+# ölçüleri) ve model başlığındaki özellik geçmişi (adlar ve oluşturma/
+# değiştirme damgaları). Büyük bölümlerin başları her dosyada aynı olan
+# sınıf tablolarıdır ve yalnızca eski dosyalarda yedek olarak kullanılır.
+SW_SECTION_WINDOWS = {
+    'feature_tree': (('swXmlContents/KeyWords', 'Contents/Config-0-ResolvedFeatures', 'Contents/Definition'),
+                     0, 16384),
+    'sketch_data': (('Header2', 'Contents/Config-0-ModelHeader', 'Contents/Config-0', 'Contents/Definition'),
+                    0, 16384),
+    'geometry': (('Contents/Config-0-Partition',), -2000, 2000)
+}
+
+# Tampon sınırından büyük bölümlerin yalnızca pencerelerin okuduğu baş ve son kısmı saklanır
+SW_WINDOW_HEAD = max(start + length for _, start, length in SW_SECTION_WINDOWS.values() if start >= 0)
+SW_WINDOW_TAIL = max(-start for _, start, _ in SW_SECTION_WINDOWS.values() if start < 0)
+
+def _name_tokens(match):
+    yield match.group().decode('utf-16-le'), match.start()
+
+
+def _xml_sketch_tokens(match):
+    name = match.group(1).decode('utf-8', 'replace')
+    yield name, match.start()
+    for dimension in SW_XML_DIMENSION_PATTERN.finditer(match.group(2) or b''):
+        yield (f"{name}/{dimension.group(1).decode('utf-8', 'replace')}="
+               f"{dimension.group(2).decode('utf-8', 'replace')}", match.start(2) + dimension.start())
+
+
+def _marker_tokens(match):
+    yield match.group().decode('ascii'), match.start()
+
+
+# Belirteç kuralları: (desen, eşleşmeden (belirteç, ofset) çiftleri üreten fonksiyon)
+SW_FEATURE_RULES = ((SW_NAME_PATTERN, _name_tokens),)
+SW_SKETCH_RULES = ((SW_XML_SKETCH_PATTERN, _xml_sketch_tokens), (SW_SKETCH_PATTERN, _marker_tokens))
+
+
+class TokenWeights:
+    """
+    Ad belirteçlerinin derlemdeki belge sıklıklarından (IDF) hesaplanan ağırlıkları.
+
+    Derlemdeki her dosyada geçen adlar (SolidWorks'ün her parçaya yazdığı
+    sınıf ve başlık adları) sıfır ağırlık alır; benzerliğe yalnızca parçayı
+    tanımlayan özellik, çizim ve gövde adları katkı yapar. Derlemde hiç
+    görülmemiş adlar tek dosyada geçiyormuş gibi ağırlıklandırılır.
+
+    Derlem ağırlık için çok küçükse (MIN_TOKEN_CORPUS) tüm adlar eşit sayılır.
+
+    Args:
+        frequencies: {ad: adı içeren dosya sayısı}
+        file_count: Derlemdeki SolidWorks dosyası sayısı
+    """
+
+    def __init__(self, frequencies, file_count):
+        self.file_count = file_count
+        if file_count < MIN_TOKEN_CORPUS:
+            self.weights = {}
+            self.unseen = 1.0
+            self.fingerprint = ''
+            return
+        self.weights = {name: math.log((file_count + 1) / (min(count, file_count) + 1))
+                        for name, count in frequencies.items()}
+        self.unseen = math.log((file_count + 1) / 2)
+        # Ağırlıklarla hesaplanan skorlar derlem değişince değişir; artımlı
+        # tarama önceki sonuçları bu parmak izi aynıysa kullanır
+        digest = hashlib.md5(str(file_count).encode('utf-8'))
+        for name, count in sorted(frequencies.items()):
+            digest.update(f"\n{name}\t{count}".encode('utf-8'))
+        self.fingerprint = digest.hexdigest()
+
+    def get(self, name):
+        return self.weights.get(name, self.unseen)
+
+
 class SWFileParser:
-    def __init__(self):
+    def __init__(self, cache_bytes=DEFAULT_SECTION_CACHE_BYTES):
+        # Bölüm dizini bulunamayan (eski OLE biçimli) dosyalar için sabit konumlar
         self.feature_tree_offset = 0x1000
         self.sketch_data_offset = 0x3000
         self.geometry_offset = -0x3000
+        # Açılmış bölümler tüm dosyalar ve çiftler arasında paylaşılır
+        self.section_cache = SectionCache(cache_bytes)
+
+    def __getstate__(self):
+        # İşçi süreçlerine önbellek içeriği değil yalnızca sınırı gönderilir
+        state = dict(self.__dict__)
+        state['section_cache'] = self.section_cache.max_bytes
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.section_cache = SectionCache(state['section_cache'])
+
+    def parse_sections(self, f):
+        """
+        Kapsayıcının bölüm dizinini tek geçişte çıkarır.
+
+        Bir kayıt, arkasından kısa bir boşlukla yeni bir işaret geliyorsa ve
+        verisinin başı geçerli bir deflate akışıysa bölüm sayılır. Her geçerli
+        kayıttan sonra verinin üzerinden atlanır; böylece sıkıştırılmış veri
+        içinde tesadüfen geçen işaretler aranmaz. Bölüm
+        hash'i saklanan verinin MD5'idir; içeriği aynı bölümler dosyadaki
+        konumlarından bağımsız olarak eşleşir.
+
+        Args:
+            f: MappedFile
+
+        Returns:
+            {bölüm adı: {'offset', 'data_offset', 'compressed_size', 'size', 'crc', 'hash'}};
+            tekrarlanan adlara '#1', '#2' eklenir. Bölüm yoksa boş sözlük.
+        """
+        sections = {}
+        size = len(f)
+        pos = f.find(SW_SECTION_MARKER)
+        while pos != -1 and pos + SW_SECTION_HEADER.size <= size:
+            _, _, crc, compressed_size, plain_size, name_length = SW_SECTION_HEADER.unpack(
+                f.view[pos:pos + SW_SECTION_HEADER.size])
+            data_offset = pos + SW_SECTION_HEADER.size + name_length
+            end = data_offset + compressed_size
+            if 0 < name_length <= SW_MAX_NAME_LENGTH and end <= size:
+                following = f.find(SW_SECTION_MARKER, end, min(end + SW_SECTION_GAP, size))
+                name = bytes(f.view[pos + SW_SECTION_HEADER.size:data_offset]).translate(SW_NAME_TABLE)
+                if ((following != -1 or end + SW_SECTION_GAP >= size) and
+                        name.isascii() and name.decode('ascii').isprintable() and
+                        self._is_deflate(f.view[data_offset:min(end, data_offset + SW_DEFLATE_PROBE)])):
+                    name = name.decode('ascii')
+                    key, copy = name, 1
+                    while key in sections:
+                        key = f"{name}#{copy}"
+                        copy += 1
+                    sections[key] = {
+                        'offset': pos,
+                        'data_offset': data_offset,
+                        'compressed_size': compressed_size,
+                        'size': plain_size,
+                        'crc': crc,
+                        'hash': hashlib.md5(f.view[data_offset:end]).hexdigest()
+                    }
+                    pos = following
+                    continue
+            pos = f.find(SW_SECTION_MARKER, pos + 1)
+        return sections
+
+    @staticmethod
+    def _is_deflate(data):
+        # Yarım/kopya başlıkların arkasındaki veri ilk birkaç baytta hata verir
+        try:
+            zlib.decompressobj(-zlib.MAX_WBITS).decompress(data)
+            return True
+        except zlib.error:
+            return False
+
+    def load_section(self, f, section):
+        """
+        Bölümü açar; içerik tanımlı parçalarını ve ad belirteçlerini çıkarır.
+
+        Bölüm en fazla G/Ç tampon sınırı kadar parçalarla açılır; parçalar
+        açıldıkça parçalayıcıya ve belirteç taramasına verilir. Açık boyutu
+        sınırı aşan bölümlerin yalnızca pencerelerin okuduğu baş ve son
+        kısmı saklanır. Sonuç bölüm hash'iyle SectionCache'e alınır; aynı
+        bölüm başka bir dosyada veya çiftte yeniden açılmaz ve taranmaz.
+        Deflate olarak açılamayan bölümlerde saklanan veri kullanılır.
+
+        Args:
+            f: MappedFile
+            section: parse_sections kaydı
+
+        Returns:
+            (açık veri veya baş kısmı, parça hash'leri, parça boyutları, özellik adları,
+            çizim öğeleri, son kısım, açık boyut)
+        """
+        content = self.section_cache.get(section['hash'])
+        if content is not None:
+            return content
+        stored = f.view[section['data_offset']:section['data_offset'] + section['compressed_size']]
+        try:
+            content, crc = self.scan_pieces(self.inflate_pieces(stored, section['size']))
+            if content[6] != section['size'] or crc != section['crc']:
+                logging.error("SolidWorks bölümü doğrulanamadı (CRC/boyut uyuşmuyor)")
+        except zlib.error as e:
+            logging.error(f"SolidWorks bölümü açılamadı: {e}")
+            limit = get_max_buffer_size()
+            content, _ = self.scan_pieces(stored[start:start + limit] for start in range(0, len(stored), limit))
+        data, hashes, _, features, sketches, tail, _ = content
+        tokens = sum(map(len, features.values())) + sum(map(len, sketches.values()))
+        self.section_cache.put(section['hash'], content,
+                               len(data) + len(tail) + CHUNK_ENTRY_BYTES * len(hashes) + TOKEN_ENTRY_BYTES * tokens)
+        return content
+
+    @staticmethod
+    def inflate_pieces(stored, size):
+        """
+        Saklanan deflate verisini en fazla G/Ç tampon sınırı kadar parçalarla açar.
+
+        Başlıktaki açık boyuttan bir bayt fazlasından sonrası üretilmez
+        (bozuk/kötü niyetli veri); fazlalık boyut denetiminde yakalanır.
+        """
+        limit = get_max_buffer_size()
+        inflater = zlib.decompressobj(-zlib.MAX_WBITS)
+        remaining = size + 1
+        for start in range(0, len(stored), SW_INFLATE_INPUT):
+            pending = stored[start:start + SW_INFLATE_INPUT]
+            while pending and remaining > 0 and not inflater.eof:
+                piece = inflater.decompress(pending, min(limit, remaining))
+                pending = inflater.unconsumed_tail
+                remaining -= len(piece)
+                if piece:
+                    yield piece
+            if remaining <= 0 or inflater.eof:
+                return
+
+    def scan_pieces(self, pieces):
+        """
+        Bölüm verisini parça parça parçalar ve belirteçlerini çıkarır.
+
+        Returns:
+            (load_section içerik demeti, CRC32)
+        """
+        limit = get_max_buffer_size()
+        chunker = ContentChunker()
+        features = {}
+        sketches = {}
+        feature_starts = sketch_starts = None
+        kept = []
+        head = tail = carry = b''
+        carry_base = length = crc = 0
+        for piece in pieces:
+            piece = bytes(piece)
+            crc = zlib.crc32(piece, crc)
+            chunker.update(piece)
+            if len(head) < SW_WINDOW_HEAD:
+                head += piece[:SW_WINDOW_HEAD - len(head)]
+            if kept is not None and length + len(piece) > limit:
+                kept = None
+            elif kept is not None:
+                kept.append(piece)
+            length += len(piece)
+            tail = (tail + piece[-SW_WINDOW_TAIL:])[-SW_WINDOW_TAIL:]
+
+            # Son SW_TOKEN_OVERLAP baytta başlayan eşleşmeler sonraki parçayla taranır
+            buffer = carry + piece
+            stop = max(len(buffer) - SW_TOKEN_OVERLAP, 0)
+            feature_ends = self.scan_tokens(buffer, SW_FEATURE_RULES, features, carry_base, feature_starts, stop)
+            sketch_ends = self.scan_tokens(buffer, SW_SKETCH_RULES, sketches, carry_base, sketch_starts, stop)
+            feature_starts = [max(end - stop, 0) for end in feature_ends]
+            sketch_starts = [max(end - stop, 0) for end in sketch_ends]
+            carry = buffer[stop:]
+            carry_base += stop
+        self.scan_tokens(carry, SW_FEATURE_RULES, features, carry_base, feature_starts)
+        self.scan_tokens(carry, SW_SKETCH_RULES, sketches, carry_base, sketch_starts)
+        hashes, sizes = chunker.finish()
+        data = b''.join(kept) if kept is not None else head
+        return (data, hashes, sizes, features, sketches, tail, length), crc
+
+    @staticmethod
+    def scan_tokens(data, rules, tokens, base=0, starts=None, stop=None):
+        """
+        Kuralların eşleşmelerinden belirteçleri tokens'a ekler.
+
+        Args:
+            data: Taranacak veri
+            rules: ((derlenmiş desen, belirteç üreticisi), ...)
+            tokens: {belirteç: [ofset, ...]}; yerinde güncellenir
+            base: Ofsetlere eklenen değer
+            starts: Kural başına taramanın başlayacağı konumlar (None: baştan)
+            stop: Bu konumda veya sonrasında başlayan eşleşmeler alınmaz
+
+        Returns:
+            Kural başına son alınan eşleşmenin bitişi
+        """
+        ends = []
+        for index, (pattern, make_tokens) in enumerate(rules):
+            end = starts[index] if starts else 0
+            for match in pattern.finditer(data, end):
+                if stop is not None and match.start() >= stop:
+                    break
+                for token, offset in make_tokens(match):
+                    tokens.setdefault(token, []).append(base + offset)
+                end = match.end()
+            ends.append(end)
+        return ends
+
+    def section_data(self, f, section):
+        """Bölümün açık verisinin tamamı; bölüm yoksa veya G/Ç tampon sınırını aşıyorsa None."""
+        if section is None:
+            return None
+        content = self.load_section(f, section)
+        return content[0] if len(content[0]) == content[6] else None
+
+    def section_window(self, f, sections, key):
+        """
+        Mantıksal bir pencerenin (özellik ağacı, çizim, geometri) açık verisini döndürür.
+
+        Aday bölümlerden ilk bulunan kullanılır; hiçbiri yoksa en büyük bölüm.
+
+        Returns:
+            (bölüm adı, bayt dizisi)
+        """
+        candidates, start, length = SW_SECTION_WINDOWS[key]
+        name = next((candidate for candidate in candidates if candidate in sections), None)
+        if name is None:
+            name = max(sections, key=lambda section: sections[section]['size'])
+        content = self.load_section(f, sections[name])
+        data = content[0]
+        if start < 0:
+            # Büyük bölümlerde yalnızca baş kısım saklıdır; son pencereler ayrıca tutulur
+            if len(data) < content[6]:
+                data = content[5]
+            start = max(len(data) + start, 0)
+        return name, data[start:start + length]
 
     def parse_features(self, file_path):
-        try:
-            with open(file_path, 'rb') as f:
-                f.seek(self.feature_tree_offset)
-                feature_header = f.read(100)
-                feature_data = f.read(500)
+        """
+        SolidWorks dosyasının karşılaştırma verilerini (profilin sw_data alanı) çıkarır.
 
-                f.seek(self.sketch_data_offset)
-                sketch_data = f.read(1000)
+        Önizleme hash'i yalnızca DIB biçimindeki 'Preview' bölümünden
+        hesaplanır. Yalnızca 'PreviewPNG' bölümü olan dosyalarda PNG çözülmez;
+        hash None olur ve bu dosyaların çiftleri önizleme ön elemesine girmez.
 
-                f.seek(self.geometry_offset, os.SEEK_END)
-                geometry_data = f.read(2000)
+        Returns:
+            Ad/çizim belirteçleri, bölüm dizini, önizleme hash'i ve ham pencereler
+        """
+        feature_window = b''
+        try:
+            with open_mapped(file_path) as f:
+                sections = self.parse_sections(f)
+                window_sections = {}
+                features = {}
+                sketches = {}
+                thumbnail_hash = None
+                if sections:
+                    # Her bölüm dosya başına bir kez açılır; parçaları profille saklanır ve
+                    # çiftler karşılaştırılırken hash'i farklı bölümler bunlarla kıyaslanır.
+                    # Ad belirteçlerinin ofsetleri, bölümlerin dizin sırasıyla art arda
+                    # eklenmiş açık içeriğine göredir.
+                    base = 0
+                    for section in sections.values():
+                        (_, section['chunk_hashes'], section['chunk_sizes'],
+                         section_features, section_sketches, _, length) = self.load_section(f, section)
+                        self.merge_tokens(features, section_features, base)
+                        self.merge_tokens(sketches, section_sketches, base)
+                        base += length
+                    preview = self.section_data(f, sections.get(SW_PREVIEW_SECTION))
+                    if preview is not None:
+                        thumbnail_hash = preview_hash(self.preview_dib(preview))
+                    raw_data = {}
+                    for key in SW_SECTION_WINDOWS:
+                        window_sections[key], raw_data[key] = self.section_window(f, sections, key)
+                    feature_data = raw_data['feature_tree']
+                    feature_window = feature_data
+                else:
+                    # Bölüm dizini yoksa adlar eşlenmiş dosyanın tamamından çıkarılır
+                    features = self.extract_feature_names(f.view)
+                    sketches = self.extract_sketch_data(f.view)
+                    feature_header = f.read(self.feature_tree_offset, 100)
+                    feature_data = f.read(self.feature_tree_offset + 100, 500)
+                    feature_window = (feature_header + feature_data)[:500]
+                    raw_data = {
+                        'feature_tree': feature_data,
+                        'sketch_data': f.read(self.sketch_data_offset, 1000),
+                        'geometry': f.read(self.geometry_offset, 2000)
+                    }
 
-                features = self.extract_feature_names(feature_data)
-                sketches = self.extract_sketch_data(sketch_data)
-                geometry_stats = self.extract_geometry_stats(geometry_data)
+                geometry_stats = self.extract_geometry_stats(raw_data['geometry'])
 
                 return {
                     'features': features,
                     'sketches': sketches,
                     'geometry_stats': geometry_stats,
-                    'raw_data': {
-                        'feature_tree': feature_data,
-                        'sketch_data': sketch_data,
-                        'geometry': geometry_data
-                    }
+                    'sections': sections,
+                    # Gömülü önizlemenin algısal hash'i (önizlemesiz dosyalarda None)
+                    'preview_hash': thumbnail_hash,
+                    # Her pencerenin okunduğu bölüm; hash'i aynıysa pencere karşılaştırılmaz
+                    'window_sections': window_sections,
+                    'feature_window': feature_window,
+                    'raw_data': raw_data
                 }
         except Exception as e:
             logging.error(f"SolidWorks dosya parsing hatası: {e}")
             return {
-                'features': [],
-                'sketches': [],
+                'features': {},
+                'sketches': {},
                 'geometry_stats': {},
+                'sections': {},
+                'preview_hash': None,
+                'window_sections': {},
+                'feature_window': feature_window,
                 'raw_data': {
                     'feature_tree': b'',
                     'sketch_data': b'',
@@ -62,48 +484,78 @@ class SWFileParser:
                 }
             }
 
+    @staticmethod
+    def preview_dib(data):
+        """Önizleme bölümünden uzunluk önekini atarak paketlenmiş DIB'yi döndürür."""
+        length = struct.unpack_from('<I', data)[0] if len(data) >= 4 else 0
+        return data[4:4 + length] if 0 < length <= len(data) - 4 else data
+
+    def read_preview(self, file_path):
+        """
+        Dosyanın gömülü önizleme görüntüsünü (gösterim için) okur.
+
+        Returns:
+            PNG veya BMP dosyası baytları; önizleme yoksa None
+        """
+        try:
+            with open_mapped(file_path) as f:
+                sections = self.parse_sections(f)
+                png = self.section_data(f, sections.get(SW_PREVIEW_PNG_SECTION))
+                if png is not None:
+                    return png
+                preview = self.section_data(f, sections.get(SW_PREVIEW_SECTION))
+                if preview is not None:
+                    return dib_to_bmp(self.preview_dib(preview))
+        except Exception as e:
+            logging.error(f"Önizleme okuma hatası: {e}")
+        return None
+
     def extract_feature_names(self, data):
+        """
+        Verideki özellik/gövde adlarını tek geçişte çıkarır.
+
+        Derlenmiş düzenli ifadeler bayt dizisi, bellek eşlemesi veya
+        memoryview üzerinde doğrudan çalışır; Python düzeyinde bayt döngüsü
+        yoktur.
+
+        Args:
+            data: Taranacak veri
+
+        Returns:
+            {ad: [ofset, ...]} çoklu kümesi
+        """
         try:
-            features = []
-            i = 0
-            while i < len(data):
-                if data[i] > 32 and data[i] < 127:
-                    start = i
-                    while i < len(data) and data[i] > 32 and data[i] < 127:
-                        i += 1
-                    if i - start > 3:
-                        feature_name = data[start:i].decode('ascii', errors='ignore')
-                        features.append({
-                            'name': feature_name,
-                            'offset': start,
-                            'params': {}
-                        })
-                i += 1
+            features = {}
+            self.scan_tokens(data, SW_FEATURE_RULES, features)
             return features
         except Exception as e:
             logging.error(f"Feature çıkarma hatası: {e}")
-            return []
+            return {}
 
     def extract_sketch_data(self, data):
+        """
+        Verideki çizim öğelerini tek geçişte çıkarır.
+
+        Özellik ağacı XML'indeki her çizim adı ve ölçüsü ('Çizim2/D3=80')
+        birer belirteçtir; XML'i olmayan eski dosyalarda çizim öğesi
+        işaretleri kullanılır.
+
+        Returns:
+            {belirteç: [ofset, ...]} çoklu kümesi
+        """
         try:
-            sketches = []
-            markers = [b'SKET', b'LINE', b'CIRC', b'RECT']
-            for marker in markers:
-                pos = 0
-                while True:
-                    pos = data.find(marker, pos)
-                    if pos == -1:
-                        break
-                    sketches.append({
-                        'type': marker.decode('ascii'),
-                        'offset': pos,
-                        'data': data[pos:pos+20]
-                    })
-                    pos += len(marker)
+            sketches = {}
+            self.scan_tokens(data, SW_SKETCH_RULES, sketches)
             return sketches
         except Exception as e:
             logging.error(f"Sketch çıkarma hatası: {e}")
-            return []
+            return {}
+
+    @staticmethod
+    def merge_tokens(tokens, section_tokens, base):
+        """Bir bölümün belirteçlerini ofsetlerini base kadar kaydırarak dosya kümesine ekler."""
+        for name, offsets in section_tokens.items():
+            tokens.setdefault(name, []).extend(offset + base for offset in offsets)
 
     def extract_geometry_stats(self, data):
         try:
@@ -116,7 +568,6 @@ class SWFileParser:
                 pos = data.find(marker)
                 if pos != -1 and pos + len(marker) + 8 <= len(data):
                     try:
-                        import struct
                         if pos + len(marker) + 8 <= len(data):
                             stats['volume'] = abs(struct.unpack('d', data[pos+len(marker):pos+len(marker)+8])[0])
                             break
@@ -133,64 +584,150 @@ class SWFileParser:
             return {'signature': b'', 'data_size': 0, 'volume': 1.0}
 
 class SolidWorksAnalyzer:
-    def __init__(self):
+    def __init__(self, collect_timings=False):
         self.parser = SWFileParser()
+        # Açıksa aşama süreleri sonuçtaki 'timings' anahtarına yazılır
+        self.collect_timings = collect_timings
         self.weights = {
             'feature_tree': 0.5,
             'sketch_data': 0.3,
             'geometry': 0.2,
             'metadata': 0.1
         }
+        # TokenWeights; None ise tüm adlar eşit ağırlıklıdır
+        self.token_weights = None
+
+    def set_token_frequencies(self, frequencies, file_count):
+        """
+        Ad belirteçlerini derlemdeki belge sıklıklarıyla ağırlıklandırır (bkz. TokenWeights).
+
+        Args:
+            frequencies: {ad: adı içeren dosya sayısı}; None ağırlıkları kaldırır
+            file_count: Derlemdeki SolidWorks dosyası sayısı
+        """
+        self.token_weights = TokenWeights(frequencies, file_count) if frequencies is not None else None
+
+    @property
+    def token_fingerprint(self):
+        """Geçerli ad ağırlıklarının parmak izi; ağırlık yoksa boş dizgi."""
+        return self.token_weights.fingerprint if self.token_weights is not None else ''
 
     def read_binary_chunk(self, file_path, offset, size):
         try:
-            with open(file_path, 'rb') as f:
-                if offset < 0:
-                    f.seek(offset, os.SEEK_END)
-                else:
-                    f.seek(offset)
-                return f.read(size)
+            return read_range(file_path, offset, size)
         except Exception as e:
             logging.error(f"Binary chunk okuma hatası: {e}")
             return b''
 
-    def compare_feature_tree(self, file1, file2):
-        return difflib.SequenceMatcher(None,
-            self.read_binary_chunk(file1, 0x1000, 500),
-            self.read_binary_chunk(file2, 0x1000, 500)).ratio() * 100
-
-    def compare_sw_features(self, features1, features2):
+    def compare_sections(self, sections1, sections2):
+        """
+        Bölüm dizinlerini karşılaştırır.
+
+        Hash'i aynı bölümler %100 sayılır; yalnızca hash'i farklı bölümlerin
+        açık içerik parçaları (profilde saklı) karşılaştırılır.
+
+        Returns:
+            (tüm bölümler aynı mı, bölümlerin açık boyut ağırlıklı benzerlik yüzdesi)
+        """
+        total = 0
+        score = 0.0
+        identical = sections1.keys() == sections2.keys()
+        for name in set(sections1) | set(sections2):
+            section1 = sections1.get(name)
+            section2 = sections2.get(name)
+            size = max(section1['size'] if section1 else 0, section2['size'] if section2 else 0, 1)
+            total += size
+            if not (section1 and section2):
+                continue
+            if section1['hash'] == section2['hash']:
+                score += size * 100
+            else:
+                identical = False
+                score += size * chunk_similarity(section1.get('chunk_hashes'), section1.get('chunk_sizes'),
+                                                 section2.get('chunk_hashes'), section2.get('chunk_sizes'))
+        return identical, score / total if total else 0.0
+
+    def unchanged_windows(self, data1, data2):
+        """Aynı adlı ve aynı hash'li bölümden okunan mantıksal pencerelerin adları."""
+        sections1 = data1.get('sections') or {}
+        sections2 = data2.get('sections') or {}
+        unchanged = set()
+        for key, name in (data1.get('window_sections') or {}).items():
+            if (name == (data2.get('window_sections') or {}).get(key) and name in sections1 and
+                    name in sections2 and sections1[name]['hash'] == sections2[name]['hash']):
+                unchanged.add(key)
+        return unchanged
+
+    @staticmethod
+    def multiset_overlap(tokens1, tokens2):
+        """
+        İki {belirteç: [ofset, ...]} çoklu kümesinin kesişimi.
+
+        Küçük küme üzerinde tek geçiş yapılır; maliyet O(n+m)'dir.
+
+        Returns:
+            (ortak belirteç sayısı, ortak farklı belirteç sayısı)
+        """
+        if len(tokens1) > len(tokens2):
+            tokens1, tokens2 = tokens2, tokens1
+        common = 0
+        distinct = 0
+        for name, offsets in tokens1.items():
+            other = tokens2.get(name)
+            if other:
+                common += min(len(offsets), len(other))
+                distinct += 1
+        return common, distinct
+
+    def compare_sw_features(self, features1, features2, weights=None):
+        """
+        Özellik adı çoklu kümelerinin benzerliği.
+
+        Args:
+            weights: TokenWeights (None: set_token_frequencies ile ayarlanan ağırlıklar)
+        """
         if not features1 or not features2:
             return 0.0
 
-        names1 = [f['name'] for f in features1]
-        names2 = [f['name'] for f in features2]
-        name_sim = difflib.SequenceMatcher(None, names1, names2).ratio()
+        if weights is None:
+            weights = self.token_weights
+        common = distinct = 0.0
+        total1 = distinct1 = 0.0
+        for name, offsets in features1.items():
+            weight = weights.get(name) if weights is not None else 1.0
+            distinct1 += weight
+            total1 += weight * len(offsets)
+            other = features2.get(name)
+            if other:
+                distinct += weight
+                common += weight * min(len(offsets), len(other))
+        total2 = distinct2 = 0.0
+        for name, offsets in features2.items():
+            weight = weights.get(name) if weights is not None else 1.0
+            distinct2 += weight
+            total2 += weight * len(offsets)
+        if not distinct1 or not distinct2:
+            return 0.0
 
-        param_sim = 0.0
-        if features1 and features2:
-            param_sim = sum(1 for f1 in features1 for f2 in features2
-                          if f1['name'] == f2['name']) / max(len(features1), len(features2))
+        # Farklı adların ağırlıklı Jaccard benzerliği; tekrar sayıları (revizyonda
+        # eklenen geometri kayıtları) yalnızca küçük dosyanın kapsanma oranı olarak girer
+        name_sim = distinct / (distinct1 + distinct2 - distinct)
+        count_sim = common / min(total1, total2)
 
-        return (name_sim * 0.7 + param_sim * 0.3) * 100
+        return (name_sim * 0.7 + count_sim * 0.3) * 100
 
     def compare_sketches(self, sketches1, sketches2):
+        # İki dosyada da çizim işareti yoksa bileşen ölçülemez (None) ve
+        # toplam skora katılmaz; yalnızca birinde varsa dosyalar farklıdır
+        if not sketches1 and not sketches2:
+            return None
         if not sketches1 or not sketches2:
             return 0.0
 
-        types1 = [s['type'] for s in sketches1]
-        types2 = [s['type'] for s in sketches2]
+        common, _ = self.multiset_overlap(sketches1, sketches2)
+        total = sum(map(len, sketches1.values())) + sum(map(len, sketches2.values()))
 
-        count1 = Counter(types1)
-        count2 = Counter(types2)
-
-        all_types = set(count1.keys()) | set(count2.keys())
-
-        if not all_types:
-            return 0.0
-
-        similarity = sum(min(count1.get(t, 0), count2.get(t, 0)) for t in all_types) / \
-                     sum(max(count1.get(t, 0), count2.get(t, 0)) for t in all_types)
+        similarity = common / (total - common)
 
         return similarity * 100
 
@@ -208,12 +745,104 @@ class SolidWorksAnalyzer:
 
         return (size_sim * 0.6 + sig_sim * 0.4) * 100
 
-    def compare(self, file1, file2):
+    def component_scores(self, data1, data2, unchanged, timer, token_weights=None):
+        """Özellik, çizim ve geometri benzerlikleri (profildeki verilerle, ucuz)."""
+        # Ad ve çizim belirteçleri dosyanın tamamından çıkarıldığından pencere
+        # bölümünün aynı olması bunların aynı olduğu anlamına gelmez
+        with timer.stage('features'):
+            feature_similarity = self.compare_sw_features(data1['features'], data2['features'], token_weights)
+        with timer.stage('sketches'):
+            sketch_similarity = self.compare_sketches(data1['sketches'], data2['sketches'])
+        with timer.stage('geometry'):
+            geometry_similarity = (100.0 if 'geometry' in unchanged else
+                                   self.compare_geometry(data1['geometry_stats'], data2['geometry_stats']))
+        return {
+            'feature_tree': feature_similarity,
+            'sketch_data': sketch_similarity,
+            'geometry': geometry_similarity
+        }
+
+    def weighted_total(self, scores):
+        """Bileşen skorlarının ağırlıklı ortalaması; ölçülemeyen (None) bileşenler atlanır."""
+        measured = [key for key in ('feature_tree', 'sketch_data', 'geometry') if scores.get(key) is not None]
+        total_weight = sum(self.weights[key] for key in measured)
+        if not total_weight:
+            return 0.0
+        return sum(scores[key] * self.weights[key] for key in measured) / total_weight
+
+    @staticmethod
+    def combine_scores(component_score, raw_score, size_similarity):
+        """Bileşen, ham fark ve boyut benzerliklerinden son skor (SW_SCORE_WEIGHTS)."""
+        return (component_score * SW_SCORE_WEIGHTS['components'] +
+                raw_score * SW_SCORE_WEIGHTS['raw'] +
+                size_similarity * SW_SCORE_WEIGHTS['size'])
+
+    def compare(self, file1, file2, token_weights=None):
+        """
+        İki SolidWorks dosyasını karşılaştırır.
+
+        Args:
+            token_weights: Bu çift için ad ağırlıkları (TokenWeights); None ise
+                set_token_frequencies ile ayarlananlar kullanılır
+        """
+        timer = make_timer(self.collect_timings)
         try:
-            data1 = self.parser.parse_features(file1)
-            data2 = self.parser.parse_features(file2)
+            with timer.stage('profile'):
+                profile1 = ensure_profile(file1, 'solidworks', self.parser)
+                profile2 = ensure_profile(file2, 'solidworks', self.parser)
+            for profile in (profile1, profile2):
+                if profile.error:
+                    raise OSError(profile.error)
+                if profile.sw_data is None:
+                    with timer.stage('sw_parse'):
+                        profile.sw_data = self.parser.parse_features(profile.path)
+            data1 = profile1.sw_data
+            data2 = profile2.sw_data
+
+            size1 = profile1.size
+            size2 = profile2.size
+            size_ratio = min(size1, size2) / max(size1, size2) if max(size1, size2) > 0 else 0
+            size_similarity = size_ratio * 100
+
+            distance = hamming_distance(data1.get('preview_hash'), data2.get('preview_hash'))
+            preview_similarity = None if distance is None else (1 - distance / HASH_BITS) * 100
+
+            # Bölüm dizini olan dosyalarda yalnızca hash'i farklı bölümler karşılaştırılır
+            unchanged = self.unchanged_windows(data1, data2)
+            scores = None
+            if distance is not None and distance > PREVIEW_DIFFERENT_DISTANCE:
+                # Önizlemeler açıkça farklı: ucuz bileşenler hesaplanır, bölüm ve
+                # ham farkların en iyi durumda %100 çıkacağı varsayılır. Bu üst
+                # sınır bile "Farklı Dosyalar" bandında kalırsa pahalı
+                # karşılaştırmalar yapılmaz; skor olarak üst sınır döner.
+                scores = self.component_scores(data1, data2, unchanged, timer, token_weights)
+                estimate = self.combine_scores(self.weighted_total(scores), 100, size_similarity)
+                if estimate < SW_DIFFERENT_SCORE:
+                    return {
+                        'score': estimate,
+                        'details': scores,
+                        'size_similarity': size_similarity,
+                        'preview': preview_similarity,
+                        'prefiltered': True,
+                        'match': False,
+                        'type': 'solidworks',
+                        'metadata': size_similarity,
+                        'hash': 0,
+                        'content': self.weighted_total(scores),
+                        'structure': scores['feature_tree'],
+                        'timings': timer.stages
+                    }
 
-            binary_similarity = self.compare_feature_tree(file1, file2)
+            section_similarity = None
+            if data1.get('sections') and data2.get('sections'):
+                with timer.stage('sections'):
+                    identical, section_similarity = self.compare_sections(data1['sections'], data2['sections'])
+                binary_similarity = 100.0 if identical else 0.0
+            else:
+                with timer.stage('feature_window'):
+                    binary_similarity = difflib.SequenceMatcher(None,
+                        data1.get('feature_window', b''),
+                        data2.get('feature_window', b'')).ratio() * 100
 
             if binary_similarity > 99.5:
                 return {
@@ -225,114 +854,137 @@ class SolidWorksAnalyzer:
                     },
                     'size_similarity': 100.0,
                     'match': True,
-                    'type': 'solidworks'
+                    'type': 'solidworks',
+                    'timings': timer.stages
                 }
 
-            feature_similarity = self.compare_sw_features(data1['features'], data2['features'])
-            sketch_similarity = self.compare_sketches(data1['sketches'], data2['sketches'])
-            geometry_similarity = self.compare_geometry(data1['geometry_stats'], data2['geometry_stats'])
+            if scores is None:
+                scores = self.component_scores(data1, data2, unchanged, timer, token_weights)
+            feature_similarity = scores['feature_tree']
 
             raw_comparisons = {}
-            for key in data1.get('raw_data', {}):
-                if key in data2.get('raw_data', {}):
-                    try:
-                        seq = difflib.SequenceMatcher(None, data1['raw_data'][key], data2['raw_data'][key])
-                        raw_comparisons[key] = seq.ratio() * 100
-                    except Exception as e:
-                        logging.error(f"Raw comparison error for key {key}: {e}")
-                        raw_comparisons[key] = 0
-
-            size1 = os.path.getsize(file1)
-            size2 = os.path.getsize(file2)
-            size_ratio = min(size1, size2) / max(size1, size2) if max(size1, size2) > 0 else 0
-            size_similarity = size_ratio * 100
-
-            detailed_results = {
-                'feature_tree': feature_similarity,
-                'sketch_data': sketch_similarity,
-                'geometry': geometry_similarity
-            }
-
-            total_score = (
-                feature_similarity * self.weights['feature_tree'] +
-                sketch_similarity * self.weights['sketch_data'] +
-                geometry_similarity * self.weights['geometry']
-            ) / (self.weights['feature_tree'] + self.weights['sketch_data'] + self.weights['geometry'])
+            if section_similarity is not None:
+                raw_comparisons['sections'] = section_similarity
+            with timer.stage('raw_diff'):
+                for key in data1.get('raw_data', {}):
+                    if key in unchanged:
+                        raw_comparisons[key] = 100.0
+                    elif key in data2.get('raw_data', {}):
+                        try:
+                            seq = difflib.SequenceMatcher(None, data1['raw_data'][key], data2['raw_data'][key])
+                            raw_comparisons[key] = seq.ratio() * 100
+                        except Exception as e:
+                            logging.error(f"Raw comparison error for key {key}: {e}")
+                            raw_comparisons[key] = 0
+
+            total_score = self.weighted_total(scores)
 
             raw_score = sum(raw_comparisons.values()) / len(raw_comparisons) if raw_comparisons else 0
 
-            final_score = total_score * 0.8 + raw_score * 0.15 + size_similarity * 0.05
+            final_score = self.combine_scores(total_score, raw_score, size_similarity)
 
             is_match = final_score > 98
 
             return {
                 'score': final_score,
-                'details': detailed_results,
+                'details': scores,
                 'raw_comparisons': raw_comparisons,
                 'size_similarity': size_similarity,
+                'preview': preview_similarity,
                 'match': is_match,
                 'type': 'solidworks',
                 'metadata': size_similarity,
                 'hash': 100 if is_match else 0,
                 'content': total_score,
-                'structure': feature_similarity
+                'structure': feature_similarity,
+                'timings': timer.stages
             }
         except Exception as e:
             logging.error(f"SolidWorks karşılaştırma hatası: {e}")
-            return {'score': 0, 'match': False, 'type': 'solidworks', 'details': {}}
+            return {'score': 0, 'match': False, 'type': 'solidworks', 'details': {}, 'timings': timer.stages}
 
 class GeneralComparator:
-    def __init__(self):
-        pass
-
-    def compare(self, file1, file2):
-        try:
-            from .utils import (
-                compare_binary_content, calculate_file_signature,
-                calculate_entropy, compare_signatures, compare_entropy
-            )
-
-            # Temel dosya bilgilerini al
-            stat1 = os.stat(file1)
-            stat2 = os.stat(file2)
-
-            # Boyut benzerliği
-            size_diff = abs(stat1.st_size - stat2.st_size)
-            max_size = max(stat1.st_size, stat2.st_size)
-            size_similarity = (1 - (size_diff / max_size)) * 100 if max_size > 0 else 0
+    # İçerik benzerliği motorları:
+    #   'cdc'    - içerik tanımlı parçaların ağırlıklı Jaccard benzerliği (profilden)
+    #   'blocks' - aynı sıradaki blokların difflib ile karşılaştırılması (eski yöntem)
+    CONTENT_ENGINES = ('cdc', 'blocks')
+
+    def __init__(self, content_engines=None, default_content_engine='cdc', collect_timings=False):
+        # Dosya tipine göre içerik motoru seçimi (çiftin ilk dosyasının tipi)
+        self.content_engines = {
+            'cad': 'cdc',
+            'document': 'cdc',
+            'image': 'cdc'
+        }
+        self.content_engines.update(content_engines or {})
+        self.default_content_engine = default_content_engine
+        # Açıksa aşama süreleri sonuçtaki 'timings' anahtarına yazılır
+        self.collect_timings = collect_timings
 
-            # Zaman benzerliği
-            time_diff = abs(stat1.st_mtime - stat2.st_mtime)
-            time_similarity = max(0, 100 - (time_diff / 86400 * 100)) if time_diff < 86400 else 0
+    def get_content_engine(self, file_type):
+        engine = self.content_engines.get(file_type, self.default_content_engine)
+        return engine if engine in self.CONTENT_ENGINES else 'cdc'
 
-            # İçerik benzerliği - geliştirilmiş blok tabanlı karşılaştırma
-            content_similarity = compare_binary_content(file1, file2, block_size=2048)
+    def compare_content(self, profile1, profile2):
+        from .utils import compare_binary_content
+        from .chunking import chunk_similarity
 
-            # İmza karşılaştırması
-            signature_similarity = compare_signatures(file1, file2)
+        if self.get_content_engine(profile1.file_type) == 'blocks':
+            return compare_binary_content(profile1.path, profile2.path, block_size=2048)
+        return chunk_similarity(profile1.chunk_hashes, profile1.chunk_sizes,
+                                profile2.chunk_hashes, profile2.chunk_sizes)
 
-            # Entropi karşılaştırması
-            entropy_similarity = compare_entropy(file1, file2)
+    def compare(self, file1, file2):
+        timer = make_timer(self.collect_timings)
+        try:
+            from .utils import entropy_similarity, histogram_similarity
+
+            # Temel dosya bilgileri profilden gelir
+            with timer.stage('profile'):
+                profile1 = ensure_profile(file1)
+                profile2 = ensure_profile(file2)
+            for profile in (profile1, profile2):
+                if profile.error:
+                    raise OSError(profile.error)
+
+            with timer.stage('metadata'):
+                # Boyut benzerliği
+                size_diff = abs(profile1.size - profile2.size)
+                max_size = max(profile1.size, profile2.size)
+                size_similarity = (1 - (size_diff / max_size)) * 100 if max_size > 0 else 0
+
+                # Zaman benzerliği
+                time_diff = abs(profile1.mtime - profile2.mtime)
+                time_similarity = max(0, 100 - (time_diff / 86400 * 100)) if time_diff < 86400 else 0
+
+            # İçerik benzerliği - dosya tipine göre seçilen motor
+            with timer.stage('content'):
+                content_similarity = self.compare_content(profile1, profile2)
+
+            with timer.stage('structure'):
+                # İmza karşılaştırması
+                signature_similarity = 100 if profile1.signature == profile2.signature else 0
+
+                # Entropi karşılaştırması
+                entropy_similarity_score = entropy_similarity(profile1.entropy, profile2.entropy)
+                byte_distribution_similarity = histogram_similarity(profile1.histogram, profile2.histogram)
 
             # Hash karşılaştırması
             hash_match = False
             hash_score = 0
-            if size_similarity > 99:
-                try:
-                    hash1 = hashlib.md5(open(file1, 'rb').read()).hexdigest()
-                    hash2 = hashlib.md5(open(file2, 'rb').read()).hexdigest()
-                    hash_match = (hash1 == hash2)
+            with timer.stage('hash'):
+                if size_similarity > 99 and profile1.md5 and profile2.md5:
+                    hash_match = (profile1.md5 == profile2.md5)
                     hash_score = 100 if hash_match else 0
-                except Exception as e:
-                    logging.error(f"Hash hesaplama hatası: {e}")
 
             # Metadata skoru
             metadata_score = (size_similarity * 0.7 + time_similarity * 0.3)
 
             # Yapı skoru (bu durumda entropi benzerliği)
-            structure_score = entropy_similarity
+            structure_score = entropy_similarity_score
 
             # Toplam skor hesaplama - ağırlıklı ortalama
+            # (eşik budaması için pairing.GENERAL_WEIGHTS ile uyumlu tutulmalı)
             total_score = (
                 metadata_score * 0.25 +
                 hash_score * 0.25 +
@@ -345,21 +997,23 @@ class GeneralComparator:
                 'size_similarity': size_similarity,
                 'time_similarity': time_similarity,
                 'content_similarity': content_similarity,
-                'entropy_similarity': entropy_similarity,
+                'entropy_similarity': entropy_similarity_score,
+                'histogram_similarity': byte_distribution_similarity,
                 'signature_similarity': signature_similarity,
                 'match': hash_match,
                 'type': 'general',
                 'metadata': metadata_score,
                 'hash': hash_score,
                 'content': content_similarity,
-                'structure': structure_score
+                'structure': structure_score,
+                'timings': timer.stages
             }
         except Exception as e:
             logging.error(f"Genel karşılaştırma hatası: {e}")
-            return {'score': 0, 'match': False, 'type': 'general'}
+            return {'score': 0, 'match': False, 'type': 'general', 'timings': timer.stages}
 
 class FileComparator:
-    def __init__(self):
+    def __init__(self, collect_timings=False):
         self.supported_extensions = {
             'solidworks': ['.sldprt', '.sldasm', '.slddrw'],
             'cad': ['.step', '.stp', '.iges', '.igs', '.stl', '.obj', '.dxf'],
@@ -371,18 +1025,85 @@ class FileComparator:
         self.general_comparator = GeneralComparator()
         for exts in self.supported_extensions.values():
             self.supported_extensions['all'].extend(exts)
-
-    def compare_files(self, file1, file2):
+        self.set_collect_timings(collect_timings)
+
+    def set_collect_timings(self, enabled):
+        """
+        Aşama sürelerinin ölçülmesini açar/kapatır.
+
+        Açıkken her sonucun details['timings'] alanı aşama başına saniye
+        içerir; kapalıyken ölçüm yapılmaz ve alan None olur.
+        """
+        self.collect_timings = enabled
+        self.solidworks_comparator.collect_timings = enabled
+        self.general_comparator.collect_timings = enabled
+
+    def set_token_corpus(self, profiles):
+        """
+        SolidWorks ad belirteçlerinin ağırlıklarını taranan dosyalardan hesaplar.
+
+        Her adın kaç dosyada geçtiği sayılır; her dosyada geçen adlar
+        karşılaştırmada sayılmaz (bkz. TokenWeights).
+        """
+        frequencies = {}
+        file_count = 0
+        for profile in profiles:
+            features = (profile.sw_data or {}).get('features') if profile.file_type == 'solidworks' else None
+            if not features:
+                continue
+            file_count += 1
+            for name in features:
+                frequencies[name] = frequencies.get(name, 0) + 1
+        self.solidworks_comparator.set_token_frequencies(frequencies, file_count)
+
+    def get_file_type(self, file_path):
+        ext = os.path.splitext(file_path)[1].lower()
+        for file_type, exts in self.supported_extensions.items():
+            if file_type != 'all' and ext in exts:
+                return file_type
+        return 'general'
+
+    def build_profile(self, file_path, cache=None, stat=None):
+        """Dosyanın tarama boyunca kullanılacak profilini çıkarır."""
+        return build_profile(file_path, self.get_file_type(file_path),
+                             self.solidworks_comparator.parser, cache, stat)
+
+    def compare_files(self, file1, file2, token_weights=None):
+        """
+        İki dosyayı (yol veya FileProfile) karşılaştırır.
+
+        Args:
+            token_weights: SolidWorks ad ağırlıkları (TokenWeights); None ise
+                taramanın set_token_corpus ile ayarladığı ağırlıklar kullanılır.
+                Karşılaştırıcının paylaşılan durumu değiştirilmez.
+        """
+        timer = make_timer(self.collect_timings)
+        started = time.perf_counter() if timer.enabled else 0
         try:
+            with timer.stage('profile'):
+                profile1 = file1 if isinstance(file1, FileProfile) else self.build_profile(file1)
+                profile2 = file2 if isinstance(file2, FileProfile) else self.build_profile(file2)
+            file1, file2 = profile1.path, profile2.path
+
+            # Bayt bayt aynı dosyalar için ayrıntılı karşılaştırmaya gerek yok
+            if self.is_exact_duplicate(profile1, profile2):
+                return self.exact_match_result(profile1, profile2)
+
             ext = os.path.splitext(file1)[1].lower()
             if ext in self.supported_extensions['solidworks']:
-                result = self.solidworks_comparator.compare(file1, file2)
+                result = self.solidworks_comparator.compare(profile1, profile2, token_weights)
                 file_type = 'solidworks'
             else:
-                result = self.general_comparator.compare(file1, file2)
+                result = self.general_comparator.compare(profile1, profile2)
                 file_type = result.get('type', 'general')
 
-            category = self.classify_result(result['score'], result.get('match', False), file_type)
+            with timer.stage('classify'):
+                category = self.classify_result(result['score'], result.get('match', False), file_type)
+            if timer.enabled:
+                # Alt karşılaştırıcının aşamaları bu çiftin aşamalarıyla birleştirilir
+                timer.merge(result.get('timings'))
+                timer.stages['total'] = time.perf_counter() - started
+                result['timings'] = timer.stages
             return {
                 'file1': file1,
                 'file2': file2,
@@ -393,35 +1114,74 @@ class FileComparator:
             }
         except Exception as e:
             logging.error(f"Dosya karşılaştırma hatası: {e}")
-            return {'file1': file1, 'file2': file2, 'error': str(e)}
+            return {'file1': getattr(file1, 'path', file1), 'file2': getattr(file2, 'path', file2), 'error': str(e)}
+
+    def is_exact_duplicate(self, profile1, profile2):
+        return (not profile1.error and not profile2.error and profile1.size > 0
+                and profile1.size == profile2.size and bool(profile1.md5)
+                and profile1.md5 == profile2.md5)
+
+    def exact_match_result(self, profile1, profile2):
+        """Tam içerik hash'i aynı olan iki dosya için doğrudan sonuç üretir."""
+        ext = os.path.splitext(profile1.path)[1].lower()
+        file_type = 'solidworks' if ext in self.supported_extensions['solidworks'] else 'general'
+
+        time_diff = abs(profile1.mtime - profile2.mtime)
+        time_similarity = max(0, 100 - (time_diff / 86400 * 100)) if time_diff < 86400 else 0
+
+        result = {
+            'score': 100.0,
+            'size_similarity': 100.0,
+            'time_similarity': time_similarity,
+            'match': True,
+            'type': file_type,
+            'exact_duplicate': True,
+            'metadata': 100.0 * 0.7 + time_similarity * 0.3,
+            'hash': 100,
+            'content': 100.0,
+            'structure': 100.0
+        }
+        if file_type == 'solidworks':
+            result['details'] = {
+                'feature_tree': 100.0,
+                'sketch_data': 100.0,
+                'geometry': 100.0
+            }
+        return {
+            'file1': profile1.path,
+            'file2': profile2.path,
+            'total': 100.0,
+            'category': self.classify_result(100.0, True, file_type),
+            'file_type': file_type,
+            'details': result
+        }
 
     def detect_manipulation(self, file1, file2, comparison_results):
         try:
-            from .utils import calculate_entropy, calculate_file_signature
-
-            stat1 = os.stat(file1)
-            stat2 = os.stat(file2)
+            profile1 = file1 if isinstance(file1, FileProfile) else self.build_profile(file1)
+            profile2 = file2 if isinstance(file2, FileProfile) else self.build_profile(file2)
+            for profile in (profile1, profile2):
+                if profile.error:
+                    raise OSError(profile.error)
 
             # Temel göstergeler
             indicators = {
-                'size_ratio': min(stat1.st_size, stat2.st_size) / max(stat1.st_size, stat2.st_size) if max(stat1.st_size, stat2.st_size) > 0 else 0,
-                'time_diff': 1 - (abs(stat1.st_mtime - stat2.st_mtime) / 86400 if abs(stat1.st_mtime - stat2.st_mtime) < 86400 else 0),
+                'size_ratio': min(profile1.size, profile2.size) / max(profile1.size, profile2.size) if max(profile1.size, profile2.size) > 0 else 0,
+                'time_diff': 1 - (abs(profile1.mtime - profile2.mtime) / 86400 if abs(profile1.mtime - profile2.mtime) < 86400 else 0),
                 'content_injection': max(0, comparison_results.get('content', 0) - comparison_results.get('hash', 0)) / 100,
-                'rename_pattern': difflib.SequenceMatcher(None, os.path.basename(file1), os.path.basename(file2)).ratio()
+                'rename_pattern': difflib.SequenceMatcher(None, profile1.name, profile2.name).ratio()
             }
 
             # Gelişmiş göstergeler
             try:
                 # Entropi farkı - manipüle edilmiş dosyalarda entropi değişimi olabilir
-                entropy1 = calculate_entropy(file1)
-                entropy2 = calculate_entropy(file2)
+                entropy1 = profile1.entropy
+                entropy2 = profile2.entropy
                 entropy_diff = abs(entropy1 - entropy2) / max(entropy1, entropy2) if max(entropy1, entropy2) > 0 else 0
                 indicators['entropy_diff'] = 1 - entropy_diff  # Yüksek değer benzerliği gösterir
 
                 # İmza karşılaştırması - dosya başlangıcı değiştirilmiş mi?
-                sig1 = calculate_file_signature(file1)
-                sig2 = calculate_file_signature(file2)
-                indicators['signature_match'] = 1.0 if sig1 == sig2 else 0.0
+                indicators['signature_match'] = 1.0 if profile1.signature == profile2.signature else 0.0
 
                 # Metadata tutarsızlığı - dosya boyutu ve içerik arasında tutarsızlık var mı?
                 metadata_content_consistency = 1.0 - abs(indicators['size_ratio'] - (comparison_results.get('content', 0) / 100))
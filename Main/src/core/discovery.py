@@ -0,0 +1,299 @@
+# Main/src/core/discovery.py
+import os
+import re
+import queue
+import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from .tracing import NULL_TRACER
+
+# Varsayılan dışlama kuralları: SolidWorks/Office kilit dosyaları, otomatik
+# kurtarma ve yedek kopyaları, yedek klasörleri
+DEFAULT_EXCLUDES = [
+    '~$*',
+    '.~lock.*',
+    'Backup of *',
+    'Backup (*) of *',
+    'AutoRecover of *',
+    '*.bak',
+    'backup/',
+    'backups/',
+]
+
+# Aynı anda listelenen en fazla klasör sayısı (os.scandir GIL'i bırakır)
+DEFAULT_WALK_WORKERS = 8
+
+
+def _translate(pattern):
+    """gitignore glob ifadesini ('*', '?', '**', '[...]') düzenli ifadeye çevirir."""
+    i = 0
+    n = len(pattern)
+    out = []
+    while i < n:
+        if pattern.startswith('**/', i):
+            out.append('(?:.*/)?')
+            i += 3
+            continue
+        if pattern.startswith('**', i):
+            out.append('.*')
+            i += 2
+            continue
+        c = pattern[i]
+        if c == '*':
+            out.append('[^/]*')
+        elif c == '?':
+            out.append('[^/]')
+        elif c == '[':
+            end = pattern.find(']', i + 2)
+            if end == -1:
+                out.append(re.escape(c))
+            else:
+                body = pattern[i + 1:end]
+                if body.startswith('!'):
+                    body = '^' + body[1:]
+                out.append('[' + body.replace('\\', '\\\\') + ']')
+                i = end
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return ''.join(out)
+
+
+class IgnoreRules:
+    """
+    gitignore benzeri dışlama kuralları.
+
+    - '#' ile başlayan ve boş satırlar yok sayılır
+    - '!' ile başlayan kural daha önce dışlananı geri alır (son eşleşen kazanır)
+    - '/' ile biten kural yalnızca klasörlere uyar
+    - Ortasında veya başında '/' olan kural köke göre, diğerleri her
+      derinlikte dosya/klasör adına uyar
+    - '**' herhangi sayıda klasör, '*' ve '?' tek bir yol parçası içinde eşleşir
+
+    Windows kasalarında büyük/küçük harf ayrımı olmadığından eşleşme de
+    harf duyarsızdır. Dışlanan klasörün içine hiç girilmez.
+    """
+
+    def __init__(self, patterns=()):
+        self.rules = []
+        for pattern in patterns:
+            self.add(pattern)
+
+    def add(self, pattern):
+        pattern = pattern.strip()
+        if not pattern or pattern.startswith('#'):
+            return
+        negate = pattern.startswith('!')
+        if negate:
+            pattern = pattern[1:]
+        dir_only = pattern.endswith('/')
+        pattern = pattern.rstrip('/')
+        if not pattern:
+            return
+        if '/' in pattern:
+            regex = '^' + _translate(pattern.lstrip('/')) + '$'
+        else:
+            regex = '^(?:.*/)?' + _translate(pattern) + '$'
+        self.rules.append((re.compile(regex, re.IGNORECASE), negate, dir_only))
+
+    def __bool__(self):
+        return bool(self.rules)
+
+    def ignored(self, rel_path, is_dir=False):
+        """
+        Köke göre '/' ayraçlı yolun dışlanıp dışlanmadığını döndürür.
+
+        Args:
+            rel_path: Tarama köküne göre göreli yol ('alt/klasör/dosya.sldprt')
+            is_dir: Yol bir klasör mü
+        """
+        result = False
+        for regex, negate, dir_only in self.rules:
+            if dir_only and not is_dir:
+                continue
+            if regex.match(rel_path):
+                result = not negate
+        return result
+
+
+def load_ignore_file(path):
+    """Bir .gitignore biçimli dosyanın satırlarını döndürür; okunamazsa boş liste."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read().splitlines()
+    except Exception as e:
+        logging.error(f"Dışlama dosyası okunamadı ({path}): {e}")
+        return []
+
+
+class FileFilter:
+    """
+    Keşif sırasında uygulanan dışlama kuralları, uzantı, boyut ve tarih filtreleri.
+
+    Args:
+        excludes: gitignore biçimli dışlama kuralları
+        extensions: Kabul edilen uzantılar ('.sldprt'); boşsa tümü
+        min_size / max_size: Bayt cinsinden boyut sınırları
+        modified_after / modified_before: Değiştirilme zamanı sınırları (epoch saniye)
+    """
+
+    def __init__(self, excludes=(), extensions=(), min_size=None, max_size=None,
+                 modified_after=None, modified_before=None):
+        self.rules = IgnoreRules(excludes)
+        self.extensions = {ext.lower() for ext in extensions}
+        self.min_size = min_size
+        self.max_size = max_size
+        self.modified_after = modified_after
+        self.modified_before = modified_before
+
+    def accepts_name(self, name):
+        return not self.extensions or os.path.splitext(name)[1].lower() in self.extensions
+
+    def accepts_stat(self, stat):
+        if self.min_size is not None and stat.st_size < self.min_size:
+            return False
+        if self.max_size is not None and stat.st_size > self.max_size:
+            return False
+        if self.modified_after is not None and stat.st_mtime < self.modified_after:
+            return False
+        if self.modified_before is not None and stat.st_mtime > self.modified_before:
+            return False
+        return True
+
+
+def _scan_directory(path, rel, file_filter, recursive, tracer):
+    """
+    Tek bir klasörü os.scandir ile listeler.
+
+    Returns:
+        ([(dosya yolu, stat), ...], [(alt klasör yolu, göreli yol), ...])
+    """
+    files = []
+    subdirs = []
+    with tracer.span('scandir', 'io', {'path': path} if tracer.enabled else None):
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    rel_path = rel + entry.name
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive and not file_filter.rules.ignored(rel_path, True):
+                                subdirs.append((entry.path, rel_path + '/'))
+                        elif entry.is_file():
+                            if not file_filter.accepts_name(entry.name):
+                                continue
+                            if file_filter.rules and file_filter.rules.ignored(rel_path, False):
+                                continue
+                            # DirEntry.stat() Windows'ta listelemeyle gelir, diğer
+                            # sistemlerde bir kez çağrılır ve önbelleğe alınır
+                            stat = entry.stat()
+                            if file_filter.accepts_stat(stat):
+                                files.append((entry.path, stat))
+                    except OSError as e:
+                        logging.error(f"Dosya bilgisi okunamadı ({entry.path}): {e}")
+        except OSError as e:
+            logging.error(f"Klasör listelenemedi ({path}): {e}")
+    # Listeleme sırası dosya sistemine bağlıdır; ad sırası taramalar arasında sabittir
+    files.sort(key=lambda item: item[0])
+    subdirs.sort()
+    return files, subdirs
+
+
+def walk_files(root, file_filter=None, recursive=True, workers=DEFAULT_WALK_WORKERS,
+               should_stop=None, tracer=NULL_TRACER):
+    """
+    Klasör ağacını paralel olarak dolaşır ve her klasörün dosyalarını üretir.
+
+    Alt klasörler iş parçacığı havuzunda aynı anda listelenir, ancak sonuçlar
+    gönderilme sırasıyla (genişlik öncelikli, klasör içinde ada göre) (yol,
+    stat) listeleri olarak verilir. Böylece dosya sırası, dolayısıyla profil
+    sırası ve çiftlerin yönü, iş parçacıklarının bitiş sırasından bağımsız
+    olarak her taramada aynıdır.
+
+    Args:
+        root: Tarama kökü
+        file_filter: FileFilter (None: her dosya kabul edilir)
+        recursive: Alt klasörlere inilsin mi
+        workers: Aynı anda listelenen klasör sayısı
+        should_stop: İptal kontrolü yapan fonksiyon
+        tracer: İzleme kayıtçısı
+    """
+    file_filter = file_filter or FileFilter()
+    executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix='discovery')
+    try:
+        pending = deque([executor.submit(_scan_directory, root, '', file_filter, recursive, tracer)])
+        while pending:
+            # Sıradaki klasör beklenirken sonrakiler havuzda listelenmeye devam eder
+            files, subdirs = pending.popleft().result()
+            if should_stop is not None and should_stop():
+                return
+            for path, rel in subdirs:
+                pending.append(executor.submit(_scan_directory, path, rel, file_filter, recursive, tracer))
+            if files:
+                yield files
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+class FileDiscovery:
+    """
+    walk_files'ı arka plan thread'inde çalıştırıp sonuçları kuyruğa akıtır.
+
+    Böylece profil çıkarma, ağacın tamamı listelenmeden ilk dosyalarla
+    başlar ve keşif profil çıkarmayla eş zamanlı sürer.
+    """
+
+    def __init__(self, root, file_filter=None, recursive=True, workers=DEFAULT_WALK_WORKERS,
+                 tracer=NULL_TRACER):
+        self.root = root
+        self.file_filter = file_filter
+        self.recursive = recursive
+        self.workers = workers
+        self.tracer = tracer
+        self.finished = False
+        self._queue = queue.Queue()
+        self._stopped = False
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name='FileDiscovery', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stopped = True
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self):
+        try:
+            for files in walk_files(self.root, self.file_filter, self.recursive, self.workers,
+                                    lambda: self._stopped, self.tracer):
+                self._queue.put(files)
+        except Exception as e:
+            logging.error(f"Dosya keşfi hatası: {e}")
+        finally:
+            self._queue.put(None)
+
+    def drain(self, block=True):
+        """
+        Kuyruktaki tüm dosyaları döndürür.
+
+        Args:
+            block: Kuyruk boşsa yeni dosya veya keşfin bitmesi beklenir
+
+        Returns:
+            [(yol, stat), ...]; keşif bittiyse ve kuyruk boşsa boş liste
+        """
+        entries = []
+        while not self.finished:
+            try:
+                batch = self._queue.get(block=block and not entries)
+            except queue.Empty:
+                break
+            if batch is None:
+                self.finished = True
+            else:
+                entries.extend(batch)
+        return entries
@@ -0,0 +1,252 @@
+# Main/src/core/engine.py
+import os
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from . import fileio
+from .timing import TimingSummary
+from .tracing import NULL_TRACER, make_tracer, WorkerProfiler
+
+# Bir işçiye tek seferde gönderilen yaklaşık çift sayısı
+DEFAULT_CHUNK_SIZE = 64
+
+# İptal/ilerleme kontrolü için bekleme aralığı (saniye)
+POLL_INTERVAL = 0.2
+
+# İşçi sürecindeki durum (_init_worker ile doldurulur)
+_worker_state = {}
+
+
+def _init_worker(comparator, profiles, cancel_event, max_buffer_size, trace=False, profile_dir=None):
+    fileio.set_max_buffer_size(max_buffer_size)
+    _worker_state['comparator'] = comparator
+    _worker_state['profiles'] = profiles
+    _worker_state['cancel_event'] = cancel_event
+    _worker_state['tracer'] = make_tracer(trace, f"worker {os.getpid()}")
+    _worker_state['profiler'] = WorkerProfiler(profile_dir, 'worker') if profile_dir else None
+
+
+def _compare_chunk_in_worker(chunk, min_similarity):
+    fileio.reset_io_stats()
+    comparator = _worker_state['comparator']
+    timings = TimingSummary() if getattr(comparator, 'collect_timings', False) else None
+    tracer = _worker_state['tracer']
+    profiler = _worker_state['profiler']
+    if profiler is not None:
+        with profiler:
+            result = compare_chunk(
+                comparator, _worker_state['profiles'], chunk,
+                min_similarity, _worker_state['cancel_event'].is_set, timings, tracer
+            )
+        # İşçi süreçlerinin çıkışta çalışan bir kancası yok; dosya her parçada güncellenir
+        profiler.dump()
+    else:
+        result = compare_chunk(
+            comparator, _worker_state['profiles'], chunk,
+            min_similarity, _worker_state['cancel_event'].is_set, timings, tracer
+        )
+    # İşçide yapılan okumalar, süre özeti ve iz olayları ana sürece sonuçla birlikte döner
+    return (result, fileio.io_stats(), timings.to_dict() if timings is not None else None,
+            tracer.drain())
+
+
+def compare_chunk(comparator, profiles, chunk, min_similarity, should_stop=None, timings=None,
+                  tracer=NULL_TRACER):
+    """
+    Bir parça içindeki tüm çiftleri karşılaştırır.
+
+    Args:
+        comparator: FileComparator örneği
+        profiles: Dosya profilleri listesi
+        chunk: (i, js) satırlarından oluşan liste
+        min_similarity: Sonuçlara eklenecek minimum toplam skor
+        should_stop: İptal kontrolü yapan fonksiyon (her çiftte çağrılır)
+        timings: Verilirse eşiği geçmeyenler dahil tüm çiftlerin aşama
+            süreleri bu TimingSummary'ye eklenir
+        tracer: İzleme açıksa parça ve her çift için bir aralık kaydedilir
+
+    Returns:
+        (işlenen çift sayısı, işlenen bayt, eşiği geçen sonuçlar); işlenen
+        bayt her çift için iki dosyanın boyutları toplamıdır
+    """
+    with tracer.span('chunk', 'engine', {'pairs': sum(len(js) for _, js in chunk)} if tracer.enabled else None):
+        return _compare_rows(comparator, profiles, chunk, min_similarity, should_stop, timings, tracer)
+
+
+def _compare_rows(comparator, profiles, chunk, min_similarity, should_stop, timings, tracer):
+    processed = 0
+    processed_bytes = 0
+    results = []
+    for i, js in chunk:
+        for j in js:
+            if should_stop is not None and should_stop():
+                return processed, processed_bytes, results
+            args = {'file1': profiles[i].path, 'file2': profiles[j].path} if tracer.enabled else None
+            with tracer.span(profiles[i].file_type, 'pair', args):
+                result = comparator.compare_files(profiles[i], profiles[j])
+            processed += 1
+            processed_bytes += profiles[i].size + profiles[j].size
+            if timings is not None:
+                timings.add(profiles[i].file_type, result.get('details', {}).get('timings'))
+            if 'total' in result and result['total'] >= min_similarity:
+                results.append(result)
+    return processed, processed_bytes, results
+
+
+def iter_upper_triangle(n):
+    """Üst üçgen çift uzayını (i, range(i+1, n)) satırları olarak üretir."""
+    for i in range(n - 1):
+        yield i, range(i + 1, n)
+
+
+def iter_pair_chunks(rows, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    (i, js) satırlarını yaklaşık chunk_size çiftlik parçalara böler.
+
+    Uzun satırlar dilimlenir, kısa satırlar aynı parçada birleştirilir.
+    """
+    chunk = []
+    count = 0
+    for i, js in rows:
+        start = 0
+        while start < len(js):
+            take = min(chunk_size - count, len(js) - start)
+            chunk.append((i, js[start:start + take]))
+            count += take
+            start += take
+            if count >= chunk_size:
+                yield chunk
+                chunk = []
+                count = 0
+    if chunk:
+        yield chunk
+
+
+class ComparisonEngine:
+    """
+    Çift karşılaştırmalarını süreç havuzunda paralel çalıştıran motor.
+
+    Her işçi kendi FileComparator kopyasını ve profil listesini tutar;
+    sonuçlar parça parça çağırana akıtılır.
+    """
+
+    def __init__(self, comparator, workers=None, chunk_size=DEFAULT_CHUNK_SIZE, max_buffer_size=None,
+                 tracer=NULL_TRACER, profile_dir=None):
+        self.comparator = comparator
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.chunk_size = chunk_size
+        # İşçi başına en fazla okuma/eşleme tamponu (None: mevcut süreç ayarı)
+        self.max_buffer_size = max_buffer_size or fileio.get_max_buffer_size()
+        self._cancelled = False
+        self._cancel_event = None
+        # İşçi süreçlerinde okunan bayt/dosya sayıları (bu süreçte sayılmayanlar)
+        self.worker_io_stats = {}
+        # Aşama süreleri açıksa tüm çiftlerin dosya tipine göre özeti
+        self.timing_summary = TimingSummary()
+        # İzleme kayıtçısı (işçilerin olayları da buna eklenir) ve cProfile klasörü
+        self.tracer = tracer
+        self.profile_dir = profile_dir
+
+    def cancel(self):
+        self._cancelled = True
+        if self._cancel_event is not None:
+            self._cancel_event.set()
+
+    def run(self, profiles, rows=None, min_similarity=0, should_stop=None, total_pairs=None):
+        """
+        Çiftleri karşılaştırır ve her tamamlanan parça için
+        (işlenen çift sayısı, işlenen bayt, sonuçlar) üretir.
+
+        Args:
+            profiles: Dosya profilleri listesi
+            rows: (i, js) satırları; None ise tüm üst üçgen
+            min_similarity: Sonuçlara eklenecek minimum toplam skor
+            should_stop: Çağıran tarafın iptal isteğini bildiren fonksiyon
+            total_pairs: Toplam çift sayısı (biliniyorsa parça boyutu küçültülür)
+        """
+        self._cancelled = False
+        self.worker_io_stats = {'bytes_read': 0, 'files_opened': 0}
+        self.timing_summary = TimingSummary()
+        timings = self.timing_summary if getattr(self.comparator, 'collect_timings', False) else None
+        if rows is None:
+            rows = iter_upper_triangle(len(profiles))
+            total_pairs = len(profiles) * (len(profiles) - 1) // 2
+        chunk_size = self.chunk_size
+        if total_pairs is not None:
+            # Az sayıda çift varsa her işçiye iş düşecek şekilde parçaları küçült
+            chunk_size = max(1, min(chunk_size, total_pairs // (self.workers * 4)))
+        chunks = iter_pair_chunks(rows, chunk_size)
+
+        def stopped():
+            if not self._cancelled and should_stop is not None and should_stop():
+                self.cancel()
+            return self._cancelled
+
+        if self.workers <= 1:
+            fileio.set_max_buffer_size(self.max_buffer_size)
+            profiler = WorkerProfiler(self.profile_dir, 'compare') if self.profile_dir else None
+            try:
+                for chunk in chunks:
+                    if stopped():
+                        break
+                    if profiler is not None:
+                        # Yalnızca karşılaştırma ölçülür, çağıranın işlemesi profile girmez
+                        with profiler:
+                            result = compare_chunk(self.comparator, profiles, chunk, min_similarity,
+                                                   stopped, timings, self.tracer)
+                    else:
+                        result = compare_chunk(self.comparator, profiles, chunk, min_similarity,
+                                               stopped, timings, self.tracer)
+                    yield result
+            finally:
+                if profiler is not None:
+                    profiler.dump()
+            return
+
+        yield from self._run_pool(profiles, chunks, min_similarity, stopped)
+
+    def _run_pool(self, profiles, chunks, min_similarity, stopped):
+        ctx = multiprocessing.get_context('spawn')
+        self._cancel_event = ctx.Event()
+        if self._cancelled:
+            self._cancel_event.set()
+        executor = ProcessPoolExecutor(
+            max_workers=self.workers, mp_context=ctx,
+            initializer=_init_worker,
+            initargs=(self.comparator, profiles, self._cancel_event, self.max_buffer_size,
+                      self.tracer.enabled, self.profile_dir)
+        )
+        pending = set()
+        try:
+            exhausted = False
+            while True:
+                # Bellek kullanımını sınırlamak için işçi başına en fazla iki parça kuyrukta
+                while not exhausted and not stopped() and len(pending) < self.workers * 2:
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        exhausted = True
+                        break
+                    pending.add(executor.submit(_compare_chunk_in_worker, chunk, min_similarity))
+                if not pending:
+                    break
+                # Bekleme aralıkları izde işçi boşluklarını ve sonuç gecikmelerini gösterir
+                with self.tracer.span('wait', 'engine'):
+                    done, pending = wait(pending, timeout=POLL_INTERVAL, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future.cancelled():
+                        continue
+                    try:
+                        result, io_stats, timings, events = future.result()
+                        for key, value in io_stats.items():
+                            self.worker_io_stats[key] = self.worker_io_stats.get(key, 0) + value
+                        self.timing_summary.merge(timings)
+                        self.tracer.extend(events)
+                        yield result
+                    except Exception as e:
+                        logging.error(f"Paralel karşılaştırma hatası: {e}")
+                if stopped():
+                    for future in pending:
+                        future.cancel()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            self._cancel_event = None
@@ -0,0 +1,185 @@
+# Main/src/core/fileio.py
+import os
+import mmap
+import hashlib
+from contextlib import contextmanager
+
+# Varsayılan okuma parçası
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# İşçi başına aynı anda eşlenen/okunan en fazla bayt (set_max_buffer_size ile değişir)
+_max_buffer_size = 16 * 1024 * 1024
+
+# Bu süreçte okunan bayt ve açılan dosya sayaçları
+_stats = {'bytes_read': 0, 'files_opened': 0}
+
+
+def set_max_buffer_size(size):
+    """İşçi başına en fazla tampon boyutunu ayarlar (en az bir eşleme birimi)."""
+    global _max_buffer_size
+    _max_buffer_size = max(int(size), mmap.ALLOCATIONGRANULARITY)
+
+
+def get_max_buffer_size():
+    return _max_buffer_size
+
+
+def io_stats():
+    """Bu süreçteki okuma istatistiklerinin kopyasını döndürür."""
+    return dict(_stats)
+
+
+def reset_io_stats():
+    for key in _stats:
+        _stats[key] = 0
+
+
+def _close_view(view, mapped):
+    # Çağıran taraf görünümden türetilmiş bir nesneyi tutuyorsa eşleme GC'ye bırakılır
+    try:
+        view.release()
+        mapped.close()
+    except BufferError:
+        pass
+
+
+def iter_file_chunks(file_path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Dosyayı bellek eşlemeli pencerelerle, kopyasız parçalar halinde dolaşır.
+
+    Aynı anda yalnızca bir pencere (en fazla get_max_buffer_size() bayt)
+    eşli tutulur; her parça pencere içindeki bir memoryview dilimidir ve
+    bir sonraki pencereye geçilmeden önce kullanılmalıdır.
+
+    Args:
+        file_path: Dosya yolu
+        chunk_size: Parça boyutu (son parça hariç)
+
+    Yields:
+        memoryview parçaları
+    """
+    chunk_size = max(1, min(chunk_size, _max_buffer_size))
+    window_size = max(1, _max_buffer_size // chunk_size) * chunk_size
+    granularity = mmap.ALLOCATIONGRANULARITY
+    with open(file_path, 'rb') as f:
+        _stats['files_opened'] += 1
+        size = os.fstat(f.fileno()).st_size
+        position = 0
+        while position < size:
+            # Eşleme başlangıcı sistem hizalamasına yuvarlanır
+            base = (position // granularity) * granularity
+            length = min(window_size, size - position)
+            mapped = mmap.mmap(f.fileno(), position - base + length, offset=base, access=mmap.ACCESS_READ)
+            view = memoryview(mapped)
+            try:
+                start = position - base
+                for offset in range(start, start + length, chunk_size):
+                    chunk = view[offset:min(offset + chunk_size, start + length)]
+                    _stats['bytes_read'] += len(chunk)
+                    yield chunk
+                    chunk.release()
+            finally:
+                _close_view(view, mapped)
+            position += length
+
+
+def read_range(file_path, offset, size):
+    """
+    Dosyanın belirli bir aralığını okur.
+
+    Args:
+        file_path: Dosya yolu
+        offset: Başlangıç; negatifse dosya sonundan geriye doğru
+        size: Okunacak en fazla bayt
+
+    Returns:
+        bytes (aralık dosya dışındaysa boş)
+    """
+    with open(file_path, 'rb') as f:
+        _stats['files_opened'] += 1
+        if offset < 0:
+            f.seek(offset, os.SEEK_END)
+        else:
+            f.seek(offset)
+        data = f.read(min(size, _max_buffer_size))
+        _stats['bytes_read'] += len(data)
+        return data
+
+
+class MappedFile:
+    """
+    Dosyanın tamamını salt okunur eşler ve kopyasız dilimleme sağlar.
+
+    Rastgele erişimli küçük okumalar içindir; sayfalar yalnızca dokunulduğunda
+    belleğe gelir. Boş dosyalar için boş bir görünüm kullanılır.
+    """
+
+    def __init__(self, file_path):
+        self.path = file_path
+        self._file = open(file_path, 'rb')
+        _stats['files_opened'] += 1
+        self.size = os.fstat(self._file.fileno()).st_size
+        self._mapped = None
+        if self.size > 0:
+            self._mapped = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.view = memoryview(self._mapped)
+        else:
+            self.view = memoryview(b'')
+
+    def __len__(self):
+        return self.size
+
+    def find(self, sub, start=0, end=None):
+        """sub'ın [start, end) içindeki ilk konumu; yoksa -1 (C hızında, kopyasız)."""
+        if self._mapped is None:
+            return -1
+        return self._mapped.find(sub, start, self.size if end is None else end)
+
+    def read(self, offset, size):
+        """Aralığı bytes olarak döndürür; negatif offset dosya sonuna göredir."""
+        if offset < 0:
+            offset = self.size + offset
+            if offset < 0:
+                raise ValueError("Geçersiz okuma konumu")
+        size = min(size, _max_buffer_size)
+        data = bytes(self.view[offset:offset + size])
+        _stats['bytes_read'] += len(data)
+        return data
+
+    def close(self):
+        if self._mapped is not None:
+            _close_view(self.view, self._mapped)
+            self._mapped = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+@contextmanager
+def open_mapped(file_path):
+    mapped = MappedFile(file_path)
+    try:
+        yield mapped
+    finally:
+        mapped.close()
+
+
+def hash_file(file_path, algorithm='md5', chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Dosyanın hash'ini sabit boyutlu parçalarla akış halinde hesaplar.
+
+    Args:
+        file_path: Dosya yolu
+        algorithm: hashlib algoritma adı
+
+    Returns:
+        Hexadecimal hash
+    """
+    digest = hashlib.new(algorithm)
+    for chunk in iter_file_chunks(file_path, chunk_size):
+        digest.update(chunk)
+    return digest.hexdigest()
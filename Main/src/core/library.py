@@ -0,0 +1,401 @@
+# Main/src/core/library.py
+import os
+import time
+import hashlib
+import sqlite3
+from collections import defaultdict
+from .cache import DEFAULT_CACHE_PATH, ProfileCache
+from .comparator import TokenWeights
+from .discovery import walk_files
+
+# Sorguda tam karşılaştırmaya giren en az aday sayısı ve k başına aday
+MIN_SHORTLIST = 20
+SHORTLIST_FACTOR = 3
+
+# Kütüphanedeki dosyaların bu oranından (ve en az MIN_CHUNK_FREQUENCY
+# dosyadan) fazlasında geçen parçalar (boş bloklar, ortak başlıklar) aday
+# seçiminde ayırt edici sayılmaz
+MAX_CHUNK_FREQUENCY = 0.05
+MIN_CHUNK_FREQUENCY = 100
+
+# SQLite sorgusu başına en fazla parametre sayısı
+QUERY_BATCH = 500
+
+# Bu kadar dosya işlenince indeks commit edilir
+COMMIT_INTERVAL = 500
+
+# İndeks içeriği değiştiğinde artırılır; eski indeksler baştan oluşturulur
+INDEX_VERSION = 2
+
+
+def default_index_path(library, cache_path=None):
+    """Kütüphane klasörü için profil önbelleğinin yanında bir indeks dosyası yolu."""
+    key = hashlib.md5(os.path.normcase(os.path.abspath(library)).encode('utf-8')).hexdigest()[:12]
+    return os.path.join(os.path.dirname(os.path.abspath(cache_path or DEFAULT_CACHE_PATH)),
+                        f'library_{key}.sqlite3')
+
+
+def _signed(value):
+    # Parça hash'leri işaretsiz 64 bit; SQLite INTEGER işaretlidir
+    return value - (1 << 64) if value >= (1 << 63) else value
+
+
+def _token_hash(name):
+    return _signed(int.from_bytes(hashlib.blake2b(name.encode('utf-8'), digest_size=8).digest(), 'little'))
+
+
+def _token_names(profile):
+    return (profile.sw_data or {}).get('features') or {}
+
+
+def _token_hashes(profile):
+    """SolidWorks profilindeki özellik/gövde adlarının 64 bit hash'leri."""
+    return {_token_hash(name) for name in _token_names(profile)}
+
+
+def _batches(items, size=QUERY_BATCH):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+class LibraryIndex:
+    """
+    Bir kütüphane klasörü için tek dosya sorgularına yönelik kalıcı indeks.
+
+    Her dosyanın içerik tanımlı parça (CDC) hash'leri ve SolidWorks
+    dosyalarında özellik/gövde adı belirteçleri ters indekste tutulur.
+    Sorguda sorgu dosyasının parçalarını paylaşan dosyalar ortak bayt
+    miktarına, adlarını paylaşanlar ortak ad oranına göre sıralanır, kısa listeye yalnızca en iyi adaylar (ve
+    parça paylaşmayan durumlar için aynı tipte boyutça en yakın dosyalar)
+    alınır; FileComparator tam karşılaştırması yalnızca bu kısa listede
+    çalışır. Aday profilleri profil önbelleğinden okunur.
+
+    Args:
+        library: Kütüphane klasörü
+        scanner: Keşif kuralları, karşılaştırıcı ve önbellek ayarları için FolderScanner
+        index_path: İndeks dosyası (varsayılan: profil önbelleğinin yanında)
+    """
+
+    def __init__(self, library, scanner, index_path=None):
+        self.library = os.path.abspath(library)
+        self.scanner = scanner
+        self.comparator = scanner.comparator
+        self.index_path = os.path.abspath(index_path or default_index_path(library, scanner.cache_path))
+        self._conn = None
+
+    def connect(self):
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+            self._conn = sqlite3.connect(self.index_path)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS files (
+                    id INTEGER PRIMARY KEY,
+                    path TEXT UNIQUE NOT NULL,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    file_type TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS postings (
+                    hash INTEGER NOT NULL,
+                    file_id INTEGER NOT NULL,
+                    PRIMARY KEY (hash, file_id)
+                ) WITHOUT ROWID;
+                CREATE INDEX IF NOT EXISTS idx_postings_file ON postings(file_id);
+                CREATE TABLE IF NOT EXISTS token_postings (
+                    hash INTEGER NOT NULL,
+                    file_id INTEGER NOT NULL,
+                    PRIMARY KEY (hash, file_id)
+                ) WITHOUT ROWID;
+                CREATE INDEX IF NOT EXISTS idx_token_postings_file ON token_postings(file_id);
+                CREATE INDEX IF NOT EXISTS idx_files_type_size ON files(file_type, size);
+                CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+            """)
+        return self._conn
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.commit()
+            self._conn.close()
+            self._conn = None
+
+    def file_count(self):
+        return self.connect().execute("SELECT COUNT(*) FROM files").fetchone()[0]
+
+    def update(self, progress=None):
+        """
+        Kütüphaneyi tarar ve indeksi günceller.
+
+        Boyutu ve değiştirilme zamanı aynı kalan dosyalar hiç okunmaz; yeni
+        ve değişen dosyaların profilleri çıkarılır (profil önbelleğine de
+        yazılır), silinen dosyalar indeksten çıkarılır.
+
+        Args:
+            progress: Her işlenen dosyada (işlenen, toplam) ile çağrılan fonksiyon
+
+        Returns:
+            {'added', 'updated', 'removed', 'unchanged'} sayıları
+        """
+        conn = self.connect()
+        version = conn.execute("SELECT value FROM meta WHERE key='version'").fetchone()
+        if version is None or version[0] != str(INDEX_VERSION):
+            # Eski sürüm indeksler tüm dosyalar yeniden işlenerek kurulur
+            conn.execute("DELETE FROM postings")
+            conn.execute("DELETE FROM token_postings")
+            conn.execute("DELETE FROM files")
+            conn.execute("INSERT OR REPLACE INTO meta VALUES ('version', ?)", (str(INDEX_VERSION),))
+        known = {path: (file_id, size, mtime_ns)
+                 for file_id, path, size, mtime_ns in conn.execute("SELECT id, path, size, mtime_ns FROM files")}
+        stats = {'added': 0, 'updated': 0, 'removed': 0, 'unchanged': 0}
+
+        changed = []
+        seen = set()
+        for files in walk_files(self.library, self.scanner.get_file_filter(), self.scanner.recursive,
+                                self.scanner.walk_workers, tracer=self.scanner.tracer):
+            for path, stat in files:
+                path = os.path.abspath(path)
+                seen.add(path)
+                entry = known.get(path)
+                if entry is not None and entry[1] == stat.st_size and entry[2] == stat.st_mtime_ns:
+                    stats['unchanged'] += 1
+                else:
+                    changed.append((path, stat))
+
+        removed = [entry[0] for path, entry in known.items() if path not in seen]
+        self._delete_ids(removed)
+        stats['removed'] = len(removed)
+
+        for done, profile in enumerate(self.scanner.iter_profiles(changed), 1):
+            if profile.error:
+                continue
+            stats['added' if self._store(profile) else 'updated'] += 1
+            if done % COMMIT_INTERVAL == 0:
+                conn.commit()
+            if progress is not None:
+                progress(done, len(changed))
+        conn.execute("INSERT OR REPLACE INTO meta VALUES ('updated', ?)", (str(time.time()),))
+        conn.commit()
+        return stats
+
+    def _delete_ids(self, file_ids):
+        conn = self.connect()
+        for batch in _batches(file_ids):
+            marks = ','.join('?' * len(batch))
+            conn.execute(f"DELETE FROM postings WHERE file_id IN ({marks})", batch)
+            conn.execute(f"DELETE FROM token_postings WHERE file_id IN ({marks})", batch)
+            conn.execute(f"DELETE FROM files WHERE id IN ({marks})", batch)
+
+    def _store(self, profile):
+        """Profilin parçalarını indekse yazar; dosya yeni eklendiyse True döner."""
+        conn = self.connect()
+        path = os.path.abspath(profile.path)
+        row = conn.execute("SELECT id FROM files WHERE path=?", (path,)).fetchone()
+        if row is not None:
+            file_id = row[0]
+            conn.execute("DELETE FROM postings WHERE file_id=?", (file_id,))
+            conn.execute("DELETE FROM token_postings WHERE file_id=?", (file_id,))
+            conn.execute("UPDATE files SET size=?, mtime_ns=?, file_type=? WHERE id=?",
+                         (profile.size, profile.mtime_ns, profile.file_type, file_id))
+        else:
+            file_id = conn.execute(
+                "INSERT INTO files (path, size, mtime_ns, file_type) VALUES (?, ?, ?, ?)",
+                (path, profile.size, profile.mtime_ns, profile.file_type)
+            ).lastrowid
+        conn.executemany("INSERT OR IGNORE INTO postings VALUES (?, ?)",
+                         ((_signed(h), file_id) for h in set(profile.chunk_hashes)))
+        conn.executemany("INSERT OR IGNORE INTO token_postings VALUES (?, ?)",
+                         ((h, file_id) for h in _token_hashes(profile)))
+        return row is None
+
+    def add(self, profile):
+        """Tek bir dosyanın profilini indekse ekler veya günceller (izleme kipi)."""
+        if profile.error:
+            return
+        self._store(profile)
+        self.connect().commit()
+
+    def remove(self, path):
+        """Silinen bir dosyayı indeksten çıkarır."""
+        conn = self.connect()
+        row = conn.execute("SELECT id FROM files WHERE path=?", (os.path.abspath(path),)).fetchone()
+        if row is not None:
+            self._delete_ids([row[0]])
+            conn.commit()
+
+    def contains(self, path):
+        """Yol kütüphane klasörünün içinde mi."""
+        path = os.path.normcase(os.path.abspath(path))
+        root = os.path.normcase(self.library)
+        return path == root or path.startswith(root.rstrip(os.sep) + os.sep)
+
+    def candidates(self, profile, limit):
+        """
+        Sorgu profili için ters indeksten aday dosyaları seçer.
+
+        Parça ortak bayt oranı ile (SolidWorks dosyalarında) ortak ad oranının
+        büyüğü adayın skorudur.
+
+        Returns:
+            [(dosya yolu, ortak oran), ...] oranı azalan sırada, en fazla limit adet
+        """
+        conn = self.connect()
+        total_files = max(self.file_count(), 1)
+        max_frequency = max(int(total_files * MAX_CHUNK_FREQUENCY), MIN_CHUNK_FREQUENCY)
+
+        # Sorgu dosyasındaki her parçanın toplam bayt ağırlığı
+        weights = defaultdict(int)
+        for h, size in zip(profile.chunk_hashes, profile.chunk_sizes):
+            weights[_signed(h)] += size
+        shared = self._shared_postings('postings', weights, max_frequency)
+
+        # Ad belirteçleri her dosyada bir kez sayılır
+        tokens = dict.fromkeys(_token_hashes(profile), 1)
+        shared_tokens = self._shared_postings('token_postings', tokens, max_frequency)
+
+        probe_path = os.path.normcase(os.path.abspath(profile.path))
+        scored = []
+        ids = list(set(sorted(shared, key=shared.get, reverse=True)[:limit * 2]) |
+                   set(sorted(shared_tokens, key=shared_tokens.get, reverse=True)[:limit * 2]))
+        token_counts = {}
+        for batch in _batches([file_id for file_id in ids if file_id in shared_tokens]):
+            marks = ','.join('?' * len(batch))
+            token_counts.update(conn.execute(
+                f"SELECT file_id, COUNT(*) FROM token_postings WHERE file_id IN ({marks}) GROUP BY file_id", batch))
+        for batch in _batches(ids):
+            marks = ','.join('?' * len(batch))
+            for file_id, path, size in conn.execute(
+                    f"SELECT id, path, size FROM files WHERE id IN ({marks})", batch):
+                if os.path.normcase(path) == probe_path:
+                    continue
+                overlap = shared.get(file_id, 0) / max(profile.size, size, 1)
+                if file_id in shared_tokens:
+                    overlap = max(overlap, shared_tokens[file_id] /
+                                  max(len(tokens), token_counts.get(file_id, 0), 1))
+                scored.append((path, overlap))
+        scored.sort(key=lambda item: item[1], reverse=True)
+        scored = scored[:limit]
+
+        # Parça paylaşmayan ama yine de benzer olabilecek dosyalar (sıkıştırılmış
+        # içerik, meta veri benzerliği) için aynı tipte boyutça en yakınlar eklenir
+        if len(scored) < limit:
+            chosen = {path for path, _ in scored}
+            for path, in conn.execute(
+                    "SELECT path FROM files WHERE file_type=? ORDER BY ABS(size - ?) LIMIT ?",
+                    (profile.file_type, profile.size, limit + 1)):
+                if len(scored) >= limit:
+                    break
+                if path not in chosen and os.path.normcase(path) != probe_path:
+                    scored.append((path, 0.0))
+                    chosen.add(path)
+        return scored
+
+    def token_frequencies(self, profiles):
+        """
+        Profillerdeki SolidWorks adlarının kütüphanede geçtiği dosya sayıları.
+
+        Kütüphanede olmayan profiller (sorgu dosyası) derleme eklenir.
+
+        Returns:
+            ({ad: dosya sayısı}, derlemdeki SolidWorks dosyası sayısı)
+        """
+        conn = self.connect()
+        names = {}
+        for profile in profiles:
+            for name in _token_names(profile):
+                names.setdefault(_token_hash(name), name)
+        frequencies = dict.fromkeys(names.values(), 0)
+        hashes = list(names)
+        for batch in _batches(hashes):
+            marks = ','.join('?' * len(batch))
+            for h, count in conn.execute(
+                    f"SELECT hash, COUNT(*) FROM token_postings WHERE hash IN ({marks}) GROUP BY hash", batch):
+                frequencies[names[h]] = count
+        file_count, = conn.execute("SELECT COUNT(*) FROM files WHERE file_type='solidworks'").fetchone()
+        for profile in profiles:
+            if _token_names(profile) and not self.contains(profile.path):
+                file_count += 1
+                for name in _token_names(profile):
+                    frequencies[name] += 1
+        return frequencies, file_count
+
+    def _shared_postings(self, table, weights, max_frequency):
+        """
+        Sorgu hash'lerini paylaşan dosyaların ortak ağırlıklarını toplar.
+
+        Args:
+            table: Ters indeks tablosu ('postings' veya 'token_postings')
+            weights: {hash: ağırlık}
+            max_frequency: Bundan fazla dosyada geçen (ayırt edici olmayan) hash'ler sayılmaz
+
+        Returns:
+            {dosya id: ortak ağırlık}
+        """
+        conn = self.connect()
+        hashes = list(weights)
+        selective = []
+        for batch in _batches(hashes):
+            marks = ','.join('?' * len(batch))
+            for h, count in conn.execute(
+                    f"SELECT hash, COUNT(*) FROM {table} WHERE hash IN ({marks}) GROUP BY hash", batch):
+                if count <= max_frequency:
+                    selective.append(h)
+
+        shared = defaultdict(int)
+        for batch in _batches(selective):
+            marks = ','.join('?' * len(batch))
+            for h, file_id in conn.execute(
+                    f"SELECT hash, file_id FROM {table} WHERE hash IN ({marks})", batch):
+                shared[file_id] += weights[h]
+        return shared
+
+    def query(self, probe, k=10, min_similarity=0):
+        """
+        Sorgu dosyasına en benzer k kütüphane dosyasını döndürür.
+
+        Args:
+            probe: Sorgu dosyasının yolu
+            k: Döndürülecek sonuç sayısı
+            min_similarity: Sonuçlara alınacak minimum toplam skor
+
+        Returns:
+            FileComparator.compare_files sonuçları (toplam skor azalan sırada);
+            her sonuca aday seçimindeki ortak oran 'overlap' olarak eklenir
+        """
+        cache = ProfileCache(self.scanner.cache_path) if self.scanner.use_cache else None
+        try:
+            profile = self.comparator.build_profile(probe, cache)
+            if profile.error:
+                raise OSError(profile.error)
+            return self.query_profile(profile, k, min_similarity, cache)
+        finally:
+            if cache is not None:
+                cache.close()
+
+    def query_profile(self, profile, k=10, min_similarity=0, cache=None):
+        """
+        query() gibi, ancak profili çıkarılmış bir dosya için.
+
+        Args:
+            profile: Sorgu dosyasının profili
+            cache: Aday profilleri için açık ProfileCache (None: her aday yeniden okunur)
+        """
+        shortlist = []
+        for path, overlap in self.candidates(profile, max(k * SHORTLIST_FACTOR, MIN_SHORTLIST)):
+            candidate = self.comparator.build_profile(path, cache)
+            if not candidate.error:
+                shortlist.append((candidate, overlap))
+
+        # SolidWorks ad ağırlıkları kütüphanenin ters indeksindeki sıklıklardan
+        # gelir; yalnızca bu sorgunun karşılaştırmalarına verilir, karşılaştırıcıyı
+        # paylaşan taramalar etkilenmez
+        token_weights = TokenWeights(*self.token_frequencies(
+            [profile] + [candidate for candidate, _ in shortlist]))
+        results = []
+        for candidate, overlap in shortlist:
+            result = self.comparator.compare_files(profile, candidate, token_weights)
+            if 'total' in result and result['total'] >= min_similarity:
+                result['overlap'] = overlap * 100
+                results.append(result)
+        results.sort(key=lambda result: result['total'], reverse=True)
+        return results[:k]
@@ -0,0 +1,389 @@
+# Main/src/core/monitor.py
+import os
+import sys
+import time
+import errno
+import select
+import struct
+import ctypes
+import ctypes.util
+import logging
+from .cache import ProfileCache
+from .discovery import walk_files
+
+# Son değişiklikten sonra dosyanın boyutu/zamanı bu kadar saniye aynı
+# kalınca yazma bitmiş sayılır (CAD programları dosyayı parça parça yazar)
+DEFAULT_SETTLE_SECONDS = 2.0
+
+# inotify yoksa (Windows, ağ paylaşımları) klasörler bu aralıkla yeniden listelenir
+DEFAULT_POLL_INTERVAL = 5.0
+
+# İzleme döngüsünün en uzun bekleme süresi; durdurma isteği bu sürede fark edilir
+WAIT_TIMEOUT = 0.5
+
+# inotify olay maskeleri (linux/inotify.h)
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+WATCH_MASK = (IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO |
+              IN_CREATE | IN_DELETE | IN_DELETE_SELF)
+
+_EVENT_HEADER = struct.Struct('iIII')
+
+
+def _relative(root, path):
+    return os.path.relpath(path, root).replace(os.sep, '/')
+
+
+def _load_libc():
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+class InotifyWatcher:
+    """
+    Linux inotify ile klasör ağacını izler (ek bağımlılık yok, ctypes).
+
+    Her klasöre ayrı izleme eklenir; yeni oluşturulan veya taşınan alt
+    klasörler de izlemeye alınır ve içlerindeki dosyalar değişmiş sayılır.
+    Olay kuyruğu taşarsa ağaç yeniden listelenir ve tüm dosyalar bildirilir.
+    """
+
+    backend = 'inotify'
+
+    def __init__(self, roots, file_filter, recursive=True):
+        self.libc = _load_libc()
+        if self.libc is None:
+            raise OSError("inotify kullanılamıyor")
+        self.fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 başarısız")
+        self.roots = [os.path.abspath(root) for root in roots]
+        self.file_filter = file_filter
+        self.recursive = recursive
+        # {izleme kimliği: (kök, klasör yolu)}
+        self.watches = {}
+        for root in self.roots:
+            self._watch_tree(root, root)
+
+    def _watch_tree(self, root, folder):
+        """Klasörü (ve özyinelemeliyse alt klasörlerini) izlemeye ekler; içindeki dosyaları döndürür."""
+        found = []
+        stack = [folder]
+        while stack:
+            path = stack.pop()
+            wd = self.libc.inotify_add_watch(self.fd, os.fsencode(path), WATCH_MASK)
+            if wd < 0:
+                logging.error(f"Klasör izlenemiyor ({path}): {os.strerror(ctypes.get_errno())}")
+                continue
+            self.watches[wd] = (root, path)
+            try:
+                with os.scandir(path) as entries:
+                    for entry in entries:
+                        rel = _relative(root, entry.path)
+                        if entry.is_dir(follow_symlinks=False):
+                            if self.recursive and not self.file_filter.rules.ignored(rel, True):
+                                stack.append(entry.path)
+                        elif entry.is_file():
+                            found.append(entry.path)
+            except OSError as e:
+                logging.error(f"Klasör listelenemedi ({path}): {e}")
+        return found
+
+    def poll(self, timeout):
+        """
+        En fazla timeout saniye olay bekler.
+
+        Returns:
+            (değişen/eklenen dosya yolları, silinen dosya yolları) kümeleri
+        """
+        changed, removed = set(), set()
+        try:
+            ready, _, _ = select.select([self.fd], [], [], timeout)
+        except InterruptedError:
+            return changed, removed
+        if not ready:
+            return changed, removed
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            except OSError as e:
+                if e.errno == errno.EINTR:
+                    continue
+                raise
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = os.fsdecode(data[offset:offset + length].rstrip(b'\0'))
+                offset += length
+                self._handle(wd, mask, name, changed, removed)
+        return changed - removed, removed
+
+    def _handle(self, wd, mask, name, changed, removed):
+        if mask & IN_Q_OVERFLOW:
+            logging.error("inotify olay kuyruğu taştı, klasörler yeniden listeleniyor")
+            for root in self.roots:
+                changed.update(self._watch_tree(root, root))
+            return
+        if mask & IN_IGNORED:
+            self.watches.pop(wd, None)
+            return
+        watch = self.watches.get(wd)
+        if watch is None or not name:
+            return
+        root, folder = watch
+        path = os.path.join(folder, name)
+        if mask & IN_ISDIR:
+            if (mask & (IN_CREATE | IN_MOVED_TO) and self.recursive and
+                    not self.file_filter.rules.ignored(_relative(root, path), True)):
+                changed.update(self._watch_tree(root, path))
+        elif mask & (IN_DELETE | IN_MOVED_FROM):
+            removed.add(path)
+            changed.discard(path)
+        else:
+            changed.add(path)
+            removed.discard(path)
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+class PollingWatcher:
+    """
+    Klasörleri belirli aralıkla yeniden listeleyerek (boyut, mtime) farkı bulan izleyici.
+
+    inotify olmayan sistemlerde ve ağ paylaşımlarında kullanılır; listeleme
+    keşifteki paralel os.scandir dolaşmasıyla yapılır.
+    """
+
+    backend = 'polling'
+
+    def __init__(self, roots, file_filter, recursive=True, interval=DEFAULT_POLL_INTERVAL,
+                 walk_workers=8):
+        self.roots = [os.path.abspath(root) for root in roots]
+        self.file_filter = file_filter
+        self.recursive = recursive
+        self.interval = interval
+        self.walk_workers = walk_workers
+        self.state = self._listing()
+        self.next_scan = time.monotonic() + interval
+
+    def _listing(self):
+        state = {}
+        for root in self.roots:
+            for files in walk_files(root, self.file_filter, self.recursive, self.walk_workers):
+                for path, stat in files:
+                    state[path] = (stat.st_size, stat.st_mtime_ns)
+        return state
+
+    def poll(self, timeout):
+        wait_for = self.next_scan - time.monotonic()
+        if wait_for > 0:
+            time.sleep(min(wait_for, timeout))
+            return set(), set()
+        current = self._listing()
+        self.next_scan = time.monotonic() + self.interval
+        changed = {path for path, signature in current.items() if self.state.get(path) != signature}
+        removed = set(self.state) - set(current)
+        self.state = current
+        return changed, removed
+
+    def close(self):
+        pass
+
+
+def make_watcher(roots, file_filter, recursive=True, use_inotify=True,
+                 poll_interval=DEFAULT_POLL_INTERVAL, walk_workers=8):
+    """Mümkünse InotifyWatcher, değilse PollingWatcher döndürür."""
+    if use_inotify:
+        try:
+            return InotifyWatcher(roots, file_filter, recursive)
+        except OSError as e:
+            logging.info(f"inotify kullanılamıyor, yoklama kullanılacak: {e}")
+    return PollingWatcher(roots, file_filter, recursive, poll_interval, walk_workers)
+
+
+class Debouncer:
+    """
+    Yazılmakta olan dosyaları, yazma bitene kadar bekletir.
+
+    Dosya son olaydan settle saniye sonra yeniden stat edilir; boyutu ve
+    değiştirilme zamanı olay anındakiyle aynıysa hazırdır, değilse bekleme
+    yeniden başlar. Böylece olay üretmeyen yavaş yazmalar (ağ kopyaları)
+    da tamamlanmadan işlenmez.
+    """
+
+    def __init__(self, settle=DEFAULT_SETTLE_SECONDS):
+        self.settle = settle
+        # {yol: (son olay zamanı, (boyut, mtime_ns) veya None)}
+        self.pending = {}
+
+    def __len__(self):
+        return len(self.pending)
+
+    def touch(self, path, now=None):
+        self.pending[path] = (time.monotonic() if now is None else now, self._signature(path))
+
+    def discard(self, path):
+        self.pending.pop(path, None)
+
+    @staticmethod
+    def _signature(path):
+        try:
+            stat = os.stat(path)
+            return stat.st_size, stat.st_mtime_ns
+        except OSError:
+            return None
+
+    def ready(self, now=None):
+        """Yazması bitmiş dosyaların yollarını döndürür ve bekleme listesinden çıkarır."""
+        now = time.monotonic() if now is None else now
+        settled = []
+        for path, (last_event, signature) in list(self.pending.items()):
+            if now - last_event < self.settle:
+                continue
+            current = self._signature(path)
+            if current is None:
+                # Geçici dosya yazılıp silinmiş veya taşınmış
+                del self.pending[path]
+            elif current != signature:
+                self.pending[path] = (now, current)
+            else:
+                del self.pending[path]
+                settled.append(path)
+        return settled
+
+
+class FileMonitor:
+    """
+    İzlenen klasörlere gelen dosyaları yazma bitince kütüphane indeksine sorar.
+
+    Dosya oluşturulduğunda veya değiştirildiğinde Debouncer yazmanın
+    bitmesini bekler; ardından dosyanın profili çıkarılır ve LibraryIndex
+    ile en benzer kütüphane dosyaları bulunur. Kütüphanenin içindeki
+    dosyalar sorgudan sonra indekse eklenir, silinenler çıkarılır; böylece
+    saatlik tam taramalara gerek kalmaz.
+
+    run() olayları:
+        ('status', 'monitor_indexing')    - başlangıçta indeks güncelleniyor
+        ('indexed', {...})                - LibraryIndex.update() sayıları
+        ('watching', {'roots', 'backend'})
+        ('matches', {'file', 'results'})  - eşiği geçen eşleşmeler (boş olabilir)
+        ('removed', yol)                  - kütüphaneden silinen dosya
+
+    Args:
+        index: LibraryIndex (karşılaştırıcı, filtre ve önbellek onun tarayıcısından alınır)
+        roots: İzlenecek klasörler (varsayılan: kütüphanenin kendisi)
+        min_similarity: Bildirilecek minimum toplam skor
+        k: Dosya başına en fazla eşleşme sayısı
+        settle: Yazmanın bitmiş sayılması için beklenen saniye
+        poll_interval: Yoklama izleyicisinin listeleme aralığı
+        use_inotify: False ise her zaman yoklama kullanılır
+    """
+
+    def __init__(self, index, roots=None, min_similarity=0, k=10, settle=DEFAULT_SETTLE_SECONDS,
+                 poll_interval=DEFAULT_POLL_INTERVAL, use_inotify=True):
+        self.index = index
+        self.scanner = index.scanner
+        self.roots = [os.path.abspath(root) for root in (roots or [index.library])]
+        self.min_similarity = min_similarity
+        self.k = k
+        self.settle = settle
+        self.poll_interval = poll_interval
+        self.use_inotify = use_inotify
+        self.is_running = True
+        # Son işlenen (boyut, mtime_ns); yalnızca özniteliği değişen dosyalar yeniden sorulmaz
+        self.checked = {}
+
+    def stop(self):
+        self.is_running = False
+
+    def _accepts(self, path, file_filter):
+        if not file_filter.accepts_name(os.path.basename(path)):
+            return False
+        if file_filter.rules:
+            for root in self.roots:
+                if self._under(path, root) and file_filter.rules.ignored(_relative(root, path), False):
+                    return False
+        return True
+
+    @staticmethod
+    def _under(path, root):
+        return os.path.normcase(path).startswith(os.path.normcase(root).rstrip(os.sep) + os.sep)
+
+    def run(self):
+        file_filter = self.scanner.get_file_filter()
+        yield 'status', 'monitor_indexing'
+        yield 'indexed', self.index.update()
+        if not self.is_running:
+            return
+
+        watcher = make_watcher(self.roots, file_filter, self.scanner.recursive, self.use_inotify,
+                               self.poll_interval, self.scanner.walk_workers)
+        debouncer = Debouncer(self.settle)
+        cache = ProfileCache(self.scanner.cache_path) if self.scanner.use_cache else None
+        yield 'watching', {'roots': self.roots, 'backend': watcher.backend}
+        try:
+            while self.is_running:
+                # Bekleyen dosya varsa uyanıp yazmanın bitip bitmediğine bakılır
+                timeout = min(WAIT_TIMEOUT, self.settle) if len(debouncer) else WAIT_TIMEOUT
+                changed, removed = watcher.poll(timeout)
+                for path in removed:
+                    debouncer.discard(path)
+                    self.checked.pop(path, None)
+                    if self.index.contains(path):
+                        self.index.remove(path)
+                        yield 'removed', path
+                for path in changed:
+                    if self._accepts(path, file_filter):
+                        debouncer.touch(path)
+                for path in debouncer.ready():
+                    if not self.is_running:
+                        break
+                    event = self.check(path, file_filter, cache)
+                    if event is not None:
+                        yield event
+        finally:
+            watcher.close()
+            if cache is not None:
+                cache.close()
+
+    def check(self, path, file_filter, cache):
+        """Yazması bitmiş bir dosyayı kütüphaneye sorar; gerekirse indekse ekler."""
+        try:
+            stat = os.stat(path)
+            signature = (stat.st_size, stat.st_mtime_ns)
+            if self.checked.get(path) == signature or not file_filter.accepts_stat(stat):
+                return None
+            self.checked[path] = signature
+            profile = self.scanner.comparator.build_profile(path, cache, stat)
+            if profile.error:
+                logging.error(f"İzlenen dosya okunamadı ({path}): {profile.error}")
+                return None
+            results = self.index.query_profile(profile, self.k, self.min_similarity, cache)
+            if self.index.contains(path):
+                self.index.add(profile)
+            return 'matches', {'file': path, 'results': results}
+        except Exception as e:
+            logging.error(f"İzlenen dosya işleme hatası ({path}): {e}")
+            return None
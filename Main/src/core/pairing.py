@@ -0,0 +1,223 @@
+# Main/src/core/pairing.py
+import os
+from collections import defaultdict
+import numpy as np
+
+
+def group_exact_duplicates(profiles):
+    """
+    Bayt bayt aynı dosyaları gruplar.
+
+    Önce boyuta göre kovalara ayrılır; yalnızca boyutu çakışan dosyaların
+    tam içerik hash'leri karşılaştırılır. Boş ve okunamayan dosyalar atlanır.
+
+    Args:
+        profiles: Dosya profilleri listesi
+
+    Returns:
+        En az iki elemanlı, artan sıralı indeks listeleri
+    """
+    by_size = defaultdict(list)
+    for index, profile in enumerate(profiles):
+        if profile.error or profile.size <= 0 or not profile.md5:
+            continue
+        by_size[profile.size].append(index)
+
+    groups = []
+    for indices in by_size.values():
+        if len(indices) < 2:
+            continue
+        by_hash = defaultdict(list)
+        for index in indices:
+            by_hash[profiles[index].md5].append(index)
+        groups.extend(sorted(group) for group in by_hash.values() if len(group) > 1)
+    return groups
+
+
+def iter_group_pairs(groups, split=None, dirty=None):
+    """
+    Her gruptaki tüm (i, j) çiftlerini (i < j) üretir.
+
+    split verilirse yalnızca i < split <= j olan çapraz çiftler, dirty
+    verilirse yalnızca en az bir indeksi dirty kümesinde olan çiftler üretilir.
+    """
+    for group in groups:
+        for a in range(len(group)):
+            for b in range(a + 1, len(group)):
+                if split is not None and not group[a] < split <= group[b]:
+                    continue
+                if dirty is not None and group[a] not in dirty and group[b] not in dirty:
+                    continue
+                yield group[a], group[b]
+
+
+# Eşik budaması için genel karşılaştırıcı ağırlıkları.
+# GeneralComparator.compare içindeki ağırlıklarla uyumlu tutulmalıdır:
+#   total = metadata * 0.25 + hash * 0.25 + content * 0.4 + structure * 0.1
+#   metadata = size * 0.7 + time * 0.3
+GENERAL_WEIGHTS = {'metadata': 0.25, 'hash': 0.25, 'content': 0.4, 'structure': 0.1}
+METADATA_WEIGHTS = {'size': 0.7, 'time': 0.3}
+
+# Kayan nokta hataları yüzünden geçerli bir çiftin atılmaması için pay
+BOUND_EPSILON = 1e-6
+
+
+class ProfileArrays:
+    """Profillerin budama için gereken alanlarının numpy sütunları."""
+
+    def __init__(self, profiles, solidworks_extensions):
+        self.sizes = np.array([p.size for p in profiles], dtype=np.float64)
+        self.mtimes = np.array([p.mtime for p in profiles], dtype=np.float64)
+        self.entropies = np.array([p.entropy for p in profiles], dtype=np.float64)
+        self.md5s = np.array([p.md5 for p in profiles], dtype=object)
+        self.errors = np.array([bool(p.error) for p in profiles], dtype=bool)
+        self.is_solidworks = np.array([
+            os.path.splitext(p.path)[1].lower() in solidworks_extensions for p in profiles
+        ], dtype=bool)
+        self.order = np.argsort(self.sizes, kind='stable')
+        self.sorted_sizes = self.sizes[self.order]
+
+
+def general_score_upper_bounds(arrays, i, js):
+    """
+    GeneralComparator skorunun (i, js) çiftleri için kesin üst sınırı.
+
+    İçerik benzerliği 100 kabul edilir; diğer terimler profillerden
+    birebir hesaplanır.
+    """
+    size1 = arrays.sizes[i]
+    size2 = arrays.sizes[js]
+    max_size = np.maximum(size1, size2)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        size_similarity = np.where(max_size > 0, (1 - np.abs(size1 - size2) / max_size) * 100, 0)
+
+    time_diff = np.abs(arrays.mtimes[i] - arrays.mtimes[js])
+    time_similarity = np.where(time_diff < 86400, np.maximum(0, 100 - time_diff / 86400 * 100), 0)
+
+    ent1 = arrays.entropies[i]
+    ent2 = arrays.entropies[js]
+    max_entropy = np.maximum(ent1, ent2)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        entropy_similarity = np.where(max_entropy > 0, 100 - np.abs(ent1 - ent2) / max_entropy * 100, 0)
+
+    md5_match = (arrays.md5s[js] == arrays.md5s[i]) & (arrays.md5s[js] != '')
+    hash_score = np.where((size_similarity > 99) & md5_match, 100, 0)
+
+    metadata = size_similarity * METADATA_WEIGHTS['size'] + time_similarity * METADATA_WEIGHTS['time']
+    bound = (metadata * GENERAL_WEIGHTS['metadata'] + hash_score * GENERAL_WEIGHTS['hash'] +
+             100 * GENERAL_WEIGHTS['content'] + entropy_similarity * GENERAL_WEIGHTS['structure'])
+    # Okunamayan dosyalar 0 skor alır
+    return np.where(arrays.errors[i] | arrays.errors[js], 0, bound)
+
+
+def min_general_size_ratio(min_similarity):
+    """
+    Eşiğe ulaşabilmek için gereken en küçük boyut oranı (küçük / büyük).
+
+    Zaman, içerik ve yapı 100, hash 0 kabul edilir; aynı boyutlu çiftler
+    hash eşleşmesi ihtimaline karşı her zaman pencerede kalır.
+    """
+    fixed = (METADATA_WEIGHTS['time'] * 100 * GENERAL_WEIGHTS['metadata'] +
+             100 * GENERAL_WEIGHTS['content'] + 100 * GENERAL_WEIGHTS['structure'])
+    per_size = METADATA_WEIGHTS['size'] * GENERAL_WEIGHTS['metadata']
+    required = (min_similarity - fixed) / per_size
+    return min(max(required / 100, 0.0), 1.0)
+
+
+def count_pair_bytes(profiles, rows):
+    """
+    (i, js) satırlarındaki çiftlerin toplam bayt ağırlığı.
+
+    Her çift iki dosyanın boyutları toplamı kadar sayılır; ilerleme
+    çift sayısı yerine bu ağırlıkla ölçülür.
+    """
+    sizes = np.array([max(p.size, 0) for p in profiles], dtype=np.int64)
+    # Tam satırlar (range) için son ek toplamları kullanılır
+    suffix = np.concatenate([np.cumsum(sizes[::-1])[::-1], [0]])
+    total = 0
+    for i, js in rows:
+        if isinstance(js, range):
+            total += int(sizes[i]) * len(js) + int(suffix[js.start] - suffix[js.stop])
+        else:
+            total += int(sizes[i]) * len(js) + int(sizes[np.asarray(js, dtype=np.int64)].sum())
+    return total
+
+
+def prune_pairs(profiles, solidworks_extensions, min_similarity, excluded_pairs=(), split=None,
+                dirty=None):
+    """
+    Skor üst sınırı eşiğe ulaşamayan çiftleri eleyerek (i, js) satırları üretir.
+
+    Dosyalar boyuta göre sıralanır ve her dosya için yalnızca eşiğe
+    ulaşabilecek boyut penceresindeki dosyalar aday alınır; adaylar
+    ardından kesin üst sınırla süzülür. Budama kesindir: eşiği
+    geçebilecek hiçbir çift atılmaz. SolidWorks karşılaştırıcısı
+    (çiftin ilk dosyası SolidWorks ise) ham bölüm eşleşmesinde boyuttan
+    bağımsız 100 verebildiği için bu satırlar budanmaz.
+
+    Args:
+        profiles: Dosya profilleri listesi
+        solidworks_extensions: SolidWorks karşılaştırıcısına giden uzantılar
+        min_similarity: Minimum toplam skor
+        excluded_pairs: Zaten sonuçlanmış (i, j) çiftleri
+        split: Verilirse çift uzayı üst üçgen yerine çapraz çiftlerdir;
+            satırlar [0, split), adaylar [split, n) aralığındandır
+        dirty: Verilirse üst üçgenin yalnızca en az bir indeksi bu kümede olan
+            çiftleri üretilir (artımlı taramada eklenen/değişen dosyalar);
+            çiftlerin yönü tam taramayla aynı kalır
+
+    Returns:
+        (satır listesi, toplam çift sayısı)
+    """
+    n = len(profiles)
+    excluded = defaultdict(set)
+    for i, j in excluded_pairs:
+        excluded[i].add(j)
+
+    arrays = ProfileArrays(profiles, solidworks_extensions)
+    if dirty is not None:
+        dirty_mask = np.zeros(n, dtype=bool)
+        dirty_mask[list(dirty)] = True
+        dirty_indices = np.flatnonzero(dirty_mask)
+    if split is None:
+        row_range = range(n - 1)
+        order, sorted_sizes = arrays.order, arrays.sorted_sizes
+    else:
+        # Aday pencere yalnızca ikinci tarafın boyut sırasından seçilir
+        row_range = range(min(split, n))
+        order = split + np.argsort(arrays.sizes[split:], kind='stable')
+        sorted_sizes = arrays.sizes[order]
+    ratio = min_general_size_ratio(min_similarity) * (1 - BOUND_EPSILON)
+    rows = []
+    total = 0
+    for i in row_range:
+        first = i + 1 if split is None else split
+        if dirty is not None and not dirty_mask[i]:
+            # Değişmemiş dosyanın satırında yalnızca sonraki değişen dosyalar aday olur
+            js = dirty_indices[np.searchsorted(dirty_indices, first):]
+            if len(js) and not (arrays.is_solidworks[i] or min_similarity <= 0):
+                bounds = general_score_upper_bounds(arrays, i, js)
+                js = js[bounds >= min_similarity - BOUND_EPSILON]
+        elif arrays.is_solidworks[i] or min_similarity <= 0:
+            js = range(first, n)
+        else:
+            size = arrays.sizes[i]
+            lo = np.searchsorted(sorted_sizes, size * ratio, 'left')
+            hi = (np.searchsorted(sorted_sizes, size / ratio, 'right')
+                  if ratio > 0 else len(order))
+            js = order[lo:hi]
+            js = np.sort(js[js >= first])
+            if len(js):
+                bounds = general_score_upper_bounds(arrays, i, js)
+                js = js[bounds >= min_similarity - BOUND_EPSILON]
+            # Hiç eleme yapılmayan satırlar yer kaplamaması için range olarak tutulur
+            if len(js) == n - first:
+                js = range(first, n)
+        if i in excluded:
+            skip = excluded[i]
+            js = np.array([j for j in js if j not in skip], dtype=np.int64)
+        if not len(js):
+            continue
+        rows.append((i, js))
+        total += len(js)
+    return rows, total
@@ -0,0 +1,157 @@
+# Main/src/core/preview.py
+import struct
+import logging
+import numpy as np
+
+# BITMAPINFOHEADER: boyut, genişlik, yükseklik, düzlem, bit derinliği,
+# sıkıştırma, görüntü boyutu, yatay/dikey çözünürlük, renk sayıları
+DIB_HEADER = struct.Struct('<IiiHHIIiiII')
+BI_RGB = 0
+BI_RLE8 = 1
+
+# Algısal hash: görüntü HASH_IMAGE_SIZE x HASH_IMAGE_SIZE gri tona indirilir,
+# DCT'nin sol üst HASH_SIZE x HASH_SIZE düşük frekans katsayıları kullanılır
+HASH_IMAGE_SIZE = 32
+HASH_SIZE = 8
+HASH_BITS = HASH_SIZE * HASH_SIZE
+
+# Kabul edilen en büyük önizleme (bozuk başlıklara karşı)
+MAX_PREVIEW_PIXELS = 16 * 1024 * 1024
+
+_DCT_MATRIX = np.cos(np.pi * np.outer(np.arange(HASH_IMAGE_SIZE), 2 * np.arange(HASH_IMAGE_SIZE) + 1)
+                     / (2 * HASH_IMAGE_SIZE))
+
+
+def _decode_rle8(data, width, height):
+    """BI_RLE8 piksel verisini (alttan üste satırlar) indeks dizisine açar."""
+    pixels = bytearray(width * height)
+    pos = x = y = 0
+    end = len(data) - 1
+    while pos < end and y < height:
+        count, value = data[pos], data[pos + 1]
+        pos += 2
+        if count:
+            # Kodlanmış mod: value count kez tekrarlanır
+            run = min(count, width - x)
+            if run > 0:
+                start = y * width + x
+                pixels[start:start + run] = bytes((value,)) * run
+            x += count
+        elif value == 0:
+            x, y = 0, y + 1
+        elif value == 1:
+            break
+        elif value == 2:
+            x += data[pos]
+            y += data[pos + 1]
+            pos += 2
+        else:
+            # Mutlak mod: value adet ham indeks, 2 bayta hizalı
+            run = min(value, max(width - x, 0))
+            start = y * width + x
+            pixels[start:start + run] = data[pos:pos + run]
+            x += value
+            pos += value + (value & 1)
+    return np.frombuffer(bytes(pixels), dtype=np.uint8).reshape(height, width)
+
+
+def decode_dib(dib):
+    """
+    Paketlenmiş bir DIB'yi (BITMAPINFOHEADER + palet + pikseller) gri tona açar.
+
+    8 bit paletli (sıkıştırmasız veya RLE8), 24 ve 32 bit sıkıştırmasız
+    görüntüler desteklenir.
+
+    Args:
+        dib: DIB baytları
+
+    Returns:
+        Üstten alta satırlarla (yükseklik, genişlik) float32 dizisi; desteklenmiyorsa None
+    """
+    (header_size, width, height, _, bit_count, compression,
+     _, _, _, colors_used, _) = DIB_HEADER.unpack_from(dib)
+    bottom_up = height > 0
+    height = abs(height)
+    if width <= 0 or height == 0 or width * height > MAX_PREVIEW_PIXELS:
+        return None
+
+    offset = header_size
+    if bit_count == 8:
+        colors = colors_used or 256
+        palette = np.frombuffer(dib, dtype=np.uint8, count=colors * 4, offset=offset).reshape(colors, 4)
+        offset += colors * 4
+        # Palet girdileri BGRX; her indeksin parlaklığı önceden hesaplanır
+        lut = np.zeros(256, dtype=np.float32)
+        lut[:colors] = palette[:, 2] * 0.299 + palette[:, 1] * 0.587 + palette[:, 0] * 0.114
+        if compression == BI_RLE8:
+            indices = _decode_rle8(memoryview(dib)[offset:], width, height)
+        elif compression == BI_RGB:
+            stride = (width + 3) & ~3
+            indices = np.frombuffer(dib, dtype=np.uint8, count=stride * height,
+                                    offset=offset).reshape(height, stride)[:, :width]
+        else:
+            return None
+        gray = lut[indices]
+    elif bit_count in (24, 32) and compression == BI_RGB:
+        channels = bit_count // 8
+        stride = (width * channels + 3) & ~3
+        rows = np.frombuffer(dib, dtype=np.uint8, count=stride * height, offset=offset).reshape(height, stride)
+        pixels = rows[:, :width * channels].reshape(height, width, channels).astype(np.float32)
+        gray = pixels[:, :, 2] * 0.299 + pixels[:, :, 1] * 0.587 + pixels[:, :, 0] * 0.114
+    else:
+        return None
+    return gray[::-1] if bottom_up else gray
+
+
+def _area_resize(image, size):
+    """Görüntüyü blok ortalamasıyla size x size boyutuna indirir."""
+    height, width = image.shape
+    rows = np.linspace(0, height, size + 1).astype(int)
+    cols = np.linspace(0, width, size + 1).astype(int)
+    if min(np.diff(rows).min(), np.diff(cols).min()) <= 0:
+        return None
+    sums = np.add.reduceat(np.add.reduceat(image, rows[:-1], axis=0), cols[:-1], axis=1)
+    return sums / np.outer(np.diff(rows), np.diff(cols))
+
+
+def perceptual_hash(image):
+    """
+    Gri ton görüntünün 64 bitlik DCT algısal hash'i (pHash).
+
+    Düşük frekans katsayılarının medyandan büyük olanları 1 bitidir; yeniden
+    kaydetme, renk/ölçek farkları hash'i çok az değiştirir.
+
+    Returns:
+        int veya None (görüntü hash için çok küçükse)
+    """
+    small = _area_resize(image, HASH_IMAGE_SIZE)
+    if small is None:
+        return None
+    coefficients = (_DCT_MATRIX @ small @ _DCT_MATRIX.T)[:HASH_SIZE, :HASH_SIZE].flatten()
+    # DC katsayısı (ortalama parlaklık) medyana katılmaz
+    bits = coefficients > np.median(coefficients[1:])
+    return int(sum(1 << i for i, bit in enumerate(bits) if bit))
+
+
+def preview_hash(dib):
+    """DIB önizlemesinin algısal hash'i; çözülemezse None."""
+    try:
+        image = decode_dib(dib)
+        return perceptual_hash(image) if image is not None else None
+    except Exception as e:
+        logging.error(f"Önizleme hash hatası: {e}")
+        return None
+
+
+def hamming_distance(hash1, hash2):
+    """İki önizleme hash'i arasındaki farklı bit sayısı; biri yoksa None."""
+    if hash1 is None or hash2 is None:
+        return None
+    return bin(hash1 ^ hash2).count('1')
+
+
+def dib_to_bmp(dib):
+    """Paketlenmiş DIB'nin önüne BITMAPFILEHEADER ekleyerek BMP dosyası baytları üretir."""
+    header_size, _, _, _, bit_count, _, _, _, _, colors_used, _ = DIB_HEADER.unpack_from(dib)
+    colors = (colors_used or 256) if bit_count <= 8 else 0
+    return struct.pack('<2sIHHI', b'BM', 14 + len(dib), 0, 0, 14 + header_size + colors * 4) + bytes(dib)
@@ -0,0 +1,134 @@
+# Main/src/core/profile.py
+import os
+import hashlib
+import logging
+import numpy as np
+from .chunking import ContentChunker
+from .utils import update_byte_histogram, entropy_from_histogram
+from .fileio import iter_file_chunks
+
+# Profil içeriği değiştiğinde artırılır; eski önbellek kayıtları geçersiz sayılır
+PROFILE_VERSION = 8
+
+# Dosya okunurken kullanılan parça boyutu
+READ_CHUNK_SIZE = 1024 * 1024
+
+# İmza için kullanılan baş kısım boyutu (calculate_file_signature ile aynı)
+SIGNATURE_SIZE = 1024
+
+# Yalnızca içeriğe bağlı, aynı hash'e sahip dosyalar arasında paylaşılabilen alanlar
+CONTENT_FIELDS = ('sw_data',)
+
+
+class FileProfile:
+    """
+    Bir dosyanın tarama boyunca tekrar tekrar kullanılan parmak izi.
+
+    Dosya tarama başında bir kez okunur; çift karşılaştırıcıları dosya yolu
+    yerine bu profili kullanır.
+    """
+
+    def __init__(self, path, file_type='general'):
+        self.path = path
+        self.file_type = file_type
+        self.size = 0
+        self.mtime = 0.0
+        self.mtime_ns = 0
+        self.inode = 0
+        self.device = 0
+        self.md5 = ''
+        self.signature = ''
+        self.entropy = 0.0
+        self.histogram = [0] * 256
+        self.chunk_hashes = []
+        self.chunk_sizes = []
+        self.sw_data = None
+        self.error = None
+        self.version = PROFILE_VERSION
+
+    @property
+    def name(self):
+        return os.path.basename(self.path)
+
+    def to_dict(self):
+        return dict(self.__dict__)
+
+    @classmethod
+    def from_dict(cls, data):
+        profile = cls(data.get('path', ''), data.get('file_type', 'general'))
+        profile.__dict__.update(data)
+        return profile
+
+    def __repr__(self):
+        return f"FileProfile({self.path!r}, size={self.size}, md5={self.md5!r})"
+
+
+def build_profile(file_path, file_type='general', sw_parser=None, cache=None, stat=None):
+    """
+    Dosyayı tek geçişte okuyarak profilini çıkarır.
+
+    Args:
+        file_path: Dosya yolu
+        file_type: Dosya tipi ('solidworks', 'cad', ...)
+        sw_parser: SolidWorks dosyaları için SWFileParser örneği
+        cache: Taramalar arası profil önbelleği (ProfileCache, opsiyonel)
+        stat: Keşif sırasında alınmış os.stat sonucu (opsiyonel)
+
+    Returns:
+        FileProfile (hata durumunda 'error' alanı dolu)
+    """
+    profile = FileProfile(file_path, file_type)
+    try:
+        # Windows'ta DirEntry.stat() inode ve aygıt numarası içermez; önbellek anahtarı için gerçek stat gerekir
+        if stat is None or not stat.st_ino:
+            stat = os.stat(file_path)
+        if cache is not None:
+            cached = cache.lookup(file_path, stat)
+            if cached is not None and cached.file_type == file_type:
+                return cached
+
+        profile.size = stat.st_size
+        profile.mtime = stat.st_mtime
+        profile.mtime_ns = stat.st_mtime_ns
+        profile.inode = stat.st_ino
+        profile.device = stat.st_dev
+
+        md5 = hashlib.md5()
+        histogram = np.zeros(256, dtype=np.int64)
+        head = b''
+        chunker = ContentChunker()
+        for chunk in iter_file_chunks(file_path, READ_CHUNK_SIZE):
+            if len(head) < SIGNATURE_SIZE:
+                head += chunk[:SIGNATURE_SIZE - len(head)]
+            md5.update(chunk)
+            chunker.update(chunk)
+            update_byte_histogram(histogram, chunk)
+
+        profile.md5 = md5.hexdigest()
+        profile.signature = hashlib.md5(head).hexdigest()
+        profile.histogram = histogram.tolist()
+        profile.entropy = entropy_from_histogram(histogram)
+        profile.chunk_hashes, profile.chunk_sizes = chunker.finish()
+
+        # Aynı içerik daha önce işlendiyse türetilmiş veriler yeniden kullanılır
+        same_content = cache.lookup_by_hash(profile.md5, profile.size) if cache is not None else None
+        if same_content is not None:
+            for field in CONTENT_FIELDS:
+                setattr(profile, field, getattr(same_content, field, None))
+
+        if file_type == 'solidworks' and sw_parser is not None and profile.sw_data is None:
+            profile.sw_data = sw_parser.parse_features(file_path)
+
+        if cache is not None:
+            cache.store(profile)
+    except Exception as e:
+        logging.error(f"Profil çıkarma hatası ({file_path}): {e}")
+        profile.error = str(e)
+    return profile
+
+
+def ensure_profile(file_or_profile, file_type='general', sw_parser=None):
+    """Dosya yolu verildiyse profil çıkarır, profil verildiyse aynen döndürür."""
+    if isinstance(file_or_profile, FileProfile):
+        return file_or_profile
+    return build_profile(file_or_profile, file_type, sw_parser)
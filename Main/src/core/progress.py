@@ -0,0 +1,114 @@
+# Main/src/core/progress.py
+import time
+
+# İlerleme en fazla bu aralıkla (saniye) raporlanır
+REPORT_INTERVAL = 0.1
+
+# Hız tahmini için üstel düzleştirme katsayısı (0-1, büyük değer daha hızlı tepki)
+SMOOTHING = 0.2
+
+
+class ProgressTracker:
+    """
+    Bayt ağırlıklı ilerleme, hız ve kalan süre takibi.
+
+    İşin büyüklüğü çift sayısıyla değil işlenen bayt miktarıyla ölçülür;
+    hızlar üstel hareketli ortalamayla düzleştirilir. update() yalnızca
+    raporlama aralığı dolduğunda True döndürür, böylece çağıran taraf
+    ilerleme olaylarını sabit bir hızla yayınlar.
+    """
+
+    def __init__(self, interval=REPORT_INTERVAL, smoothing=SMOOTHING):
+        self.interval = interval
+        self.smoothing = smoothing
+        self.start('comparing', 0, 0)
+
+    def start(self, phase, total_items, total_bytes):
+        """Yeni bir aşama başlatır ve sayaçları sıfırlar."""
+        self.phase = phase
+        self.total_items = total_items
+        self.total_bytes = total_bytes
+        self.items = 0
+        self.bytes = 0
+        self.items_rate = 0.0
+        self.bytes_rate = 0.0
+        self.started = time.monotonic()
+        self._last_time = self.started
+        self._last_items = 0
+        self._last_bytes = 0
+        self._rated = False
+
+    def expand(self, items=0, nbytes=0):
+        """İş sürerken keşfedilen yeni öğeleri toplamlara ekler."""
+        self.total_items += items
+        self.total_bytes += nbytes
+
+    def update(self, items=0, nbytes=0):
+        """
+        İşlenen öğe ve bayt miktarını ekler.
+
+        Returns:
+            Raporlama zamanı geldiyse True
+        """
+        self.items += items
+        self.bytes += nbytes
+        now = time.monotonic()
+        elapsed = now - self._last_time
+        if elapsed < self.interval:
+            return False
+
+        items_rate = (self.items - self._last_items) / elapsed
+        bytes_rate = (self.bytes - self._last_bytes) / elapsed
+        if self._rated:
+            self.items_rate += self.smoothing * (items_rate - self.items_rate)
+            self.bytes_rate += self.smoothing * (bytes_rate - self.bytes_rate)
+        else:
+            self.items_rate, self.bytes_rate = items_rate, bytes_rate
+            self._rated = True
+        self._last_time, self._last_items, self._last_bytes = now, self.items, self.bytes
+        return True
+
+    @property
+    def fraction(self):
+        """Bayt ağırlıklı tamamlanma oranı (0-1); bayt bilinmiyorsa öğe sayısı kullanılır."""
+        if self.total_bytes > 0:
+            return min(self.bytes / self.total_bytes, 1.0)
+        if self.total_items > 0:
+            return min(self.items / self.total_items, 1.0)
+        return 1.0
+
+    @property
+    def eta(self):
+        """Düzleştirilmiş hızla tahmini kalan süre (saniye); bilinmiyorsa None."""
+        if self.total_bytes > 0 and self.bytes_rate > 0:
+            return max(self.total_bytes - self.bytes, 0) / self.bytes_rate
+        if self.total_items > 0 and self.items_rate > 0:
+            return max(self.total_items - self.items, 0) / self.items_rate
+        return None
+
+    def snapshot(self):
+        """Raporlanacak ilerleme bilgisini sözlük olarak döndürür."""
+        return {
+            'phase': self.phase,
+            'processed': self.items,
+            'total': self.total_items,
+            'bytes': self.bytes,
+            'total_bytes': self.total_bytes,
+            'percent': self.fraction * 100,
+            'items_per_sec': self.items_rate,
+            'mb_per_sec': self.bytes_rate / (1024 * 1024),
+            'eta': self.eta,
+            'elapsed': time.monotonic() - self.started
+        }
+
+
+def format_duration(seconds):
+    """Saniyeyi SS:DD:ss veya DD:ss biçiminde döndürür; bilinmiyorsa '--:--'."""
+    if seconds is None:
+        return "--:--"
+    seconds = int(round(seconds))
+    hours, rest = divmod(seconds, 3600)
+    minutes, seconds = divmod(rest, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes:02d}:{seconds:02d}"
@@ -0,0 +1,166 @@
+# Main/src/core/results.py
+import os
+import numpy as np
+
+# Tablo sütunları (görünüm sırası)
+COLUMNS = ['file1', 'file2', 'metadata', 'hash', 'content', 'structure', 'total', 'category']
+
+# Sayısal olarak saklanan skor sütunları
+SCORE_COLUMNS = ['metadata', 'hash', 'content', 'structure', 'total']
+
+# Kapasite dolduğunda diziler bu oranda büyütülür
+GROWTH_FACTOR = 2
+INITIAL_CAPACITY = 1024
+
+
+class ResultStore:
+    """
+    Karşılaştırma sonuçlarının sütun tabanlı deposu.
+
+    Skorlar numpy dizilerinde, dosya yolları tekil yol listesine indeks
+    olarak, kategoriler kod olarak tutulur. Her sonuç eklenme sırasındaki
+    satır kimliğiyle (row id) adreslenir; sıralama yalnızca kimlik
+    dizilerinin sırasını değiştirir, kimlikler değişmez.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self._count = 0
+        self._capacity = INITIAL_CAPACITY
+        self.scores = {column: np.zeros(self._capacity, dtype=np.float32) for column in SCORE_COLUMNS}
+        self.path_ids = np.zeros((self._capacity, 2), dtype=np.int32)
+        self.category_codes = np.zeros(self._capacity, dtype=np.int16)
+        self.paths = []
+        self._path_index = {}
+        self.categories = []
+        self._category_index = {}
+        self.file_types = []
+        self.details = []
+        self._sort_cache = {}
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        for row_id in range(self._count):
+            yield self.row(row_id)
+
+    def _grow(self, needed):
+        if needed <= self._capacity:
+            return
+        capacity = self._capacity
+        while capacity < needed:
+            capacity *= GROWTH_FACTOR
+        for column in SCORE_COLUMNS:
+            self.scores[column] = np.resize(self.scores[column], capacity)
+        self.path_ids = np.resize(self.path_ids, (capacity, 2))
+        self.category_codes = np.resize(self.category_codes, capacity)
+        self._capacity = capacity
+
+    def _intern(self, value, values, index):
+        code = index.get(value)
+        if code is None:
+            code = len(values)
+            values.append(value)
+            index[value] = code
+        return code
+
+    def extend(self, results):
+        """
+        FileComparator.compare_files sonuçlarını ekler.
+
+        Returns:
+            Eklenen satırların kimlikleri (range)
+        """
+        start = self._count
+        end = start + len(results)
+        self._grow(end)
+        # Değerler önce listelerde toplanır, diziler tek dilim atamasıyla doldurulur
+        scores = {column: [] for column in SCORE_COLUMNS}
+        path_ids = []
+        category_codes = []
+        for result in results:
+            details = result.get('details', {})
+            for column in SCORE_COLUMNS:
+                scores[column].append(result.get('total', 0) if column == 'total' else details.get(column, 0))
+            path_ids.append((self._intern(result['file1'], self.paths, self._path_index),
+                             self._intern(result['file2'], self.paths, self._path_index)))
+            category_codes.append(self._intern(result.get('category', 'Hata'), self.categories, self._category_index))
+            self.file_types.append(result.get('file_type', 'unknown'))
+            self.details.append(details)
+        if end > start:
+            for column in SCORE_COLUMNS:
+                self.scores[column][start:end] = scores[column]
+            self.path_ids[start:end] = path_ids
+            self.category_codes[start:end] = category_codes
+        self._count = end
+        return range(start, end)
+
+    def append(self, result):
+        return self.extend([result])
+
+    def score(self, column, row_id):
+        return float(self.scores[column][row_id])
+
+    def total_scores(self):
+        """Geçerli satırların toplam skorları (kopyasız görünüm)."""
+        return self.scores['total'][:self._count]
+
+    def path(self, row_id, side):
+        return self.paths[self.path_ids[row_id, side]]
+
+    def category(self, row_id):
+        return self.categories[self.category_codes[row_id]]
+
+    def value(self, column, row_id):
+        """Sütunun ham (sıralanabilir) değeri."""
+        if column == 'file1':
+            return os.path.basename(self.path(row_id, 0))
+        if column == 'file2':
+            return os.path.basename(self.path(row_id, 1))
+        if column == 'category':
+            return self.category(row_id)
+        return self.score(column, row_id)
+
+    def display(self, column, row_id):
+        """Sütunun tabloda gösterilen metni."""
+        value = self.value(column, row_id)
+        if column in SCORE_COLUMNS:
+            return f"{value:.1f}"
+        return value
+
+    def row(self, row_id):
+        """Satırı rapor/detay görünümünün kullandığı sözlük biçiminde döndürür."""
+        row = {column: self.display(column, row_id) for column in COLUMNS}
+        row['file_type'] = self.file_types[row_id]
+        row['Path1'] = self.path(row_id, 0)
+        row['Path2'] = self.path(row_id, 1)
+        row['Details'] = self.details[row_id]
+        return row
+
+    def sort_order(self, column, descending=False):
+        """
+        Satır kimliklerinin sütuna göre sıralı dizisi.
+
+        Artan sıra her sütun için bir kez hesaplanır ve yeni satır
+        eklenene kadar önbellekte tutulur; azalan sıra bunun tersidir.
+        """
+        cached = self._sort_cache.get(column)
+        if cached is None or len(cached) != self._count:
+            if column in SCORE_COLUMNS:
+                cached = np.argsort(self.scores[column][:self._count], kind='stable')
+            else:
+                # Metin sütunları tekil değerler üzerinden sıralanır
+                if column == 'category':
+                    values, codes = self.categories, self.category_codes[:self._count]
+                else:
+                    side = 0 if column == 'file1' else 1
+                    values = [os.path.basename(p) for p in self.paths]
+                    codes = self.path_ids[:self._count, side]
+                ranks = np.empty(len(values), dtype=np.int64)
+                ranks[sorted(range(len(values)), key=lambda k: values[k].lower())] = np.arange(len(values))
+                cached = np.argsort(ranks[codes], kind='stable')
+            self._sort_cache[column] = cached
+        return cached[::-1] if descending else cached
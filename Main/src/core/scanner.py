@@ -0,0 +1,327 @@
+# Main/src/core/scanner.py
+import os
+from collections import deque
+from .cache import ProfileCache
+from .discovery import DEFAULT_EXCLUDES, DEFAULT_WALK_WORKERS, FileFilter, FileDiscovery, walk_files
+from .engine import ComparisonEngine
+from .pairing import group_exact_duplicates, iter_group_pairs, prune_pairs, count_pair_bytes
+from .progress import ProgressTracker
+from .tracing import make_tracer, WorkerProfiler
+from .snapshot import ScanSnapshot, default_snapshot_path, classify_files, build_delta
+
+
+class FolderScanner:
+    """
+    Bir klasör taramasının arayüzden bağımsız boru hattı.
+
+    Klasör ağacını paralel olarak keşfeder (dışlama kuralları, boyut ve
+    tarih filtreleriyle), keşfedilen dosyaların profillerini keşif sürerken
+    çıkarır, bayt bayt aynı dosyaları
+    doğrudan sonuçlandırır, eşiğe ulaşamayacak çiftleri budar ve kalanları
+    karşılaştırma motoruna verir. scan() olayları (tür, veri) demetleri
+    olarak üretir:
+        ('status', anahtar)          - dil dosyasındaki durum anahtarı
+        ('results', [sonuç, ...])    - FileComparator.compare_files sonuçları
+        ('progress', {...})          - ProgressTracker.snapshot() (sabit aralıkla)
+        ('timings', TimingSummary)   - aşama süreleri özeti (collect_timings açıksa, sonda)
+
+    scan_cross() iki klasörü karşılaştırır ve yalnızca klasörler arası
+    çiftleri üretir; olaylar scan() ile aynıdır.
+
+    incremental açıksa scan() önceki taramanın görüntüsünü okur, yalnızca
+    eklenen/değişen dosyaları içeren çiftleri karşılaştırır, diğer sonuçları
+    görüntüden ekler ve sonda bir fark olayı üretir:
+        ('delta', {...})             - snapshot.build_delta() özeti
+
+    trace_path verilirse listeleme, profil çıkarma ve her çift karşılaştırması
+    Chrome Trace Event aralıkları olarak kaydedilir; dosyayı tarama bittikten
+    sonra (arayüz olayları da eklendiğinde) write_trace() yazar. profile_dir
+    verilirse ana süreç ve her işçi kendi cProfile dosyasını oraya yazar.
+    """
+
+    def __init__(self, comparator, file_types=('all',), min_similarity=0, workers=None,
+                 use_cache=True, cache_path=None, collect_timings=False,
+                 trace_path=None, profile_dir=None, recursive=True, excludes=None,
+                 min_size=None, max_size=None, modified_after=None, modified_before=None,
+                 walk_workers=DEFAULT_WALK_WORKERS, incremental=False, snapshot_path=None):
+        self.comparator = comparator
+        self.collect_timings = collect_timings
+        self.trace_path = trace_path
+        self.tracer = make_tracer(bool(trace_path), 'SpotOn')
+        self.profile_dir = profile_dir
+        self.file_types = list(file_types) or ['all']
+        self.min_similarity = min_similarity
+        self.workers = workers
+        self.use_cache = use_cache
+        self.cache_path = cache_path
+        # Keşif ayarları; excludes verilmezse kilit/yedek dosyaları dışlanır
+        self.recursive = recursive
+        self.excludes = DEFAULT_EXCLUDES if excludes is None else list(excludes)
+        self.min_size = min_size
+        self.max_size = max_size
+        self.modified_after = modified_after
+        self.modified_before = modified_before
+        self.walk_workers = walk_workers
+        self.incremental = incremental
+        self.snapshot_path = snapshot_path
+        self.engine = None
+        self.is_running = True
+        self.total_comparisons = 0
+        self.processed = 0
+        self.progress = ProgressTracker()
+
+    def stop(self):
+        self.is_running = False
+        if self.engine is not None:
+            self.engine.cancel()
+
+    def write_trace(self):
+        """İzleme açıksa kaydedilen olayları trace_path dosyasına yazar."""
+        if self.trace_path:
+            return self.tracer.write(self.trace_path)
+        return None
+
+    def get_extensions(self):
+        """Seçili dosya tiplerinin uzantıları; boş küme tüm dosyalar demektir."""
+        if 'all' in self.file_types:
+            return set()
+        extensions = set()
+        for file_type in self.file_types:
+            extensions.update(self.comparator.supported_extensions[file_type])
+        return extensions
+
+    def get_file_filter(self):
+        return FileFilter(self.excludes, self.get_extensions(), self.min_size, self.max_size,
+                          self.modified_after, self.modified_before)
+
+    def list_files(self, folder):
+        """Keşif kurallarına uyan tüm dosya yollarını (ağaç bitene kadar bekleyerek) döndürür."""
+        return [path for files in walk_files(folder, self.get_file_filter(), self.recursive,
+                                             self.walk_workers, tracer=self.tracer)
+                for path, _ in files]
+
+    def iter_discovered(self, folder):
+        """
+        Keşfedilen dosyaları (yol, stat) olarak keşif sürerken üretir.
+
+        Kuyruktaki yeni dosyalar her adımda ilerleme toplamlarına eklenir;
+        böylece yüzde ve kalan süre o ana kadar bulunan işe göre hesaplanır.
+        """
+        discovery = FileDiscovery(folder, self.get_file_filter(), self.recursive,
+                                  self.walk_workers, self.tracer).start()
+        pending = deque()
+        try:
+            while self.is_running:
+                for path, stat in discovery.drain(block=not pending):
+                    self.progress.expand(1, stat.st_size)
+                    pending.append((path, stat))
+                if not pending:
+                    if discovery.finished:
+                        break
+                    continue
+                yield pending.popleft()
+        finally:
+            discovery.stop()
+
+    def iter_profiles(self, paths):
+        """
+        Her dosyayı bir kez okuyarak (veya önbellekten) profillerini üretir.
+
+        paths öğeleri yol veya keşiften gelen (yol, stat) demetleri olabilir.
+        """
+        cache = ProfileCache(self.cache_path) if self.use_cache else None
+        profiler = WorkerProfiler(self.profile_dir, 'profiling') if self.profile_dir else None
+        tracer = self.tracer
+        try:
+            for item in paths:
+                if not self.is_running:
+                    break
+                path, stat = item if isinstance(item, tuple) else (item, None)
+                with tracer.span('profile', 'io', {'path': path} if tracer.enabled else None):
+                    if profiler is not None:
+                        with profiler:
+                            profile = self.comparator.build_profile(path, cache, stat)
+                    else:
+                        profile = self.comparator.build_profile(path, cache, stat)
+                yield profile
+        finally:
+            if cache is not None:
+                cache.close()
+            if profiler is not None:
+                profiler.dump()
+
+    def build_profiles(self, paths):
+        return list(self.iter_profiles(paths))
+
+    def scan(self, folder):
+        if self.incremental:
+            # Görüntüdeki yollarla eşleşmesi için yollar mutlak tutulur
+            folder = os.path.abspath(folder)
+        self.is_running = True
+        self.processed = 0
+        self.total_comparisons = 0
+
+        # Her dosya tarama başında bir kez okunur, çiftler profilleri kullanır;
+        # profil çıkarma ağacın tamamı listelenmeden ilk bulunan dosyalarla başlar
+        yield 'status', 'status_profiling'
+        self.progress.start('profiling', 0, 0)
+        profiles = []
+        for profile in self.iter_profiles(self.iter_discovered(folder)):
+            profiles.append(profile)
+            if self.progress.update(1, max(profile.size, 0)):
+                yield 'progress', self.progress.snapshot()
+        yield 'progress', self.progress.snapshot()
+        if self.incremental:
+            yield from self.compare_incremental(folder, profiles)
+        else:
+            yield from self.compare_profiles(profiles)
+
+    def compare_incremental(self, folder, profiles):
+        """
+        Yalnızca eklenen veya değişen dosyaları içeren çiftleri karşılaştırır.
+
+        Profil sırası korunur, böylece çiftlerin yönü tam taramayla aynıdır.
+        İki dosyası da değişmemiş çiftlerin sonuçları önceki taramadan eklenir.
+        SolidWorks skorları taranan tüm dosyalardan hesaplanan ad ağırlıklarına
+        bağlıdır; ağırlıklar değiştiyse SolidWorks dosyalarının tüm çiftleri
+        yeniden karşılaştırılır. Tarama tamamlanırsa görüntü yeni sonuçlarla
+        güncellenir.
+        """
+        snapshot = ScanSnapshot(self.snapshot_path or default_snapshot_path(folder, self.cache_path))
+        try:
+            previous = snapshot.load(self.min_similarity)
+            previous_files, previous_results, previous_fingerprint = (
+                previous if previous is not None else (None, [], None))
+            added, modified, unchanged, removed = classify_files(profiles, previous_files)
+            self.comparator.set_token_corpus(profiles)
+            token_fingerprint = self.comparator.solidworks_comparator.token_fingerprint
+            if previous_fingerprint != token_fingerprint:
+                reusable = [p for p in unchanged if p.file_type != 'solidworks']
+            else:
+                reusable = unchanged
+            clean = {os.path.abspath(p.path) for p in reusable}
+            cached = [result for result in previous_results
+                      if os.path.abspath(result['file1']) in clean and os.path.abspath(result['file2']) in clean]
+
+            clean_pairs = len(reusable) * (len(reusable) - 1) // 2
+            self.total_comparisons = self.processed = clean_pairs
+            if cached:
+                yield 'results', cached
+
+            clean_ids = {id(p) for p in reusable}
+            dirty = {index for index, profile in enumerate(profiles) if id(profile) not in clean_ids}
+            results = list(cached)
+            for event, data in self.compare_profiles(profiles, dirty=dirty):
+                if event == 'results':
+                    results.extend(data)
+                yield event, data
+
+            if self.is_running:
+                snapshot.save(self.min_similarity, profiles, results, token_fingerprint)
+            yield 'delta', build_delta(added, modified, removed, previous_results, results)
+        finally:
+            snapshot.close()
+
+    def scan_cross(self, folder_a, folder_b):
+        """
+        Yalnızca folder_a ile folder_b arasındaki çiftleri karşılaştırır.
+
+        Klasör içi çiftler (A² + B²) hiç üretilmez. Dosya sayısı az olan
+        taraf profil listesinin başına konur; her satır küçük taraftaki bir
+        dosya ile büyük taraftaki adaylarıdır, böylece iş küçük taraf
+        üzerinden işçilere dağılır. Büyük taraf (genellikle kütüphane)
+        profilleri önbellekten okunur; yalnızca değişen dosyalar yeniden
+        okunur. Sonuçlarda file1 küçük taraftan, file2 büyük taraftandır.
+        """
+        self.is_running = True
+        self.processed = 0
+        self.total_comparisons = 0
+
+        yield 'status', 'status_profiling'
+        file_filter = self.get_file_filter()
+        sides = []
+        for folder in (folder_a, folder_b):
+            with self.tracer.span('list_files', 'io', {'folder': folder}):
+                sides.append([entry for files in walk_files(folder, file_filter, self.recursive,
+                                                            self.walk_workers, lambda: not self.is_running,
+                                                            self.tracer)
+                              for entry in files])
+        small, large = sorted(sides, key=len)
+        # İç içe klasörlerde iki tarafta da görünen dosya kendisiyle eşleştirilmez
+        small_paths = {os.path.normcase(os.path.abspath(path)) for path, _ in small}
+        large = [entry for entry in large if os.path.normcase(os.path.abspath(entry[0])) not in small_paths]
+        entries = small + large
+        self.progress.start('profiling', len(entries), sum(stat.st_size for _, stat in entries))
+        profiles = []
+        for profile in self.iter_profiles(entries):
+            profiles.append(profile)
+            if self.progress.update(1, max(profile.size, 0)):
+                yield 'progress', self.progress.snapshot()
+        yield 'progress', self.progress.snapshot()
+        yield from self.compare_profiles(profiles, split=min(len(small), len(profiles)))
+
+    def compare_profiles(self, profiles, split=None, dirty=None):
+        """
+        Profili çıkarılmış dosyaların çiftlerini karşılaştırır ve olaylarını üretir.
+
+        Çift uzayı total_comparisons ve processed sayaçlarına eklenir.
+
+        Args:
+            profiles: Dosya profilleri listesi
+            split: Verilirse yalnızca [0, split) ile [split, n) arasındaki çiftler
+            dirty: Verilirse yalnızca en az bir dosyası bu indeks kümesinde olan çiftler
+        """
+        n = len(profiles)
+        if split is not None:
+            pair_space = split * (n - split)
+        elif dirty is not None:
+            clean = n - len(dirty)
+            pair_space = n * (n - 1) // 2 - clean * (clean - 1) // 2
+        else:
+            pair_space = n * (n - 1) // 2
+        self.total_comparisons += pair_space
+
+        # Bayt bayt aynı dosyalar doğrudan "Tam Eşleşme" olarak eklenir
+        with self.tracer.span('exact_duplicates', 'scan'):
+            exact_pairs = list(iter_group_pairs(group_exact_duplicates(profiles), split, dirty))
+            exact_results = []
+            for i, j in exact_pairs:
+                result = self.comparator.exact_match_result(profiles[i], profiles[j])
+                if result['total'] >= self.min_similarity:
+                    exact_results.append(result)
+        self.processed += len(exact_pairs)
+        if exact_results:
+            yield 'results', exact_results
+
+        # Skor üst sınırı eşiğe ulaşamayan çiftler hiç karşılaştırılmaz
+        with self.tracer.span('prune_pairs', 'scan'):
+            rows, pair_count = prune_pairs(
+                profiles, self.comparator.supported_extensions['solidworks'],
+                self.min_similarity, exact_pairs, split, dirty
+            )
+        self.processed += pair_space - len(exact_pairs) - pair_count
+
+        # İlerleme yalnızca gerçekten karşılaştırılacak çiftlerin baytlarıyla ölçülür
+        self.progress.start('comparing', self.total_comparisons, count_pair_bytes(profiles, rows))
+        self.progress.update(self.processed)
+        yield 'progress', self.progress.snapshot()
+
+        # Geri kalan çiftler ayrıntılı karşılaştırma motoruna gider; SolidWorks
+        # ad ağırlıkları taranan tüm dosyalardan hesaplanır
+        self.comparator.set_collect_timings(self.collect_timings)
+        self.comparator.set_token_corpus(profiles)
+        self.engine = ComparisonEngine(self.comparator, self.workers,
+                                       tracer=self.tracer, profile_dir=self.profile_dir)
+        for processed, processed_bytes, chunk_results in self.engine.run(
+                profiles, rows=rows,
+                min_similarity=self.min_similarity,
+                should_stop=lambda: not self.is_running,
+                total_pairs=pair_count):
+            self.processed += processed
+            if chunk_results:
+                yield 'results', chunk_results
+            if self.progress.update(processed, processed_bytes):
+                yield 'progress', self.progress.snapshot()
+        yield 'progress', self.progress.snapshot()
+        if self.collect_timings:
+            yield 'timings', self.engine.timing_summary
@@ -0,0 +1,68 @@
+# Main/src/core/sectioncache.py
+import threading
+from collections import OrderedDict
+
+# Süreç başına açılmış bölüm verisi için varsayılan bellek sınırı
+DEFAULT_SECTION_CACHE_BYTES = 64 * 1024 * 1024
+
+
+class SectionCache:
+    """
+    Açılmış (inflate edilmiş) SolidWorks bölümleri için boyut sınırlı LRU önbellek.
+
+    Anahtar bölümün saklanan verisinin hash'idir; aynı içerikli bölümler
+    (kopyalar, revizyonlar arasında değişmeyen bölümler) dosyadan bağımsız
+    olarak bir kez açılır. Toplam boyut max_bytes'ı aşınca en uzun süredir
+    kullanılmayan kayıtlar atılır; tek başına sınırın yarısını aşan kayıtlar
+    hiç saklanmaz.
+
+    Args:
+        max_bytes: Saklanan değerlerin toplam boyut sınırı
+    """
+
+    def __init__(self, max_bytes=DEFAULT_SECTION_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value, nbytes):
+        """
+        Değeri saklar.
+
+        Args:
+            key: Bölüm hash'i
+            value: Saklanacak nesne
+            nbytes: Değerin bellekte kapladığı yaklaşık bayt
+        """
+        if nbytes > self.max_bytes // 2:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size -= previous[1]
+            self._entries[key] = (value, nbytes)
+            self.size += nbytes
+            while self.size > self.max_bytes and self._entries:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.size -= evicted
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
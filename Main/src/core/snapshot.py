@@ -0,0 +1,178 @@
+# Main/src/core/snapshot.py
+import os
+import time
+import pickle
+import hashlib
+import sqlite3
+import logging
+from .cache import DEFAULT_CACHE_PATH
+from .profile import PROFILE_VERSION
+
+# Kayıt biçimi veya karşılaştırma skorları değiştiğinde artırılır; eski
+# anlık görüntüler yok sayılır ve tam tarama yapılır
+SNAPSHOT_VERSION = 1
+
+# İki tarama arasında bu kadar (puan) değişen skorlar "değişti" sayılır
+SCORE_CHANGE_EPSILON = 0.01
+
+
+def default_snapshot_path(folder, cache_path=None):
+    """Klasör için profil önbelleğinin yanında bir tarama görüntüsü dosyası yolu."""
+    key = hashlib.md5(os.path.normcase(os.path.abspath(folder)).encode('utf-8')).hexdigest()[:12]
+    return os.path.join(os.path.dirname(os.path.abspath(cache_path or DEFAULT_CACHE_PATH)),
+                        f'scan_{key}.sqlite3')
+
+
+def pair_key(result):
+    # Çiftin yönü profil sırasına bağlıdır; fark hesabında sırasız anahtar kullanılır
+    return tuple(sorted((result['file1'], result['file2'])))
+
+
+class ScanSnapshot:
+    """
+    Bir klasör taramasının dosya listesini ve sonuçlarını saklayan SQLite deposu.
+
+    Artımlı taramada önceki taramanın (boyut, mtime, hash) bilgileriyle
+    eklenen, silinen ve değişen dosyalar bulunur; iki dosyası da değişmemiş
+    çiftlerin sonuçları buradan okunur.
+    """
+
+    def __init__(self, db_path):
+        self.db_path = os.path.abspath(db_path)
+        self._conn = None
+
+    def connect(self):
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+                CREATE TABLE IF NOT EXISTS files (
+                    path TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    md5 TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS results (
+                    file1 TEXT NOT NULL,
+                    file2 TEXT NOT NULL,
+                    total REAL NOT NULL,
+                    payload BLOB NOT NULL
+                );
+            """)
+        return self._conn
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def load(self, min_similarity):
+        """
+        Önceki taramayı okur.
+
+        Önceki tarama daha yüksek bir eşikle yapıldıysa sonuçları eksiktir;
+        bu durumda ve sürüm uyuşmazlığında None döner (tam tarama gerekir).
+
+        Args:
+            min_similarity: Bu taramanın minimum toplam skoru
+
+        Returns:
+            ({yol: (boyut, mtime_ns, md5)}, [sonuç, ...], SolidWorks ad ağırlıklarının
+            parmak izi) veya None
+        """
+        try:
+            conn = self.connect()
+            meta = dict(conn.execute("SELECT key, value FROM meta"))
+            if (meta.get('version') != str(SNAPSHOT_VERSION) or
+                    meta.get('profile_version') != str(PROFILE_VERSION) or
+                    float(meta.get('min_similarity', 'inf')) > min_similarity):
+                return None
+            files = {path: (size, mtime_ns, md5)
+                     for path, size, mtime_ns, md5 in conn.execute("SELECT path, size, mtime_ns, md5 FROM files")}
+            results = [pickle.loads(payload)
+                       for payload, in conn.execute("SELECT payload FROM results WHERE total >= ?",
+                                                    (min_similarity,))]
+            return files, results, meta.get('token_fingerprint')
+        except Exception as e:
+            logging.error(f"Tarama görüntüsü okuma hatası: {e}")
+            return None
+
+    def save(self, min_similarity, profiles, results, token_fingerprint=''):
+        """
+        Taramanın dosya listesini ve tüm sonuçlarını öncekinin yerine yazar.
+
+        Args:
+            token_fingerprint: Sonuçların hesaplandığı SolidWorks ad ağırlıklarının parmak izi
+        """
+        try:
+            conn = self.connect()
+            with conn:
+                conn.execute("DELETE FROM files")
+                conn.execute("DELETE FROM results")
+                conn.executemany("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)",
+                                 ((os.path.abspath(p.path), p.size, p.mtime_ns, p.md5)
+                                  for p in profiles if not p.error))
+                conn.executemany("INSERT INTO results VALUES (?, ?, ?, ?)",
+                                 ((r['file1'], r['file2'], r['total'], pickle.dumps(r, pickle.HIGHEST_PROTOCOL))
+                                  for r in results))
+                conn.executemany("INSERT OR REPLACE INTO meta VALUES (?, ?)", [
+                    ('version', str(SNAPSHOT_VERSION)),
+                    ('profile_version', str(PROFILE_VERSION)),
+                    ('min_similarity', str(min_similarity)),
+                    ('token_fingerprint', token_fingerprint),
+                    ('updated', str(time.time()))
+                ])
+        except Exception as e:
+            logging.error(f"Tarama görüntüsü yazma hatası: {e}")
+
+
+def classify_files(profiles, previous_files):
+    """
+    Profilleri önceki taramanın dosya listesiyle karşılaştırır.
+
+    Args:
+        profiles: Bu taramanın profilleri
+        previous_files: {mutlak yol: (boyut, mtime_ns, md5)}; None ise her dosya yeni sayılır
+
+    Returns:
+        (eklenen, değişen, değişmeyen profil listeleri, silinen yollar)
+    """
+    added, modified, unchanged = [], [], []
+    seen = set()
+    for profile in profiles:
+        path = os.path.abspath(profile.path)
+        seen.add(path)
+        previous = (previous_files or {}).get(path)
+        if previous is None or profile.error:
+            added.append(profile)
+        elif previous != (profile.size, profile.mtime_ns, profile.md5):
+            modified.append(profile)
+        else:
+            unchanged.append(profile)
+    removed = sorted(path for path in (previous_files or {}) if path not in seen)
+    return added, modified, unchanged, removed
+
+
+def build_delta(added, modified, removed, old_results, new_results):
+    """
+    "Son taramadan bu yana ne değişti" özetini oluşturur.
+
+    Returns:
+        Eklenen/değişen/silinen dosyalar ve yeni, kaybolan, skoru değişen eşleşmeler
+    """
+    old_scores = {pair_key(result): result['total'] for result in old_results}
+    new_scores = {pair_key(result): result['total'] for result in new_results}
+    return {
+        'added': [p.path for p in added],
+        'modified': [p.path for p in modified],
+        'removed': removed,
+        'new_matches': [{'file1': a, 'file2': b, 'total': new_scores[(a, b)]}
+                        for a, b in sorted(set(new_scores) - set(old_scores))],
+        'lost_matches': [{'file1': a, 'file2': b, 'total': old_scores[(a, b)]}
+                         for a, b in sorted(set(old_scores) - set(new_scores))],
+        'changed_matches': [{'file1': a, 'file2': b, 'old_total': old_scores[(a, b)], 'total': new_scores[(a, b)]}
+                            for a, b in sorted(set(old_scores) & set(new_scores))
+                            if abs(old_scores[(a, b)] - new_scores[(a, b)]) > SCORE_CHANGE_EPSILON]
+    }
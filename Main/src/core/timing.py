@@ -0,0 +1,144 @@
+# Main/src/core/timing.py
+import time
+
+
+class _Stage:
+    __slots__ = ('timer', 'name', 'started')
+
+    def __init__(self, timer, name):
+        self.timer = timer
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.timer.add(self.name, time.perf_counter() - self.started)
+        return False
+
+
+class StageTimer:
+    """
+    Bir karşılaştırmanın aşama sürelerini (saniye) toplar.
+
+    Kullanım:
+        timer = make_timer(enabled)
+        with timer.stage('content'):
+            ...
+        result['timings'] = timer.stages
+    """
+
+    enabled = True
+
+    def __init__(self):
+        self.stages = {}
+
+    def stage(self, name):
+        return _Stage(self, name)
+
+    def add(self, name, seconds):
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    def merge(self, stages):
+        for name, seconds in (stages or {}).items():
+            self.add(name, seconds)
+
+
+class _NullStage:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class NullTimer:
+    """Ölçüm kapalıyken kullanılan, hiçbir şey yapmayan zamanlayıcı."""
+
+    enabled = False
+    stages = None
+
+    def stage(self, name):
+        return _NULL_STAGE
+
+    def add(self, name, seconds):
+        pass
+
+    def merge(self, stages):
+        pass
+
+
+NULL_TIMER = NullTimer()
+
+
+def make_timer(enabled):
+    """Ölçüm açıksa yeni bir StageTimer, kapalıysa paylaşılan NullTimer döndürür."""
+    return StageTimer() if enabled else NULL_TIMER
+
+
+class TimingSummary:
+    """
+    Aşama sürelerinin dosya tipine göre toplamı.
+
+    Her dosya tipi için aşama başına toplam süre ve ölçülen çift sayısı
+    tutulur; işçi süreçlerinden gelen özetler merge() ile birleştirilir.
+    """
+
+    def __init__(self, data=None):
+        # {dosya tipi: {'pairs': n, 'stages': {aşama: toplam saniye}}}
+        self.data = {}
+        if data:
+            self.merge(data)
+
+    def __bool__(self):
+        return bool(self.data)
+
+    def add(self, file_type, stages):
+        if not stages:
+            return
+        entry = self.data.setdefault(file_type, {'pairs': 0, 'stages': {}})
+        entry['pairs'] += 1
+        for name, seconds in stages.items():
+            entry['stages'][name] = entry['stages'].get(name, 0.0) + seconds
+
+    def merge(self, other):
+        data = other.data if isinstance(other, TimingSummary) else other
+        for file_type, source in (data or {}).items():
+            entry = self.data.setdefault(file_type, {'pairs': 0, 'stages': {}})
+            entry['pairs'] += source['pairs']
+            for name, seconds in source['stages'].items():
+                entry['stages'][name] = entry['stages'].get(name, 0.0) + seconds
+
+    def to_dict(self):
+        return {file_type: {'pairs': entry['pairs'], 'stages': dict(entry['stages'])}
+                for file_type, entry in self.data.items()}
+
+    def rows(self):
+        """
+        Görüntüleme için (dosya tipi, aşama, toplam sn, çift başına ms, pay %) satırları.
+
+        Pay, aşamanın o dosya tipindeki 'total' süresine oranıdır.
+        """
+        rows = []
+        for file_type in sorted(self.data):
+            entry = self.data[file_type]
+            pairs = max(entry['pairs'], 1)
+            stages = entry['stages']
+            total = stages.get('total') or sum(stages.values())
+            for name, seconds in sorted(stages.items(), key=lambda item: -item[1]):
+                share = seconds / total * 100 if total > 0 else 0
+                rows.append((file_type, name, seconds, seconds / pairs * 1000, share))
+        return rows
+
+    def format_table(self):
+        """Özeti düz metin tablo olarak döndürür."""
+        lines = [f"{'tip':<12} {'aşama':<16} {'toplam sn':>10} {'ms/çift':>9} {'pay %':>7}"]
+        for file_type, name, seconds, per_pair, share in self.rows():
+            lines.append(f"{file_type:<12} {name:<16} {seconds:>10.3f} {per_pair:>9.3f} {share:>7.1f}")
+        return "\n".join(lines)
@@ -0,0 +1,186 @@
+# Main/src/core/tracing.py
+import os
+import json
+import time
+import logging
+import cProfile
+import threading
+
+
+def _now_us():
+    # perf_counter tüm süreçlerde aynı monoton saati kullanır (Linux, Windows);
+    # böylece işçi süreçlerinin olayları ana süreçle aynı zaman ekseninde durur
+    return time.perf_counter() * 1e6
+
+
+class _Span:
+    __slots__ = ('tracer', 'name', 'cat', 'args', 'started')
+
+    def __init__(self, tracer, name, cat, args):
+        self.tracer = tracer
+        self.name = name
+        self.cat = cat
+        self.args = args
+
+    def __enter__(self):
+        self.started = _now_us()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.tracer.complete(self.name, self.cat, self.started, _now_us() - self.started, self.args)
+        return False
+
+
+class TraceRecorder:
+    """
+    Chrome Trace Event biçiminde zaman aralıkları (span) kaydeder.
+
+    Olaylar süreç ve thread kimliğiyle tutulur; çıktı Perfetto veya
+    chrome://tracing ile açılabilir. İşçi süreçleri kendi kayıtçılarını
+    kullanır, olaylarını drain() ile ana sürece gönderir.
+
+    Kullanım:
+        tracer = make_tracer(enabled)
+        with tracer.span('list_files', 'scan'):
+            ...
+        tracer.write('scan.trace.json')
+    """
+
+    enabled = True
+
+    def __init__(self, process_name=None):
+        self.pid = os.getpid()
+        self.events = []
+        self._named_threads = set()
+        self._lock = threading.Lock()
+        if process_name:
+            self._metadata('process_name', 0, process_name)
+
+    def _metadata(self, name, tid, value):
+        self.events.append({'name': name, 'ph': 'M', 'pid': self.pid, 'tid': tid,
+                            'args': {'name': value}})
+
+    def _thread_id(self):
+        tid = threading.get_ident()
+        if tid not in self._named_threads:
+            # Arayüz ve tarama thread'leri iz görüntüleyicide adlarıyla görünür
+            with self._lock:
+                if tid not in self._named_threads:
+                    self._named_threads.add(tid)
+                    self._metadata('thread_name', tid, threading.current_thread().name)
+        return tid
+
+    def span(self, name, cat='scan', args=None):
+        return _Span(self, name, cat, args)
+
+    def complete(self, name, cat, started, duration, args=None):
+        event = {'name': name, 'cat': cat, 'ph': 'X', 'ts': started, 'dur': duration,
+                 'pid': self.pid, 'tid': self._thread_id()}
+        if args:
+            event['args'] = args
+        self.events.append(event)
+
+    def drain(self):
+        """Biriken olayları döndürür ve listeyi boşaltır."""
+        events = self.events
+        self.events = []
+        return events
+
+    def extend(self, events):
+        """Başka bir süreçten gelen olayları ekler."""
+        if events:
+            self.events.extend(events)
+
+    def write(self, path):
+        """
+        Olayları Chrome Trace Event JSON dosyasına yazar.
+
+        Args:
+            path: Hedef dosya yolu
+
+        Returns:
+            Yazılan olay sayısı, hata durumunda None
+        """
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump({'traceEvents': self.events, 'displayTimeUnit': 'ms'}, f)
+            return len(self.events)
+        except Exception as e:
+            logging.error(f"İz dosyası yazma hatası: {e}")
+            return None
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class NullTracer:
+    """İzleme kapalıyken kullanılan, hiçbir şey kaydetmeyen kayıtçı."""
+
+    enabled = False
+    events = ()
+
+    def span(self, name, cat='scan', args=None):
+        return _NULL_SPAN
+
+    def complete(self, name, cat, started, duration, args=None):
+        pass
+
+    def drain(self):
+        return None
+
+    def extend(self, events):
+        pass
+
+    def write(self, path):
+        return None
+
+
+NULL_TRACER = NullTracer()
+
+
+def make_tracer(enabled, process_name=None):
+    """İzleme açıksa yeni bir TraceRecorder, kapalıysa paylaşılan NullTracer döndürür."""
+    return TraceRecorder(process_name) if enabled else NULL_TRACER
+
+
+class WorkerProfiler:
+    """
+    İsteğe bağlı cProfile ölçümü; her süreç kendi .prof dosyasını yazar.
+
+    with bloğu yalnızca içindeki çağrıları (aynı thread) ölçer; birden çok
+    blok aynı profilde birikir. dump() birikmiş istatistikleri her seferinde
+    yeniden yazar; böylece iptal edilen taramalarda da dosya güncel kalır.
+    Dosyalar snakeviz veya pstats ile incelenebilir.
+    """
+
+    def __init__(self, output_dir, name):
+        self.path = os.path.join(output_dir, f"{name}-{os.getpid()}.prof")
+        self.profile = cProfile.Profile()
+        try:
+            os.makedirs(output_dir, exist_ok=True)
+        except OSError as e:
+            logging.error(f"Profil klasörü oluşturulamadı: {e}")
+
+    def __enter__(self):
+        self.profile.enable()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.profile.disable()
+        return False
+
+    def dump(self):
+        try:
+            self.profile.dump_stats(self.path)
+        except Exception as e:
+            logging.error(f"Profil dosyası yazma hatası: {e}")
@@ -1,10 +1,11 @@
 # Main/src/core/utils.py
 import os
 import hashlib
-import math
 import logging
 import difflib
 from datetime import datetime
+import numpy as np
+from .fileio import iter_file_chunks, read_range, hash_file
 
 def get_file_info(path):
     try:
@@ -47,8 +48,8 @@ def compare_files(file1, file2, data1, data2):
 
     # Hash karşılaştırması
     try:
-        hash1 = hashlib.md5(open(file1, 'rb').read()).hexdigest()
-        hash2 = hashlib.md5(open(file2, 'rb').read()).hexdigest()
+        hash1 = hash_file(file1)
+        hash2 = hash_file(file2)
         hash_score = 100 if hash1 == hash2 else 0
     except Exception as e:
         logging.error(f"Hash hesaplama hatası: {e}")
@@ -80,18 +81,13 @@ def compare_binary_content(file1, file2, block_size=1024):
         Benzerlik yüzdesi (0-100)
     """
     try:
-        with open(file1, 'rb') as f1, open(file2, 'rb') as f2:
-            total_similarity = 0
-            block_count = 0
-            while True:
-                block1 = f1.read(block_size)
-                block2 = f2.read(block_size)
-                if not block1 or not block2:
-                    break
-                seq = difflib.SequenceMatcher(None, block1, block2)
-                total_similarity += seq.ratio()
-                block_count += 1
-            return (total_similarity / block_count) * 100 if block_count > 0 else 0
+        total_similarity = 0
+        block_count = 0
+        for block1, block2 in zip(iter_file_chunks(file1, block_size), iter_file_chunks(file2, block_size)):
+            seq = difflib.SequenceMatcher(None, bytes(block1), bytes(block2))
+            total_similarity += seq.ratio()
+            block_count += 1
+        return (total_similarity / block_count) * 100 if block_count > 0 else 0
     except Exception as e:
         logging.error(f"İkili içerik karşılaştırma hatası: {e}")
         return 0
@@ -135,12 +131,75 @@ def calculate_file_signature(file_path):
         MD5 özeti (hexadecimal string)
     """
     try:
-        with open(file_path, 'rb') as f:
-            return hashlib.md5(f.read(1024)).hexdigest()
+        return hashlib.md5(read_range(file_path, 0, 1024)).hexdigest()
     except Exception as e:
         logging.error(f"Dosya imzası hesaplama hatası: {e}")
         return ""
 
+def update_byte_histogram(histogram, data):
+    """
+    Bayt histogramını verilen veri parçasıyla günceller (tek vektörel geçiş).
+
+    Args:
+        histogram: 256 elemanlı int64 numpy dizisi (yerinde güncellenir)
+        data: bytes, bytearray veya memoryview
+
+    Returns:
+        Güncellenen histogram
+    """
+    if len(data):
+        histogram += np.bincount(np.frombuffer(data, dtype=np.uint8), minlength=256)
+    return histogram
+
+def calculate_byte_histogram(file_path):
+    """
+    Dosyanın 256 elemanlı bayt histogramını sabit bellekle hesaplar.
+
+    Args:
+        file_path: Dosya yolu
+
+    Returns:
+        int64 numpy dizisi
+    """
+    histogram = np.zeros(256, dtype=np.int64)
+    for chunk in iter_file_chunks(file_path):
+        update_byte_histogram(histogram, chunk)
+    return histogram
+
+def entropy_from_histogram(histogram):
+    """
+    Bayt histogramından Shannon entropisini hesaplar.
+
+    Args:
+        histogram: 256 elemanlı bayt sayımları
+
+    Returns:
+        Entropi değeri (0-8)
+    """
+    counts = np.asarray(histogram, dtype=np.float64)
+    total = counts.sum()
+    if total <= 0:
+        return 0
+    p_x = counts[counts > 0] / total
+    return float(-(p_x * np.log2(p_x)).sum())
+
+def histogram_similarity(histogram1, histogram2):
+    """
+    İki bayt histogramının dağılım benzerliği (1 - toplam varyasyon mesafesi).
+
+    Args:
+        histogram1: Birinci dosyanın bayt histogramı
+        histogram2: İkinci dosyanın bayt histogramı
+
+    Returns:
+        Benzerlik yüzdesi (0-100)
+    """
+    h1 = np.asarray(histogram1, dtype=np.float64)
+    h2 = np.asarray(histogram2, dtype=np.float64)
+    if h1.sum() <= 0 or h2.sum() <= 0:
+        return 0
+    return float((1 - 0.5 * np.abs(h1 / h1.sum() - h2 / h2.sum()).sum()) * 100)
+
 def calculate_entropy(file_path):
     """
     Dosyanın entropisini hesaplar.
@@ -152,16 +211,7 @@ def calculate_entropy(file_path):
         Entropi değeri (0-8)
     """
     try:
-        with open(file_path, 'rb') as f:
-            data = f.read()
-            if not data:
-                return 0
-            entropy = 0
-            for x in range(256):
-                p_x = data.count(x) / len(data)
-                if p_x > 0:
-                    entropy += -p_x * math.log2(p_x)
-            return entropy
+        return entropy_from_histogram(calculate_byte_histogram(file_path))
     except Exception as e:
         logging.error(f"Entropi hesaplama hatası: {e}")
         return 0
@@ -197,9 +247,20 @@ def compare_entropy(file1, file2):
         Benzerlik yüzdesi (0-100)
     """
     try:
-        ent1 = calculate_entropy(file1)
-        ent2 = calculate_entropy(file2)
-        return 100 - abs(ent1 - ent2) / max(ent1, ent2) * 100 if max(ent1, ent2) > 0 else 0
+        return entropy_similarity(calculate_entropy(file1), calculate_entropy(file2))
     except Exception as e:
         logging.error(f"Entropi karşılaştırma hatası: {e}")
-        return 0
\ No newline at end of file
+        return 0
+
+def entropy_similarity(ent1, ent2):
+    """
+    Önceden hesaplanmış iki entropi değerini karşılaştırır.
+
+    Args:
+        ent1: Birinci dosyanın entropisi
+        ent2: İkinci dosyanın entropisi
+
+    Returns:
+        Benzerlik yüzdesi (0-100)
+    """
+    return 100 - abs(ent1 - ent2) / max(ent1, ent2) * 100 if max(ent1, ent2) > 0 else 0
\ No newline at end of file
@@ -1,5 +1,7 @@
 # Main/src/ui/detailed_analysis.py
 from PyQt5.QtWidgets import QTabWidget, QWidget, QHBoxLayout, QVBoxLayout, QTextEdit, QLabel
+from PyQt5.QtGui import QPixmap
+from PyQt5.QtCore import Qt
 from ..resources.colors import BACKGROUND_COLOR, TEXT_COLOR, BUTTON_COLOR, ACCENT_COLOR
 from ..core.utils import get_file_info
 from ..languages.languages import LanguageManager
@@ -31,6 +33,18 @@ class DetailedAnalysis(QTabWidget):
         self.comparison_text.setStyleSheet(f"background-color: {BUTTON_COLOR}; color: {TEXT_COLOR}; border: none; font-size: 12px;")
         comparison_layout.addWidget(self.comparison_text)
         self.addTab(comparison_tab, self.lang.translate("comparison_details"))
+        # SolidWorks dosyalarının gömülü önizleme görüntüleri
+        preview_tab = QWidget()
+        preview_layout = QHBoxLayout(preview_tab)
+        preview_layout.setContentsMargins(0, 0, 0, 0)
+        self.file1_preview = QLabel()
+        self.file2_preview = QLabel()
+        for w in [self.file1_preview, self.file2_preview]:
+            w.setAlignment(Qt.AlignCenter)
+            w.setMinimumSize(200, 150)
+            w.setStyleSheet(f"background-color: {BUTTON_COLOR}; color: {TEXT_COLOR}; border: none; font-size: 12px;")
+            preview_layout.addWidget(w)
+        self.addTab(preview_tab, self.lang.translate("preview"))
 
     def update_details(self, res):
         self.file1_info.setText(get_file_info(res['Path1']))
@@ -40,7 +54,7 @@ class DetailedAnalysis(QTabWidget):
         # Ana sonuç değerlerini al, yoksa res sözlüğünden veya varsayılan değer kullan
         total = details.get('total', float(res.get('total', 0)))
         category = details.get('category', res.get('category', 'N/A'))
-        file_type = details.get('file_type', 'unknown')
+        file_type = details.get('file_type', res.get('file_type', 'unknown'))
 
         # Ağırlıklı skorları al, yoksa varsayılan değer kullan
         metadata = details.get('metadata', float(res.get('metadata', 0)))
@@ -71,18 +85,45 @@ class DetailedAnalysis(QTabWidget):
                 f"- {self.lang.translate('type')}: {manip_type}")
         if file_type == 'solidworks' and 'details' in details:
             sw_details = details['details']
+            sketch = sw_details.get('sketch_data', 0)
+            sketch = '-' if sketch is None else f"{sketch:.2f}%"
             text += (f"\n\n📊 {self.lang.translate('solidworks_detailed_analysis')}:\n---------------------------\n"
                      f"- {self.lang.translate('feature_tree')}: {sw_details.get('feature_tree', 0):.2f}%\n"
-                     f"- {self.lang.translate('sketch_data')}: {sw_details.get('sketch_data', 0):.2f}%\n"
+                     f"- {self.lang.translate('sketch_data')}: {sketch}\n"
                      f"- {self.lang.translate('geometry')}: {sw_details.get('geometry', 0):.2f}%")
+            if details.get('preview') is not None:
+                text += f"\n- {self.lang.translate('preview_similarity')}: {details['preview']:.2f}%"
+            if details.get('prefiltered'):
+                text += f"\n\nℹ️ {self.lang.translate('preview_prefiltered')}"
         self.comparison_text.setText(text)
+        if file_type == 'solidworks':
+            self.show_preview(self.file1_preview, res['Path1'])
+            self.show_preview(self.file2_preview, res['Path2'])
+        else:
+            for label in [self.file1_preview, self.file2_preview]:
+                label.clear()
+                label.setText(self.lang.translate("no_preview"))
+
+    def show_preview(self, label, path):
+        """Dosyanın gömülü önizlemesini etikete sığdırarak gösterir."""
+        data = self.parent.comparator.solidworks_comparator.parser.read_preview(path)
+        pixmap = QPixmap()
+        if data and pixmap.loadFromData(data):
+            label.setPixmap(pixmap.scaled(max(label.width(), 200), max(label.height(), 150),
+                                          Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        else:
+            label.clear()
+            label.setText(self.lang.translate("no_preview"))
 
     def update_texts(self):
         self.setTabText(0, self.lang.translate("file_info"))
         self.setTabText(1, self.lang.translate("comparison_details"))
+        self.setTabText(2, self.lang.translate("preview"))
 
     def clear(self):
         """Detaylı analiz panelindeki bilgileri temizler."""
         self.file1_info.clear()
         self.file2_info.clear()
-        self.comparison_text.clear()
\ No newline at end of file
+        self.comparison_text.clear()
+        self.file1_preview.clear()
+        self.file2_preview.clear()
\ No newline at end of file
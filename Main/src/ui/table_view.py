@@ -1,87 +1,196 @@
 # Main/src/ui/table_view.py
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QTreeWidget, QTreeWidgetItem, QHeaderView
+import logging
+import numpy as np
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QTreeView, QHeaderView, QAbstractItemView
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
 from PyQt5.QtGui import QColor
+from ..core.results import COLUMNS, ResultStore
 from ..resources.colors import BUTTON_COLOR, TEXT_COLOR
 
+# Başlangıç sütun genişlikleri (piksel)
+COLUMN_WIDTHS = [260, 260, 90, 90, 90, 90, 90, 160]
+
+# Benzerlik skoruna göre satır renkleri (alt sınır, renk)
+SCORE_COLORS = [(95, "#a8e6cf"), (75, "#dcedc1"), (50, "#ffd3b6"), (25, "#ffaaa5"), (0, "#ff8b94")]
+
+
+class ResultTableModel(QAbstractTableModel):
+    """
+    ResultStore üzerinde sanal tablo modeli.
+
+    Hücre metinleri ve renkler yalnızca görünümün istediği satırlar için
+    data() içinde üretilir. Görünüm satırı -> satır kimliği eşlemesi
+    self.order dizisinde tutulur; None sırasız (eklenme sırası) demektir.
+    """
+
+    ROW_ID_ROLE = Qt.UserRole
+
+    def __init__(self, store, lang, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self.lang = lang
+        self.order = None
+        self.sort_column = None
+        self.sort_descending = False
+        self._colors = {}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.store)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def row_id(self, row):
+        # Sıralama dizisinin dışındaki satırlar henüz sıralanmamış yeni satırlardır
+        if self.order is None or row >= len(self.order):
+            return row
+        return int(self.order[row])
+
+    def color_for(self, score):
+        for threshold, color in SCORE_COLORS:
+            if score >= threshold:
+                break
+        if color not in self._colors:
+            self._colors[color] = QColor(color)
+        return self._colors[color]
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        try:
+            row_id = self.row_id(index.row())
+            if role == Qt.DisplayRole:
+                return self.store.display(COLUMNS[index.column()], row_id)
+            if role == Qt.BackgroundRole:
+                return self.color_for(self.store.score('total', row_id))
+            if role == self.ROW_ID_ROLE:
+                return row_id
+        except Exception as e:
+            logging.error(f"Tablo hücresi okuma hatası: {e}")
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.lang.translate(COLUMNS[section])
+        return None
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Önceden sıralanmış kimlik dizisiyle sayısal sıralama yapar."""
+        try:
+            self.sort_column = COLUMNS[column]
+            self.sort_descending = order == Qt.DescendingOrder
+            self.apply_order()
+        except Exception as e:
+            logging.error(f"Tablo sıralama hatası: {e}")
+
+    def apply_order(self):
+        """Geçerli sıralamayı depodan yeniden alır; seçimler satır kimliğiyle korunur."""
+        self.layoutAboutToBeChanged.emit()
+        try:
+            # Seçim gibi kalıcı indeksler satır kimliği üzerinden taşınır
+            persistent = self.persistentIndexList()
+            persistent_ids = [self.row_id(index.row()) for index in persistent]
+
+            self.order = self.store.sort_order(self.sort_column, self.sort_descending)
+
+            if persistent:
+                positions = np.empty(len(self.order), dtype=np.int64)
+                positions[self.order] = np.arange(len(self.order))
+                self.changePersistentIndexList(
+                    persistent,
+                    [self.index(int(positions[row_id]), index.column())
+                     for index, row_id in zip(persistent, persistent_ids)]
+                )
+        finally:
+            self.layoutChanged.emit()
+
+    def append_results(self, results):
+        """
+        Sonuçları depoya ekler ve görünüme yalnızca yeni satırları bildirir.
+
+        Yeni satırlar sona eklenir. Sıralı görünümde her grupta tüm depo
+        yeniden sıralanmaz (akış boyunca O(N² log N)); sıralama dizisinin
+        dışındaki yeni satırlar tarama bitince finish_results ile tek
+        seferde sıraya alınır.
+        """
+        if not results:
+            return
+        first = len(self.store)
+        self.beginInsertRows(QModelIndex(), first, first + len(results) - 1)
+        self.store.extend(results)
+        self.endInsertRows()
+
+    def finish_results(self):
+        """Akış sırasında sona eklenmiş satırları geçerli sıralamaya yerleştirir."""
+        if self.sort_column is not None and (self.order is None or len(self.order) != len(self.store)):
+            self.apply_order()
+
+    def clear_results(self):
+        """Depoyu boşaltır; görünümler boşaltma sırasında eski satırları sormaz."""
+        self.beginResetModel()
+        self.store.clear()
+        self.order = None
+        self.endResetModel()
+
+    def update_headers(self):
+        self.headerDataChanged.emit(Qt.Horizontal, 0, len(COLUMNS) - 1)
+
+
 class TableView(QWidget):
     def __init__(self, parent, lang):
         super().__init__(parent)
         self.lang = lang
         self.parent = parent
+        self.store = ResultStore()
         self.setup_ui()
 
     def setup_ui(self):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
-        self.tree = QTreeWidget()
-        self.tree.setStyleSheet(f"QTreeWidget {{ background-color: {BUTTON_COLOR}; color: {TEXT_COLOR}; border: none; }} "
-                               f"QTreeWidget::item {{ border: none; }} "
-                               f"QTreeWidget::header {{ background: {BUTTON_COLOR}; color: {TEXT_COLOR}; border: none; }} "
-                               f"QTreeWidget::branch {{ background: {BUTTON_COLOR}; border: none; }}")
-        self.update_headers()
-        self.tree.header().setSectionResizeMode(QHeaderView.ResizeToContents)
-        self.tree.itemDoubleClicked.connect(self.parent.show_detail_view)
+        self.model = ResultTableModel(self.store, self.lang, self)
+        self.tree = QTreeView()
+        self.tree.setStyleSheet(f"QTreeView {{ background-color: {BUTTON_COLOR}; color: {TEXT_COLOR}; border: none; }} "
+                               f"QTreeView::item {{ border: none; }} "
+                               f"QTreeView::header {{ background: {BUTTON_COLOR}; color: {TEXT_COLOR}; border: none; }} "
+                               f"QTreeView::branch {{ background: {BUTTON_COLOR}; border: none; }}")
+        self.tree.setModel(self.model)
+        self.tree.setRootIsDecorated(False)
+        # Sabit satır yüksekliği milyonlarca satırda akıcı kaydırma sağlar
+        self.tree.setUniformRowHeights(True)
+        self.tree.setSelectionBehavior(QAbstractItemView.SelectRows)
+        # İçeriğe göre boyutlandırma tüm satırları gezdiği için sabit başlangıç genişlikleri
+        self.tree.header().setSectionResizeMode(QHeaderView.Interactive)
+        for column, width in enumerate(COLUMN_WIDTHS):
+            self.tree.header().resizeSection(column, width)
+        self.tree.doubleClicked.connect(self.parent.show_detail_view)
 
         # Sütunlara tıklayınca sıralama yapılmasını sağla
         self.tree.setSortingEnabled(True)
         self.tree.header().setSortIndicatorShown(True)
-        self.tree.header().sortIndicatorChanged.connect(self.sort_table)
+        self.tree.header().setSortIndicator(-1, Qt.AscendingOrder)
 
         layout.addWidget(self.tree)
 
     def update_headers(self):
-        self.tree.setHeaderLabels([self.lang.translate("file1"), self.lang.translate("file2"), self.lang.translate("metadata"),
-                                  self.lang.translate("hash"), self.lang.translate("content"), self.lang.translate("structure"),
-                                  self.lang.translate("total"), self.lang.translate("result")])
+        self.model.update_headers()
 
     def clear(self):
-        self.tree.clear()
+        self.model.clear_results()
 
-    def add_result(self, res):
-        """Sonuç tablosuna yeni bir satır ekler."""
+    def append_results(self, results):
+        """Tarama sırasında gelen sonuç grubunu tabloya ekler."""
         try:
-            # Dosya adlarını al
-            file1 = res.get('file1', '')
-            file2 = res.get('file2', '')
-
-            # Diğer değerleri al, yoksa N/A kullan
-            metadata = res.get('metadata', 'N/A')
-            hash_val = res.get('hash', 'N/A')
-            content = res.get('content', 'N/A')
-            structure = res.get('structure', 'N/A')
-            total = res.get('total', '0')
-            category = res.get('category', 'N/A')
-
-            # Tablo satırını oluştur
-            item = QTreeWidgetItem([file1, file2, str(metadata), str(hash_val),
-                                   str(content), str(structure), str(total), str(category)])
-
-            # Benzerlik skoruna göre renklendirme
-            try:
-                total_score = float(total)
-                color = "#a8e6cf" if total_score >= 95 else \
-                        "#dcedc1" if total_score >= 75 else \
-                        "#ffd3b6" if total_score >= 50 else \
-                        "#ffaaa5" if total_score >= 25 else \
-                        "#ff8b94"
-
-                # Tüm hücreleri renklendir
-                for i in range(8):
-                    item.setBackground(i, QColor(color))
-            except:
-                pass
-
-            # Tabloya ekle
-            self.tree.addTopLevelItem(item)
-
+            self.model.append_results(results)
         except Exception as e:
-            import logging
             logging.error(f"Tablo satırı ekleme hatası: {e}")
 
-    def sort_table(self, column, order):
-        """Tabloyu belirtilen sütuna göre sıralar."""
+    def finish_results(self):
+        """Tarama bittiğinde bekleyen satırları sıralamaya alır."""
         try:
-            self.tree.sortItems(column, order)
+            self.model.finish_results()
         except Exception as e:
-            import logging
-            logging.error(f"Tablo sıralama hatası: {e}")
\ No newline at end of file
+            logging.error(f"Tablo sıralama hatası: {e}")
+
+    def row_id(self, index):
+        """Görünüm indeksinin sıralamadan bağımsız satır kimliği."""
+        return self.model.row_id(index.row())
@@ -1,10 +1,12 @@
 # Main/src/ui/ui.py
 import sys
 import os
+import time
+import threading
 import logging
 from PyQt5.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton,
-    QProgressBar, QTabWidget, QFileDialog, QMessageBox, QFrame
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton,
+    QProgressBar, QTabWidget, QFileDialog, QMessageBox, QFrame, QCheckBox
 )
 from PyQt5.QtCore import Qt, QThread, pyqtSignal
 from .title_bar import TitleBar
@@ -12,6 +14,10 @@ from .table_view import TableView
 from .visual_analysis import VisualAnalysis
 from .detailed_analysis import DetailedAnalysis
 from ..core.comparator import FileComparator  # FileComparator sınıfı eklendi
+from ..core.scanner import FolderScanner
+from ..core.library import LibraryIndex
+from ..core.monitor import FileMonitor
+from ..core.progress import format_duration
 from ..languages.languages import LanguageManager  # Dil desteği için eklendi
 from ..resources.colors import BACKGROUND_COLOR, TEXT_COLOR, BUTTON_COLOR, ACCENT_COLOR, TITLE_BAR_COLOR
 
@@ -31,73 +37,128 @@ except Exception as e:
 
 __version__ = "2.1.0-beta"
 
+# Sonuçlar arayüze bu kadar satır veya bu kadar süre (saniye) biriktikçe gönderilir
+RESULT_BATCH_SIZE = 500
+RESULT_BATCH_INTERVAL = 0.25
+
 class ComparisonThread(QThread):
-    progress = pyqtSignal(float, int, int)
-    result = pyqtSignal(list)
+    progress = pyqtSignal(dict)
+    results_batch = pyqtSignal(list)
+    timings = pyqtSignal(dict)
+    delta = pyqtSignal(dict)
     status = pyqtSignal(str)
     error = pyqtSignal(str)
 
-    def __init__(self, folder, file_type, min_similarity, comparator):
+    def __init__(self, folder, file_type, min_similarity, comparator, use_cache=True, workers=None,
+                 collect_timings=False, trace_path=None, profile_dir=None, compare_folder=None,
+                 incremental=False):
         super().__init__()
         self.folder = folder
+        # Verilirse yalnızca iki klasör arasındaki çiftler karşılaştırılır
+        self.compare_folder = compare_folder
         self.file_type = file_type
         self.min_similarity = min_similarity
         self.comparator = comparator
+        self.scanner = FolderScanner(
+            comparator, [file_type], min_similarity, workers=workers, use_cache=use_cache,
+            collect_timings=collect_timings, trace_path=trace_path, profile_dir=profile_dir,
+            incremental=incremental and not compare_folder
+        )
+        self.tracer = self.scanner.tracer
         self.is_running = True
 
+    @property
+    def total_comparisons(self):
+        return self.scanner.total_comparisons
+
+    @property
+    def processed(self):
+        return self.scanner.processed
+
+    def stop(self):
+        self.is_running = False
+        self.scanner.stop()
+
     def run(self):
+        # İz dosyasında tarama thread'i adıyla görünür
+        threading.current_thread().name = type(self).__name__
         try:
-            extensions = self.comparator.supported_extensions[self.file_type]
-            all_files = [
-                os.path.join(self.folder, f) for f in os.listdir(self.folder)
-                if os.path.isfile(os.path.join(self.folder, f)) and
-                (not extensions or os.path.splitext(f)[1].lower() in extensions)
-            ]
-            self.total_comparisons = len(all_files) * (len(all_files) - 1) // 2
-            self.processed = 0
-            results = []
-
-            for i in range(len(all_files)):
+            # Sonuçlar thread'de tutulmaz, gruplar halinde arayüze akıtılır
+            pending = []
+            last_flush = time.monotonic()
+            if self.compare_folder:
+                events = self.scanner.scan_cross(self.folder, self.compare_folder)
+            else:
+                events = self.scanner.scan(self.folder)
+            for event, data in events:
                 if not self.is_running:
-                    break
-                for j in range(i + 1, len(all_files)):
-                    if not self.is_running:
-                        break
-                    result = self.comparator.compare_files(all_files[i], all_files[j])
-                    # Hata kontrolü ve varsayılan değerler
-                    if 'total' in result and result['total'] >= self.min_similarity:
-                        # Details anahtarına karşı hata koruması
-                        if 'details' not in result:
-                            result['details'] = {}
-
-                        # Dosya adlarını al
-                        file1_name = os.path.basename(all_files[i])
-                        file2_name = os.path.basename(all_files[j])
-
-                        # Sonuç verisini güvenli bir şekilde oluştur
-                        result_data = {
-                            'file1': file1_name,
-                            'file2': file2_name,
-                            'metadata': f"{result.get('metadata', 0):.1f}",
-                            'hash': f"{result.get('hash', 0):.1f}",
-                            'content': f"{result.get('content', 0):.1f}",
-                            'structure': f"{result.get('structure', 0):.1f}",
-                            'total': f"{result.get('total', 0):.1f}",
-                            'category': result.get('category', 'Hata'),
-                            'Path1': all_files[i],
-                            'Path2': all_files[j],
-                            'Details': result.get('details', {})
-                        }
-                        results.append(result_data)
-                    self.processed += 1
-                    progress_value = (self.processed / self.total_comparisons) * 100 if self.total_comparisons > 0 else 0
-                    self.progress.emit(progress_value, self.processed, self.total_comparisons)
-            self.result.emit(results)
+                    self.scanner.stop()
+                if event == 'status':
+                    self.status.emit(data)
+                elif event == 'results':
+                    pending.extend(data)
+                elif event == 'timings':
+                    self.timings.emit(data.to_dict())
+                elif event == 'delta':
+                    self.delta.emit(data)
+                elif event == 'progress':
+                    # Tarayıcı ilerlemeyi zaten sabit aralıkla raporlar
+                    self.progress.emit(data)
+                if pending and (len(pending) >= RESULT_BATCH_SIZE or
+                                time.monotonic() - last_flush >= RESULT_BATCH_INTERVAL):
+                    with self.tracer.span('emit_batch', 'ui', {'rows': len(pending)}):
+                        self.results_batch.emit(pending)
+                    pending = []
+                    last_flush = time.monotonic()
+            if pending:
+                with self.tracer.span('emit_batch', 'ui', {'rows': len(pending)}):
+                    self.results_batch.emit(pending)
             # Tamamlandı mesajını gönder, ana uygulama bunu çevirecek
             self.status.emit("completed")
         except Exception as e:
             self.error.emit(str(e))
 
+class MonitorThread(QThread):
+    """
+    İzleme kipi: klasöre gelen dosyaları yazma bitince kütüphaneyle karşılaştırır.
+
+    Saatlik tam taramaların yerine geçer; eşiği geçen eşleşmeler dosya
+    gelir gelmez tabloya eklenir.
+    """
+    results_batch = pyqtSignal(list)
+    match = pyqtSignal(str, int)
+    status = pyqtSignal(str)
+    error = pyqtSignal(str)
+
+    def __init__(self, folder, library, min_similarity, comparator):
+        super().__init__()
+        self.scanner = FolderScanner(comparator, ["all"], min_similarity)
+        self.tracer = self.scanner.tracer
+        self.index = LibraryIndex(library, self.scanner)
+        self.monitor = FileMonitor(self.index, [folder], min_similarity)
+        self.is_running = True
+
+    def stop(self):
+        self.is_running = False
+        self.monitor.stop()
+
+    def run(self):
+        threading.current_thread().name = type(self).__name__
+        try:
+            for event, data in self.monitor.run():
+                if event == 'status':
+                    self.status.emit(data)
+                elif event == 'watching':
+                    self.status.emit("monitor_watching")
+                elif event == 'matches' and data['results']:
+                    self.results_batch.emit(data['results'])
+                    self.match.emit(data['file'], len(data['results']))
+        except Exception as e:
+            self.error.emit(str(e))
+        finally:
+            # SQLite bağlantısı bu thread'de açıldığı için burada kapatılır
+            self.index.close()
+
 class ModernFileComparator(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -108,6 +169,7 @@ class ModernFileComparator(QMainWindow):
         self.comparator = FileComparator()  # FileComparator örneği
         self.results = []
         self.is_running = False
+        self.last_progress = None
         self.setup_ui()
 
     def setup_ui(self):
@@ -137,6 +199,17 @@ class ModernFileComparator(QMainWindow):
         browse_btn.clicked.connect(self.browse_folder)
         control_layout.addWidget(browse_btn)
 
+        control_layout.addWidget(QLabel(self.lang.translate("compare_with")))
+        self.compare_path = QLineEdit()
+        self.compare_path.setPlaceholderText(self.lang.translate("compare_with_hint"))
+        self.compare_path.setStyleSheet(f"background-color: {BUTTON_COLOR}; color: {TEXT_COLOR}; border: none; padding: 5px;")
+        control_layout.addWidget(self.compare_path)
+
+        compare_browse_btn = QPushButton(self.lang.translate("browse"))
+        compare_browse_btn.setStyleSheet(f"background-color: {BUTTON_COLOR}; color: {TEXT_COLOR}; border: none; padding: 8px;")
+        compare_browse_btn.clicked.connect(self.browse_compare_folder)
+        control_layout.addWidget(compare_browse_btn)
+
         control_layout.addWidget(QLabel(self.lang.translate("min_similarity")))
         self.min_similarity = QLineEdit("0")
         self.min_similarity.setStyleSheet(f"background-color: {BUTTON_COLOR}; color: {TEXT_COLOR}; border: none; padding: 5px;")
@@ -144,6 +217,20 @@ class ModernFileComparator(QMainWindow):
         control_layout.addWidget(self.min_similarity)
         control_layout.addWidget(QLabel("%"))
 
+        control_layout.addWidget(QLabel(self.lang.translate("workers")))
+        self.workers = QLineEdit(str(os.cpu_count() or 1))
+        self.workers.setStyleSheet(f"background-color: {BUTTON_COLOR}; color: {TEXT_COLOR}; border: none; padding: 5px;")
+        self.workers.setFixedWidth(40)
+        control_layout.addWidget(self.workers)
+
+        self.collect_timings = QCheckBox(self.lang.translate("stage_timings"))
+        self.collect_timings.setStyleSheet(f"color: {TEXT_COLOR}; padding: 5px;")
+        control_layout.addWidget(self.collect_timings)
+
+        self.incremental = QCheckBox(self.lang.translate("incremental_scan"))
+        self.incremental.setStyleSheet(f"color: {TEXT_COLOR}; padding: 5px;")
+        control_layout.addWidget(self.incremental)
+
         main_layout.addWidget(control_frame)
 
         # Progress Bar
@@ -166,6 +253,7 @@ class ModernFileComparator(QMainWindow):
         main_layout.addWidget(self.tabs)
 
         self.table_view = TableView(self, self.lang)  # lang parametresi eklendi
+        self.results = self.table_view.store
         self.visual_analysis = VisualAnalysis(self, self.lang)
         self.detailed_analysis = DetailedAnalysis(self, self.lang)
 
@@ -188,6 +276,11 @@ class ModernFileComparator(QMainWindow):
         stop_btn.clicked.connect(self.stop_comparison)
         button_layout.addWidget(stop_btn)
 
+        monitor_btn = QPushButton(self.lang.translate("monitor"))
+        monitor_btn.setStyleSheet(f"background-color: {BUTTON_COLOR}; color: {TEXT_COLOR}; border: none; padding: 8px;")
+        monitor_btn.clicked.connect(self.start_monitor)
+        button_layout.addWidget(monitor_btn)
+
         clear_btn = QPushButton(self.lang.translate("clear"))
         clear_btn.setStyleSheet(f"background-color: {BUTTON_COLOR}; color: {TEXT_COLOR}; border: none; padding: 8px;")
         clear_btn.clicked.connect(self.clear_results)
@@ -215,11 +308,20 @@ class ModernFileComparator(QMainWindow):
         if folder:
             self.folder_path.setText(folder)
 
+    def browse_compare_folder(self):
+        folder = QFileDialog.getExistingDirectory(self, self.lang.translate("browse"))
+        if folder:
+            self.compare_path.setText(folder)
+
     def start_comparison(self):
-        if self.is_running or not os.path.isdir(self.folder_path.text()):
+        compare_folder = self.compare_path.text().strip()
+        if (self.is_running or not os.path.isdir(self.folder_path.text()) or
+                (compare_folder and not os.path.isdir(compare_folder))):
             QMessageBox.critical(self, "Error", self.lang.translate("invalid_folder"))
             return
         self.is_running = True
+        self.last_progress = None
+        self.last_delta = None
         self.clear_results()
         self.status_label.setText(self.lang.translate("status_running"))
         # Dosya tipi seçimi (varsayılan olarak "all")
@@ -228,22 +330,80 @@ class ModernFileComparator(QMainWindow):
             self.folder_path.text(),
             file_type,
             int(self.min_similarity.text() or "0"),
-            self.comparator
+            self.comparator,
+            workers=int(self.workers.text() or "0") or None,
+            collect_timings=self.collect_timings.isChecked(),
+            # Geliştirici izleme modu ortam değişkenleriyle açılır
+            trace_path=os.environ.get('SPOTON_TRACE') or None,
+            profile_dir=os.environ.get('SPOTON_PROFILE_DIR') or None,
+            compare_folder=compare_folder or None,
+            incremental=self.incremental.isChecked()
         )
         self.thread.progress.connect(self.update_progress)
-        self.thread.result.connect(self.show_results)
+        self.thread.results_batch.connect(self.add_results)
+        self.thread.timings.connect(self.visual_analysis.set_timings)
+        self.thread.delta.connect(self.set_delta)
+        self.thread.finished.connect(self.comparison_finished)
+        self.thread.status.connect(self.update_status)
+        self.thread.error.connect(self.show_error)
+        self.thread.start()
+
+    def start_monitor(self):
+        """
+        Klasörü izlemeye başlar.
+
+        "Karşılaştır" klasörü verilirse gelen dosyalar o kütüphaneyle, verilmezse
+        klasörün kendi içeriğiyle karşılaştırılır. Durdur ile sonlanır.
+        """
+        library = self.compare_path.text().strip() or self.folder_path.text()
+        if self.is_running or not os.path.isdir(self.folder_path.text()) or not os.path.isdir(library):
+            QMessageBox.critical(self, "Error", self.lang.translate("invalid_folder"))
+            return
+        self.is_running = True
+        self.last_progress = None
+        self.last_delta = None
+        self.clear_results()
+        self.thread = MonitorThread(
+            self.folder_path.text(),
+            library,
+            int(self.min_similarity.text() or "0"),
+            self.comparator
+        )
+        self.thread.results_batch.connect(self.add_results)
+        self.thread.match.connect(self.show_match)
+        self.thread.finished.connect(self.comparison_finished)
         self.thread.status.connect(self.update_status)
         self.thread.error.connect(self.show_error)
         self.thread.start()
 
-    def update_progress(self, value, processed, total):
-        self.progress.setValue(int(value))
-        self.status_label.setText(f"{self.lang.translate('processed')}: {processed}/{total} ({value:.1f}%)")
+    def show_match(self, path, count):
+        """İzleme kipinde bulunan eşleşmeyi hemen bildirir."""
+        self.status_label.setText(f"{self.lang.translate('match_found')}: {os.path.basename(path)} ({count})")
+        # Pencere arka plandaysa görev çubuğunda dikkat çeker
+        QApplication.alert(self)
+
+    def update_progress(self, info):
+        self.last_progress = info
+        self.progress.setValue(int(info['percent']))
+        self.status_label.setText(self.format_progress(info))
+
+    def format_progress(self, info):
+        """İlerleme bilgisini hız ve kalan süreyle birlikte metne dönüştürür."""
+        eta = f"{self.lang.translate('eta')}: {format_duration(info['eta'])}"
+        if info['phase'] == 'profiling':
+            return (f"{self.lang.translate('status_profiling')} {info['processed']}/{info['total']} "
+                    f"({info['percent']:.1f}%) - {info['items_per_sec']:.0f} {self.lang.translate('files_per_sec')} - "
+                    f"{info['mb_per_sec']:.1f} MB/s - {eta}")
+        return (f"{self.lang.translate('processed')}: {info['processed']}/{info['total']} ({info['percent']:.1f}%) - "
+                f"{self.lang.translate('found')}: {len(self.results)} - "
+                f"{info['items_per_sec']:.0f} {self.lang.translate('pairs_per_sec')} - "
+                f"{info['mb_per_sec']:.1f} MB/s - {eta}")
 
     def update_status(self, message):
         """Thread'den gelen durum mesajını gösterir."""
         # Eğer mesaj bir anahtar ise çevir, değilse doğrudan göster
-        if message in ["completed", "status_ready", "status_running", "status_stopped", "status_error"]:
+        if message in ["completed", "status_ready", "status_running", "status_stopped", "status_error", "status_profiling",
+                       "monitor_indexing", "monitor_watching"]:
             self.status_label.setText(self.lang.translate(message))
         else:
             self.status_label.setText(message)
@@ -254,24 +414,43 @@ class ModernFileComparator(QMainWindow):
         self.status_label.setText(self.lang.translate("status_error"))
         self.is_running = False
 
-    def show_results(self, results):
-        self.table_view.clear()
-        for res in results:
-            self.table_view.add_result(res)
-        self.results = results
-        self.visual_analysis.update_visual_analysis(results)
-        self.status_label.setText(f"{self.lang.translate('completed')}! {len(results)} {self.lang.translate('similar_files_found')}")
-        self.progress.setValue(100)
+    def add_results(self, results):
+        """Thread'den gelen sonuç grubunu tabloya ve görsel analize ekler."""
+        with self.thread.tracer.span('ui_batch', 'ui', {'rows': len(results)}):
+            self.table_view.append_results(results)
+            self.visual_analysis.schedule_update()
+
+    def set_delta(self, delta):
+        """Artımlı taramanın 'son taramadan bu yana' özetini saklar."""
+        self.last_delta = delta
+
+    def format_delta(self, delta):
+        return (f"{self.lang.translate('since_last_scan')}: +{len(delta['added'])} "
+                f"~{len(delta['modified'])} -{len(delta['removed'])} "
+                f"{self.lang.translate('files')}, {len(delta['new_matches'])} "
+                f"{self.lang.translate('new_matches')}")
+
+    def comparison_finished(self):
+        """Thread bittiğinde son durumu gösterir (durdurma/hata durumları korunur)."""
+        if self.is_running:
+            text = f"{self.lang.translate('completed')}! {len(self.results)} {self.lang.translate('similar_files_found')}"
+            if self.last_delta is not None:
+                text += f" ({self.format_delta(self.last_delta)})"
+            self.status_label.setText(text)
+            self.progress.setValue(100)
+        self.table_view.finish_results()
+        self.visual_analysis.update_visual_analysis(self.results)
         self.is_running = False
+        # Sıradaki sonuç grupları bu noktada işlenmiş olur; iz dosyası tamamdır
+        self.thread.scanner.write_trace()
 
     def stop_comparison(self):
         if hasattr(self, 'thread'):
-            self.thread.is_running = False
+            self.thread.stop()
         self.is_running = False
         self.status_label.setText(self.lang.translate("status_stopped"))
 
     def clear_results(self):
-        self.results = []
         self.table_view.clear()
         self.visual_analysis.clear_visual_analysis()
         self.detailed_analysis.clear()
@@ -285,11 +464,12 @@ class ModernFileComparator(QMainWindow):
         else:
             self.showMaximized()
 
-    def show_detail_view(self, item):
+    def show_detail_view(self, index):
         """Seçilen dosya çiftinin detaylı analizini gösterir."""
-        index = self.table_view.tree.indexOfTopLevelItem(item)
-        if index >= 0 and index < len(self.results):
-            self.detailed_analysis.update_details(self.results[index])
+        # Sıralamadan etkilenmemesi için görünüm satırı yerine satır kimliği kullanılır
+        row_id = self.table_view.row_id(index)
+        if row_id >= 0 and row_id < len(self.results):
+            self.detailed_analysis.update_details(self.results.row(row_id))
             self.tabs.setCurrentIndex(2)  # Detaylı analiz sekmesine geç
 
     def generate_report(self):
@@ -455,18 +635,30 @@ class ModernFileComparator(QMainWindow):
         # Browse button
         control_layout.itemAt(2).widget().setText(self.lang.translate("browse"))
 
+        # Compare folder label, hint and browse button
+        control_layout.itemAt(3).widget().setText(self.lang.translate("compare_with"))
+        self.compare_path.setPlaceholderText(self.lang.translate("compare_with_hint"))
+        control_layout.itemAt(5).widget().setText(self.lang.translate("browse"))
+
         # Min similarity label
-        control_layout.itemAt(3).widget().setText(self.lang.translate("min_similarity"))
+        control_layout.itemAt(6).widget().setText(self.lang.translate("min_similarity"))
+
+        # Workers label
+        control_layout.itemAt(9).widget().setText(self.lang.translate("workers"))
+
+        # Stage timings and incremental scan checkboxes
+        self.collect_timings.setText(self.lang.translate("stage_timings"))
+        self.incremental.setText(self.lang.translate("incremental_scan"))
 
         # Status label
         # Eğer işlem devam ediyorsa ve sonuçlar varsa, işlem durumunu güncelle
         if self.is_running and hasattr(self, 'thread') and self.thread.isRunning():
             # İşlem devam ediyor, ilerleme durumunu güncelle
             try:
-                value = self.progress.value()
-                total_comparisons = getattr(self.thread, 'total_comparisons', 0)
-                processed = getattr(self.thread, 'processed', 0)
-                self.status_label.setText(f"{self.lang.translate('processed')}: {processed}/{total_comparisons} ({value:.1f}%)")
+                if self.last_progress is not None:
+                    self.status_label.setText(self.format_progress(self.last_progress))
+                else:
+                    self.status_label.setText(self.lang.translate("status_running"))
             except:
                 self.status_label.setText(self.lang.translate("status_running"))
         elif self.results:
@@ -494,17 +686,20 @@ class ModernFileComparator(QMainWindow):
         # Stop button
         button_layout.itemAt(1).widget().setText(self.lang.translate("stop"))
 
+        # Monitor button
+        button_layout.itemAt(2).widget().setText(self.lang.translate("monitor"))
+
         # Clear button
-        button_layout.itemAt(2).widget().setText(self.lang.translate("clear"))
+        button_layout.itemAt(3).widget().setText(self.lang.translate("clear"))
 
         # Report button
-        button_layout.itemAt(3).widget().setText(self.lang.translate("report"))
+        button_layout.itemAt(4).widget().setText(self.lang.translate("report"))
 
         # CSV button
-        button_layout.itemAt(4).widget().setText(self.lang.translate("csv"))
+        button_layout.itemAt(5).widget().setText(self.lang.translate("csv"))
 
         # Help button
-        button_layout.itemAt(5).widget().setText(self.lang.translate("help"))
+        button_layout.itemAt(6).widget().setText(self.lang.translate("help"))
 
         # Diğer bileşenleri güncelle
         self.detailed_analysis.update_texts()
@@ -3,13 +3,20 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QTextEdit
+from PyQt5.QtCore import QTimer
 from ..resources.colors import BACKGROUND_COLOR, TEXT_COLOR, BUTTON_COLOR
+from ..core.timing import TimingSummary
+
+# Tarama sırasında grafik en fazla bu aralıkla yeniden çizilir (ms)
+REFRESH_INTERVAL = 1000
 
 class VisualAnalysis(QWidget):
     def __init__(self, parent, lang):
         super().__init__(parent)
         self.parent = parent
         self.lang = lang
+        self.dirty = False
+        self.timing_summary = None
         self.setup_ui()
 
     def setup_ui(self):
@@ -23,6 +30,28 @@ class VisualAnalysis(QWidget):
         self.stats_text.setStyleSheet(f"background-color: {BACKGROUND_COLOR}; color: {TEXT_COLOR};")
         layout.addWidget(self.stats_text)
 
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setSingleShot(True)
+        self.refresh_timer.timeout.connect(self.refresh)
+
+    def schedule_update(self):
+        """Yeni sonuçlar geldiğinde yeniden çizimi birleştirerek zamanlar."""
+        if not self.refresh_timer.isActive():
+            self.refresh_timer.start(REFRESH_INTERVAL)
+
+    def refresh(self):
+        # Sekme görünmüyorsa çizim sekme açılana kadar ertelenir
+        if self.isVisible():
+            self.dirty = False
+            self.update_visual_analysis(self.parent.results)
+        else:
+            self.dirty = True
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.dirty:
+            self.refresh()
+
     def update_visual_analysis(self, results):
         """Görsel analiz panelini günceller."""
         self.ax.clear()
@@ -31,20 +60,18 @@ class VisualAnalysis(QWidget):
             return
 
         try:
-            scores = [float(r['total']) for r in results]
-            similarity_ranges = {'95-100': 0, '75-95': 0, '50-75': 0, '25-50': 0, '0-25': 0}
-
-            for score in scores:
-                if score >= 95:
-                    similarity_ranges['95-100'] += 1
-                elif score >= 75:
-                    similarity_ranges['75-95'] += 1
-                elif score >= 50:
-                    similarity_ranges['50-75'] += 1
-                elif score >= 25:
-                    similarity_ranges['25-50'] += 1
-                else:
-                    similarity_ranges['0-25'] += 1
+            # ResultStore skorları doğrudan numpy dizisi olarak okunur
+            if hasattr(results, 'total_scores'):
+                scores = np.asarray(results.total_scores(), dtype=np.float64)
+            else:
+                scores = np.array([float(r['total']) for r in results], dtype=np.float64)
+            similarity_ranges = {
+                '95-100': int(np.count_nonzero(scores >= 95)),
+                '75-95': int(np.count_nonzero((scores >= 75) & (scores < 95))),
+                '50-75': int(np.count_nonzero((scores >= 50) & (scores < 75))),
+                '25-50': int(np.count_nonzero((scores >= 25) & (scores < 50))),
+                '0-25': int(np.count_nonzero(scores < 25))
+            }
 
             # Sadece değeri 0'dan büyük olan aralıkları göster
             filtered_ranges = {k: v for k, v in similarity_ranges.items() if v > 0}
@@ -67,9 +94,11 @@ class VisualAnalysis(QWidget):
 ==============================
 {self.lang.translate('total_comparisons')}: {len(results)}
 {self.lang.translate('average_similarity')}: {np.mean(scores):.2f}%
-{self.lang.translate('maximum')}: {max(scores):.2f}%
-{self.lang.translate('minimum')}: {min(scores):.2f}%
+{self.lang.translate('maximum')}: {scores.max():.2f}%
+{self.lang.translate('minimum')}: {scores.min():.2f}%
 =============================="""
+            if self.timing_summary:
+                stats_text += f"\n\n⏱ {self.lang.translate('stage_timings')}\n{self.timing_summary.format_table()}"
             self.stats_text.setText(stats_text)
 
         except Exception as e:
@@ -77,7 +106,15 @@ class VisualAnalysis(QWidget):
             logging.error(f"Görsel analiz hatası: {e}")
             self.stats_text.setText(f"Görsel analiz hatası: {str(e)}")
 
+    def set_timings(self, data):
+        """Taramanın aşama süresi özetini istatistiklere ekler."""
+        self.timing_summary = TimingSummary(data)
+        self.schedule_update()
+
     def clear_visual_analysis(self):
+        self.refresh_timer.stop()
+        self.dirty = False
+        self.timing_summary = None
         self.ax.clear()
         self.canvas.draw()
         self.stats_text.clear()
@@ -0,0 +1,28 @@
+# Main/tests/conftest.py
+import os
+import sys
+import shutil
+from pathlib import Path
+
+import pytest
+
+MAIN_DIR = Path(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+FIXTURES_DIR = MAIN_DIR.parent / "Dev" / "tests"
+SOLIDWORKS_DIR = FIXTURES_DIR / "sldtst"
+
+sys.path.insert(0, str(MAIN_DIR))
+
+
+def copy_fixtures(folder, names, source=SOLIDWORKS_DIR):
+    """Örnek dosyaları klasöre kopyalar."""
+    folder.mkdir(parents=True, exist_ok=True)
+    for name in names:
+        shutil.copy2(source / name, folder / name)
+    return folder
+
+
+@pytest.fixture
+def solidworks_folder(tmp_path):
+    """SolidWorks örneklerinden (boş File3 hariç) oluşan geçici klasör."""
+    names = sorted(path.name for path in SOLIDWORKS_DIR.glob("*.SLDPRT") if path.stat().st_size > 0)
+    return copy_fixtures(tmp_path / "sldtst", names)
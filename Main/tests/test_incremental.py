@@ -0,0 +1,53 @@
+# Main/tests/test_incremental.py
+import os
+import shutil
+
+import pytest
+
+from conftest import SOLIDWORKS_DIR
+from src.core.comparator import FileComparator
+from src.core.scanner import FolderScanner
+from src.core.snapshot import pair_key
+
+
+def run_scan(folder, **options):
+    scanner = FolderScanner(FileComparator(), workers=1, **options)
+    results = []
+    for event, data in scanner.scan(str(folder)):
+        if event == 'results':
+            results.extend(data)
+    return {pair_key(result): result['total'] for result in results}
+
+
+def incremental_scan(folder, cache_dir):
+    return run_scan(folder, incremental=True, cache_path=str(cache_dir / "profile_cache.sqlite3"))
+
+
+def full_scan(folder):
+    return run_scan(os.path.abspath(folder), use_cache=False)
+
+
+@pytest.mark.parametrize("change", ["add", "remove", "modify"])
+def test_incremental_scan_matches_full_scan(solidworks_folder, tmp_path, change):
+    cache_dir = tmp_path / "cache"
+    incremental_scan(solidworks_folder, cache_dir)
+
+    if change == "add":
+        shutil.copy2(SOLIDWORKS_DIR / "File1_MajorChange.SLDPRT", solidworks_folder / "Extra.SLDPRT")
+    elif change == "remove":
+        os.remove(solidworks_folder / "File1_SaveAs.SLDPRT")
+    else:
+        shutil.copy2(SOLIDWORKS_DIR / "File2.SLDPRT", solidworks_folder / "File1_MajorChange.SLDPRT")
+
+    incremental = incremental_scan(solidworks_folder, cache_dir)
+    full = full_scan(solidworks_folder)
+    assert incremental.keys() == full.keys()
+    for pair, total in full.items():
+        assert incremental[pair] == pytest.approx(total, abs=1e-9), pair
+
+
+def test_unchanged_rescan_reuses_results(solidworks_folder, tmp_path):
+    cache_dir = tmp_path / "cache"
+    first = incremental_scan(solidworks_folder, cache_dir)
+    second = incremental_scan(solidworks_folder, cache_dir)
+    assert first == second
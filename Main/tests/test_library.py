@@ -0,0 +1,28 @@
+# Main/tests/test_library.py
+import os
+
+from src.core.comparator import FileComparator
+from src.core.library import LibraryIndex
+from src.core.scanner import FolderScanner
+
+
+def test_query_does_not_change_shared_token_weights(solidworks_folder, tmp_path):
+    comparator = FileComparator()
+    scanner = FolderScanner(comparator, cache_path=str(tmp_path / "profile_cache.sqlite3"))
+    index = LibraryIndex(str(solidworks_folder), scanner, str(tmp_path / "library.sqlite3"))
+    try:
+        index.update()
+        # Aynı karşılaştırıcıyı kullanan bir taramanın ağırlıkları
+        profiles = [comparator.build_profile(str(path)) for path in sorted(solidworks_folder.iterdir())[:3]]
+        comparator.set_token_corpus(profiles)
+        weights = comparator.solidworks_comparator.token_weights
+        assert weights is not None and weights.fingerprint
+
+        results = index.query(str(solidworks_folder / "File1.SLDPRT"), k=10)
+    finally:
+        index.close()
+
+    assert comparator.solidworks_comparator.token_weights is weights
+    totals = {os.path.basename(result['file2']): result['total'] for result in results}
+    revisions = ("File1_SaveAs.SLDPRT", "File1_MinorChange.SLDPRT", "File1_MajorChange.SLDPRT")
+    assert all(totals["File2.SLDPRT"] < totals[name] for name in revisions)
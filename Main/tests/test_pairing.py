@@ -0,0 +1,86 @@
+# Main/tests/test_pairing.py
+import itertools
+
+import numpy as np
+import pytest
+
+from conftest import FIXTURES_DIR, copy_fixtures
+from src.core.comparator import FileComparator
+from src.core.pairing import (
+    BOUND_EPSILON, ProfileArrays, general_score_upper_bounds, group_exact_duplicates,
+    iter_group_pairs, prune_pairs,
+)
+from src.core.scanner import FolderScanner
+
+THRESHOLDS = [0, 20, 30, 50, 80]
+
+
+@pytest.fixture(scope="module")
+def scored_fixtures(tmp_path_factory):
+    """Tüm örnek klasörlerinin profilleri ve her çiftin tam karşılaştırma skoru."""
+    folder = tmp_path_factory.mktemp("fixtures")
+    for source in sorted(path for path in FIXTURES_DIR.iterdir() if path.is_dir()):
+        names = sorted(path.name for path in source.iterdir() if path.is_file() and path.stat().st_size > 0)
+        copy_fixtures(folder, names, source)
+
+    comparator = FileComparator()
+    scanner = FolderScanner(comparator, workers=1, use_cache=False)
+    profiles = scanner.build_profiles(sorted(str(path) for path in folder.iterdir()))
+    comparator.set_token_corpus(profiles)
+    scores = {
+        (i, j): comparator.compare_files(profiles[i], profiles[j])['total']
+        for i, j in itertools.combinations(range(len(profiles)), 2)
+    }
+    return comparator, profiles, scores
+
+
+def kept_pairs(rows):
+    return {(i, int(j)) for i, js in rows for j in js}
+
+
+def assert_exact(comparator, profiles, scores, min_similarity, split=None, dirty=None):
+    exact_pairs = list(iter_group_pairs(group_exact_duplicates(profiles), split, dirty))
+    rows, pair_count = prune_pairs(profiles, comparator.supported_extensions['solidworks'],
+                                   min_similarity, exact_pairs, split, dirty)
+    kept = kept_pairs(rows)
+    assert len(kept) == pair_count
+
+    missed = [
+        (profiles[i].path, profiles[j].path, score)
+        for (i, j), score in scores.items()
+        if score >= min_similarity and (i, j) not in kept and (i, j) not in exact_pairs
+        and (split is None or i < split <= j)
+        and (dirty is None or i in dirty or j in dirty)
+    ]
+    assert not missed
+
+
+@pytest.mark.parametrize("min_similarity", THRESHOLDS)
+def test_pruning_keeps_every_pair_above_threshold(scored_fixtures, min_similarity):
+    assert_exact(*scored_fixtures, min_similarity)
+
+
+@pytest.mark.parametrize("min_similarity", THRESHOLDS)
+def test_pruning_is_exact_for_cross_and_dirty_pairs(scored_fixtures, min_similarity):
+    comparator, profiles, scores = scored_fixtures
+    half = len(profiles) // 2
+    assert_exact(comparator, profiles, scores, min_similarity, split=half)
+    assert_exact(comparator, profiles, scores, min_similarity, dirty=set(range(0, len(profiles), 3)))
+
+
+def test_general_bounds_cover_scores(scored_fixtures):
+    comparator, profiles, scores = scored_fixtures
+    arrays = ProfileArrays(profiles, comparator.supported_extensions['solidworks'])
+    for (i, j), score in scores.items():
+        if arrays.is_solidworks[i]:
+            continue
+        bound = general_score_upper_bounds(arrays, i, np.array([j]))[0]
+        assert bound >= score - BOUND_EPSILON, (profiles[i].path, profiles[j].path)
+
+
+def test_fixtures_cover_thresholds(scored_fixtures):
+    """Örnekler her eşiğin iki yanında çift içermelidir; aksi halde test bir şey ölçmez."""
+    _, _, scores = scored_fixtures
+    for min_similarity in THRESHOLDS[1:]:
+        assert any(score >= min_similarity for score in scores.values())
+        assert any(score < min_similarity for score in scores.values())
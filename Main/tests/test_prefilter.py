@@ -0,0 +1,56 @@
+# Main/tests/test_prefilter.py
+import copy
+import itertools
+import os
+
+import pytest
+
+from src.core.comparator import FileComparator, SW_DIFFERENT_SCORE, PREVIEW_DIFFERENT_DISTANCE
+from src.core.preview import HASH_BITS, hamming_distance
+from src.core.scanner import FolderScanner
+
+
+def walsh_hash(index):
+    """Walsh kodu: farklı indekslerin hash'leri tam HASH_BITS / 2 bit ayrıdır."""
+    return sum(1 << bit for bit in range(HASH_BITS) if bin(index & bit).count('1') % 2)
+
+
+@pytest.fixture
+def solidworks_profiles(solidworks_folder):
+    comparator = FileComparator()
+    scanner = FolderScanner(comparator, workers=1, use_cache=False)
+    profiles = scanner.build_profiles(sorted(str(path) for path in solidworks_folder.iterdir()))
+    comparator.set_token_corpus(profiles)
+    return comparator.solidworks_comparator, profiles
+
+
+def with_preview_hash(profile, value):
+    clone = copy.copy(profile)
+    clone.sw_data = dict(profile.sw_data, preview_hash=value)
+    return clone
+
+
+def test_prefiltered_pairs_score_below_different_band(solidworks_profiles):
+    analyzer, profiles = solidworks_profiles
+    # Örneklerin önizlemeleri benzer; ön elemeyi her çiftte çalıştırmak için
+    # önizleme hash'leri birbirinden açıkça farklı yapılır
+    distinct = [with_preview_hash(profile, walsh_hash(index + 1)) for index, profile in enumerate(profiles)]
+    unfiltered = [with_preview_hash(profile, None) for profile in profiles]
+
+    prefiltered = []
+    for i, j in itertools.combinations(range(len(profiles)), 2):
+        assert hamming_distance(distinct[i].sw_data['preview_hash'],
+                                distinct[j].sw_data['preview_hash']) > PREVIEW_DIFFERENT_DISTANCE
+        result = analyzer.compare(distinct[i], distinct[j])
+        if not result.get('prefiltered'):
+            continue
+        full = analyzer.compare(unfiltered[i], unfiltered[j])
+        assert not full.get('prefiltered')
+        assert full['score'] < SW_DIFFERENT_SCORE
+        assert result['score'] >= full['score']
+        assert result['details'] == full['details']
+        prefiltered.append((os.path.basename(profiles[i].path), os.path.basename(profiles[j].path)))
+
+    # File2 farklı bir parçadır; revizyonlarla çiftleri elenmelidir
+    assert prefiltered
+    assert all('File2.SLDPRT' in pair for pair in prefiltered)
@@ -0,0 +1,43 @@
+# Main/tests/test_sections.py
+import mmap
+
+import pytest
+
+from conftest import SOLIDWORKS_DIR
+from src.core import fileio
+from src.core.comparator import SWFileParser, SW_WINDOW_HEAD, SW_WINDOW_TAIL
+
+
+@pytest.fixture
+def small_buffer():
+    previous = fileio.get_max_buffer_size()
+    fileio.set_max_buffer_size(mmap.ALLOCATIONGRANULARITY)
+    yield fileio.get_max_buffer_size()
+    fileio.set_max_buffer_size(previous)
+
+
+def parse(path):
+    data = SWFileParser().parse_features(str(path))
+    chunks = {name: (section['chunk_hashes'], section['chunk_sizes']) for name, section in data['sections'].items()}
+    return data['features'], data['sketches'], chunks, data['raw_data'], data['window_sections']
+
+
+@pytest.mark.parametrize("name", ["File1.SLDPRT", "File1_MajorChange.SLDPRT", "File2.SLDPRT"])
+def test_sections_inflated_in_pieces_match_whole_inflation(name, small_buffer):
+    streamed = parse(SOLIDWORKS_DIR / name)
+    fileio.set_max_buffer_size(1024 * 1024 * 1024)
+    whole = parse(SOLIDWORKS_DIR / name)
+    assert streamed == whole
+
+
+def test_large_sections_keep_only_window_bytes(small_buffer):
+    with fileio.open_mapped(str(SOLIDWORKS_DIR / "File1.SLDPRT")) as f:
+        sections = SWFileParser().parse_sections(f)
+        section = sections['Contents/Config-0-ResolvedFeatures']
+        data, _, _, features, _, tail, length = SWFileParser().load_section(f, section)
+        fileio.set_max_buffer_size(1024 * 1024 * 1024)
+        whole = SWFileParser().load_section(f, section)[0]
+    assert length == section['size'] == len(whole) > small_buffer
+    assert data == whole[:SW_WINDOW_HEAD]
+    assert tail == whole[-SW_WINDOW_TAIL:]
+    assert features